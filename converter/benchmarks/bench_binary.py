@@ -0,0 +1,61 @@
+'''
+Benchmark of the binary format against parsing the OpenFOAM text again.
+
+Uses a generated dictionary with many small entries and a generated vector field.
+
+    python benchmarks/bench_binary.py [entries] [cells]
+'''
+
+import pickle
+import sys
+import time
+
+from pyvnt import OpenFoamParser
+from pyvnt.Converter.Binary.binary import dumps, loads
+
+
+def make_dictionary(entries: int) -> str:
+    lines = []
+    for i in range(entries):
+        lines.append(f"patch{i}\n{{\n    type fixedValue;\n    value uniform (1 0 0);\n"
+                     f"    gradient 0.{i};\n    dimensions [0 1 -1 0 0 0 0];\n}}")
+    return "\n".join(lines) + "\n"
+
+
+def make_field(cells: int) -> str:
+    rows = "\n".join(f"({i * 0.001} {i * 0.002} 0.5)" for i in range(cells))
+    return f"internalField nonuniform List<vector> {cells}\n(\n{rows}\n);\n"
+
+
+def best(fn, repeat: int = 3) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def report(name: str, text: str):
+    parser = OpenFoamParser()
+    tree = parser.parse_file(text=text)
+    data = dumps(tree)
+    pickled = pickle.dumps(tree, protocol=pickle.HIGHEST_PROTOCOL)
+
+    parse_time = best(lambda: parser.parse_file(text=text))
+    load_time = best(lambda: loads(data))
+    unpickle_time = best(lambda: pickle.loads(pickled))
+    dump_time = best(lambda: dumps(tree))
+
+    print(f"{name}: text {len(text) / 1e6:.2f} MB, binary {len(data) / 1e6:.2f} MB, pickle {len(pickled) / 1e6:.2f} MB")
+    print(f"  parse text : {parse_time:.3f} s")
+    print(f"  loads      : {load_time:.3f} s ({parse_time / load_time:.1f}x faster than parsing)")
+    print(f"  unpickle   : {unpickle_time:.3f} s")
+    print(f"  dumps      : {dump_time:.3f} s")
+
+
+if __name__ == '__main__':
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    cells = int(sys.argv[2]) if len(sys.argv) > 2 else 200000
+    report("dictionary", make_dictionary(entries))
+    report("vector field", make_field(cells))
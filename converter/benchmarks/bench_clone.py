@@ -0,0 +1,69 @@
+'''
+Benchmark of producing case variants from one template tree.
+
+Each variant changes three values (deltaT, nu and a solver tolerance) of a
+generated template, made with copy.deepcopy and with clone_tree. Reports the
+time and the memory kept per variant.
+
+    python benchmarks/bench_clone.py [variants] [entries]
+'''
+
+import copy
+import sys
+import time
+import tracemalloc
+
+from pyvnt import OpenFoamParser, Flt_P, clone_tree
+
+
+def make_template(entries: int) -> str:
+    lines = ["controlDict", "{", "    deltaT 0.001;", "    endTime 10;", "}",
+             "transportProperties", "{", "    nu 0.00001;", "}",
+             "fvSolution", "{", "    solvers", "    {", "        p", "        {", "            tolerance 0.000001;", "        }", "    }", "}",
+             "boundary", "{"]
+    for i in range(entries):
+        lines.append(f"    patch{i} {{ type wall; nFaces {i % 100}; startFace {i % 100}; }}")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+EDITS = [(('controlDict', 'deltaT'), 0.002), (('transportProperties', 'nu'), 0.00002),
+         (('fvSolution', 'solvers', 'p', 'tolerance'), 0.00001)]
+
+
+def edit(tree, path, value):
+    node = tree
+    for name in path[:-1]:
+        node = node.get_child(name)
+    key = node.get_key(path[-1])
+    old = list(key.get_keys())[0]
+    key.replace_val(old, Flt_P(old, value))
+
+
+def bench(make_variant, template, variants: int) -> (float, float):
+    tracemalloc.start()
+    start_mem = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    kept = []
+    for i in range(variants):
+        variant = make_variant(template)
+        for path, value in EDITS:
+            edit(variant, path, value * (i + 1))
+        kept.append(variant)
+    elapsed = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0] - start_mem
+    tracemalloc.stop()
+    return elapsed, size / variants
+
+
+if __name__ == '__main__':
+    variants = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    entries = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    template = OpenFoamParser().parse_file(text=make_template(entries))
+    print(f"{variants} variants of a template with {entries} boundary patches")
+
+    deep_time, deep_size = bench(copy.deepcopy, template, variants)
+    cow_time, cow_size = bench(clone_tree, template, variants)
+    print(f"  deepcopy  : {deep_time:.3f} s, {deep_size / 1024:.1f} KiB per variant")
+    print(f"  clone_tree: {cow_time:.3f} s, {cow_size / 1024:.1f} KiB per variant")
+    print(f"  speedup   : {deep_time / cow_time:.0f}x, memory {deep_size / cow_size:.0f}x smaller")
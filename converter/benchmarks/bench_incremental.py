@@ -0,0 +1,48 @@
+'''
+Benchmark of parsing a large field file again after a small edit.
+
+A volVectorField file with a large nonuniform internalField is parsed into a
+SourceTree, and the value of a boundary patch is changed many times. Each edit
+is parsed with SourceTree.edit and, for comparison, the whole text is parsed
+again with parse_file.
+
+    python benchmarks/bench_incremental.py [cells] [edits]
+'''
+
+import os
+import sys
+import tempfile
+import time
+
+from bench_lazy_parse import write_field
+from pyvnt import OpenFoamParser, SourceTree, query_one
+
+
+if __name__ == '__main__':
+    cells = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    edits = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    parser = OpenFoamParser()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'U')
+        write_field(path, cells)
+        with open(path) as f:
+            text = f.read()
+    print(f"{cells} cells, {len(text) / 1e6:.1f} MB")
+
+    start = time.perf_counter()
+    tree = SourceTree(text, parser)
+    print(f"SourceTree         : {time.perf_counter() - start:.3f} s")
+    value = query_one(tree.root, 'boundaryField/inlet/value')
+
+    start = time.perf_counter()
+    parser.parse_file(text=text)
+    full = time.perf_counter() - start
+    print(f"parse_file         : {full:.3f} s per edit")
+
+    start = time.perf_counter()
+    for i in range(edits):
+        begin, end = tree.span(value)
+        tree.edit(begin, end, f"value uniform ({i} 0 0);")
+    incremental = (time.perf_counter() - start) / edits
+    assert query_one(tree.root, 'boundaryField/inlet/value') is value
+    print(f"SourceTree.edit    : {incremental * 1e3:.3f} ms per edit ({full / incremental:.0f}x)")
@@ -0,0 +1,48 @@
+'''
+Benchmark of bulk edits on keys holding many values.
+
+Renames every value of a key (replace_val with a new name) and renders the
+key, with Key_C and with the previous OrderedDict rebuild on every rename.
+
+    python benchmarks/bench_key_edit.py [values]
+'''
+
+import io
+import sys
+import time
+from collections import OrderedDict
+
+from pyvnt import Key_C, Int_P, write_out
+
+
+def rebuild_rename(values: OrderedDict, oldKey: str, newKey: str, new) -> OrderedDict:
+    # previous Key_C.replace_val for a renamed value
+    return OrderedDict([(newKey, new) if k == oldKey else (k, v) for k, v in values.items()])
+
+
+def bench_key(count: int) -> float:
+    key = Key_C('k', *[Int_P(f'v{i}', i % 100) for i in range(count)])
+    start = time.perf_counter()
+    for i in range(count):
+        key.replace_val(f'v{i}', Int_P(f'w{i}', (i + 1) % 100))
+    out = io.StringIO()
+    write_out(key, out)
+    return time.perf_counter() - start
+
+
+def bench_rebuild(count: int) -> float:
+    values = OrderedDict((f'v{i}', Int_P(f'v{i}', i % 100)) for i in range(count))
+    start = time.perf_counter()
+    for i in range(count):
+        values = rebuild_rename(values, f'v{i}', f'w{i}', Int_P(f'w{i}', (i + 1) % 100))
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    counts = [int(sys.argv[1])] if len(sys.argv) > 1 else [1000, 2000, 5000]
+    for count in counts:
+        new_time = bench_key(count)
+        old_time = bench_rebuild(count)
+        print(f"{count} values renamed one by one")
+        print(f"  OrderedDict rebuild : {old_time:.3f} s")
+        print(f"  in place            : {new_time:.3f} s ({old_time / new_time:.0f}x)")
@@ -0,0 +1,51 @@
+'''
+Benchmark of reading one key of a large field file.
+
+A volVectorField file with a large nonuniform internalField is written to a
+temporary folder, and FoamFile.version is read from it after parsing it fully
+and with parse_file(lazy=True).
+
+    python benchmarks/bench_lazy_parse.py [cells]
+'''
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from pyvnt import OpenFoamParser, query_one
+
+
+def write_field(path: str, cells: int):
+    rows = np.random.default_rng(0).random((cells, 3))
+    with open(path, 'w') as f:
+        f.write("FoamFile\n{\n    version 2.0;\n    format ascii;\n    class volVectorField;\n    object U;\n}\n")
+        f.write("dimensions [0 1 -1 0 0 0 0];\n")
+        f.write(f"internalField nonuniform List<vector>\n{cells}\n(\n")
+        np.savetxt(f, rows, fmt='(%.6f %.6f %.6f)')
+        f.write(");\n")
+        f.write("boundaryField\n{\n    inlet { type fixedValue; value uniform (1 0 0); }\n"
+                "    outlet { type zeroGradient; }\n}\n")
+
+
+def read_version(parser, path: str, lazy: bool):
+    start = time.perf_counter()
+    tree = parser.parse_file(path=path, lazy=lazy)
+    version = query_one(tree, 'FoamFile/version/value').give_val()
+    return version, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    cells = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    parser = OpenFoamParser()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'U')
+        write_field(path, cells)
+        print(f"{cells} cells, {os.path.getsize(path) / 1e6:.1f} MB")
+
+        version, eager = read_version(parser, path, False)
+        print(f"parse_file             : {eager:.3f} s (version {version})")
+        version, lazy = read_version(parser, path, True)
+        print(f"parse_file(lazy=True)  : {lazy:.3f} s (version {version}, {eager / lazy:.0f}x)")
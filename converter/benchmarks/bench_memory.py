@@ -0,0 +1,45 @@
+'''
+Memory benchmark of pyvnt trees, in bytes per entry.
+
+Measures with tracemalloc the memory taken by single-value keys, empty nodes
+and a parsed dictionary of sub-dictionaries holding a few keys each.
+
+    python benchmarks/bench_memory.py [entries]
+'''
+
+import sys
+import tracemalloc
+
+from pyvnt import OpenFoamParser, Node_C, Key_C, Int_P
+
+
+def measure(build) -> (object, int):
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    obj = build()
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    return obj, size
+
+
+def make_text(entries: int) -> str:
+    lines = []
+    for i in range(entries // 4):
+        lines.append(f"patch{i}\n{{\n    type wall;\n    nFaces {i % 100};\n    startFace {i % 100};\n}}")
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == '__main__':
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    values = [Int_P('v', i % 100) for i in range(entries)]
+
+    _, size = measure(lambda: [Key_C(f'k{i}', values[i]) for i in range(entries)])
+    print(f"Key_C with one value : {size / entries:.0f} bytes per key (value objects excluded)")
+
+    _, size = measure(lambda: [Node_C(f'n{i}') for i in range(entries)])
+    print(f"empty Node_C         : {size / entries:.0f} bytes per node")
+
+    text = make_text(entries)
+    parser = OpenFoamParser()
+    _, size = measure(lambda: parser.parse_file(text=text))
+    print(f"parsed dictionary    : {size / entries:.0f} bytes per entry ({entries // 4} nodes, {3 * entries // 4} keys)")
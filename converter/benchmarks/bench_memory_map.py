@@ -0,0 +1,45 @@
+'''
+Benchmark of parsing a large field file from a memory map.
+
+A volVectorField file with a large nonuniform internalField is parsed with
+parse_file, fully and lazily, reading the file into a string or with
+memory_map=True. The time and the peak of the memory allocated by Python
+(tracemalloc, which does not count the pages of the map) are printed, along
+with the memory still held by the lazy trees.
+
+    python benchmarks/bench_memory_map.py [cells]
+'''
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from bench_lazy_parse import write_field
+from pyvnt import OpenFoamParser, query_one
+
+
+def measure(parse):
+    tracemalloc.start()
+    start = time.perf_counter()
+    tree = parse()
+    query_one(tree, 'FoamFile/version/value').give_val()
+    elapsed = time.perf_counter() - start
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, held, peak
+
+
+if __name__ == '__main__':
+    cells = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    parser = OpenFoamParser()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'U')
+        write_field(path, cells)
+        print(f"{cells} cells, {os.path.getsize(path) / 1e6:.1f} MB")
+        for lazy in (False, True):
+            for memory_map in (False, True):
+                elapsed, held, peak = measure(lambda: parser.parse_file(path=path, lazy=lazy, memory_map=memory_map))
+                print(f"lazy={lazy!s:5} memory_map={memory_map!s:5} : {elapsed:.3f} s, "
+                      f"peak {peak / 1e6:.1f} MB, held {held / 1e6:.1f} MB")
@@ -0,0 +1,49 @@
+'''
+Benchmark of parse_case on a generated decomposed case (processor*/0/U fields).
+
+Parses the same case serially and with a process pool of increasing size.
+
+    python benchmarks/bench_parse_case.py [processors] [cells]
+'''
+
+import os
+import sys
+import tempfile
+import time
+
+from pyvnt import OpenFoamParser
+
+
+def make_case(root: str, processors: int, cells: int):
+    rows = "\n".join(f"({i * 0.001} {-i * 0.002} 0.5)" for i in range(cells))
+    field = f"dimensions [0 1 -1 0 0 0 0];\ninternalField nonuniform List<vector> {cells}\n(\n{rows}\n);\n"
+    for p in range(processors):
+        os.makedirs(os.path.join(root, f"processor{p}", "0"))
+        with open(os.path.join(root, f"processor{p}", "0", "U"), "w") as f:
+            f.write(field)
+    os.makedirs(os.path.join(root, "system"))
+    with open(os.path.join(root, "system", "controlDict"), "w") as f:
+        f.write("application simpleFoam;\nendTime 100;\n")
+
+
+def bench(parser, case: str, workers: int) -> float:
+    start = time.perf_counter()
+    parser.parse_case(case, workers=workers)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    processors = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    cells = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+    parser = OpenFoamParser()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        make_case(tmp, processors, cells)
+        serial = bench(parser, tmp, None)
+        print(f"{processors} processors x {cells} cells, {os.cpu_count()} cores")
+        print(f"serial     : {serial:.2f} s")
+        workers = 2
+        while workers <= max(os.cpu_count(), 2):
+            elapsed = bench(parser, tmp, workers)
+            print(f"{workers:2d} workers : {elapsed:.2f} s ({serial / elapsed:.2f}x)")
+            workers *= 2
@@ -0,0 +1,47 @@
+'''
+Benchmark of writing one changed key of a large field file.
+
+A volVectorField file with a large nonuniform internalField is read into a
+SourceTree, the value of a boundary patch is changed, and the file is written
+again with writeTo and with patch_file, which writes only the changed key.
+
+    python benchmarks/bench_patch.py [cells]
+'''
+
+import os
+import sys
+import tempfile
+import time
+
+from bench_lazy_parse import write_field
+from pyvnt import SourceTree, Flt_P, Vector_P, patch_file, query_one, writeTo
+
+
+def set_inlet(tree, x: float):
+    key = query_one(tree.root, 'boundaryField/inlet/value')
+    name, value = next(iter(key.get_items()))
+    key.replace_val(name, Vector_P(name, Flt_P('x', x), Flt_P('y', 0), Flt_P('z', 0)))
+
+
+if __name__ == '__main__':
+    cells = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'U')
+        write_field(path, cells)
+        print(f"{cells} cells, {os.path.getsize(path) / 1e6:.1f} MB")
+
+        start = time.perf_counter()
+        tree = SourceTree(path=path)
+        print(f"SourceTree  : {time.perf_counter() - start:.3f} s")
+
+        set_inlet(tree, 2)
+        tree.root.name = 'U_full'
+        start = time.perf_counter()
+        writeTo(tree.root, tmp)
+        full = time.perf_counter() - start
+        print(f"writeTo     : {full:.3f} s, {os.path.getsize(os.path.join(tmp, 'U_full.txt')) / 1e6:.1f} MB written")
+
+        start = time.perf_counter()
+        written = patch_file(tree)
+        patched = time.perf_counter() - start
+        print(f"patch_file  : {patched * 1e3:.3f} ms, {written} bytes written ({full / patched:.0f}x)")
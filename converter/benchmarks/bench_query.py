@@ -0,0 +1,61 @@
+'''
+Benchmark of repeated path lookups in a large tree.
+
+A generated tree of nested dictionaries is searched for the same paths many
+times with OpenFoamParser.get_value, query and a PathIndex, for a plain path
+and a wildcard path.
+
+    python benchmarks/bench_query.py [dicts] [keys] [lookups]
+'''
+
+import sys
+import time
+
+from pyvnt import OpenFoamParser, PathIndex, query
+
+
+def make_text(dicts: int, keys: int) -> str:
+    lines = ["boundaryField", "{"]
+    for d in range(dicts):
+        lines.append(f"    patch{d}")
+        lines.append("    {")
+        lines.append("        type fixedValue;")
+        for k in range(keys):
+            lines.append(f"        coeff{k} {k};")
+        lines.append("    }")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def bench(lookup, paths, lookups: int) -> float:
+    start = time.perf_counter()
+    for i in range(lookups):
+        lookup(paths[i % len(paths)])
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    dicts = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    keys = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    lookups = int(sys.argv[3]) if len(sys.argv) > 3 else 20000
+    parser = OpenFoamParser()
+    tree = parser.parse_file(text=make_text(dicts, keys))
+    paths = [f"boundaryField/patch{(i * 7) % dicts}/coeff{(i * 13) % keys}" for i in range(100)]
+    print(f"{dicts} dictionaries x {keys} keys, {lookups} lookups")
+
+    start = time.perf_counter()
+    index = PathIndex(tree)
+    print(f"index build       : {time.perf_counter() - start:.3f} s, {len(index)} items")
+
+    get_value = bench(lambda path: parser.get_value(tree, *path.split('/')), paths, lookups)
+    walk = bench(lambda path: query(tree, path), paths, lookups)
+    indexed = bench(index.query, paths, lookups)
+    print(f"get_value         : {get_value:.3f} s")
+    print(f"query             : {walk:.3f} s")
+    print(f"PathIndex.query   : {indexed:.3f} s ({walk / indexed:.1f}x)")
+
+    wildcard = ["boundaryField/*/type", "**/coeff7"]
+    walk = bench(lambda path: query(tree, path), wildcard, 20)
+    indexed = bench(index.query, wildcard, 20)
+    print(f"wildcard query    : {walk:.3f} s for 20")
+    print(f"wildcard indexed  : {indexed:.3f} s for 20 ({walk / indexed:.0f}x)")
@@ -0,0 +1,71 @@
+'''
+Benchmark of the Converter.Reader backends on the same corpus of dictionaries.
+
+Reads every file of the corpus with each available backend (the C++ iterator
+needs the compiled OpenFOAM-linked libraries) and checks that both write out
+the same trees. Without a corpus directory, a generated one is used.
+
+    python benchmarks/bench_reader_backends.py [corpus_dir]
+'''
+
+import io
+import os
+import sys
+import tempfile
+import time
+
+from pyvnt import write_out
+from pyvnt.Converter.Reader import read, backends
+
+
+def make_corpus(root: str, files: int = 50, entries: int = 200):
+    for i in range(files):
+        lines = ["FoamFile", "{", "    version 2.0;", "    format ascii;", "}"]
+        for j in range(entries):
+            lines.append(f"key{j} {j};")
+            lines.append(f"sub{j} {{ a {j * 0.5}; b word{j}; c (1 2 3); }}")
+        with open(os.path.join(root, f"dict{i}"), "w") as f:
+            f.write("\n".join(lines) + "\n")
+
+
+def render(tree) -> str:
+    out = io.StringIO()
+    write_out(tree, out)
+    return out.getvalue()
+
+
+def bench(paths: list, backend: str, repeat: int = 3) -> (float, list):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        trees = [read(path, backend=backend) for path in paths]
+        best = min(best, time.perf_counter() - start)
+    return best, trees
+
+
+def report(corpus: str):
+    paths = sorted(os.path.join(corpus, f) for f in os.listdir(corpus))
+    size = sum(os.path.getsize(p) for p in paths) / 1e6
+    print(f"corpus: {len(paths)} files, {size:.2f} MB")
+
+    results = {}
+    for backend in backends.BACKENDS:
+        if backend == backends.CPP and not backends.isCppBackendAvailable():
+            print(f"  {backend}: skipped, compiled libraries not available")
+            continue
+        elapsed, trees = bench(paths, backend)
+        results[backend] = [render(tree) for tree in trees]
+        print(f"  {backend}: {elapsed:.3f} s ({size / elapsed:.2f} MB/s)")
+
+    if len(results) == len(backends.BACKENDS):
+        same = sum(a == b for a, b in zip(*results.values()))
+        print(f"  identical output: {same}/{len(paths)} files")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        report(sys.argv[1])
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            make_corpus(tmp)
+            report(tmp)
@@ -0,0 +1,69 @@
+'''
+Benchmark of writing the cases of a parameter sweep.
+
+A generated case (controlDict, transportProperties and a 0/U field with a
+boundary of many patches) is swept over endTime and nu. The cases are written
+by a loop making each variant and writing it with write_case, and with
+sweep_case serially and with a process pool of increasing size.
+
+    python benchmarks/bench_sweep.py [cases] [patches]
+'''
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from pyvnt import OpenFoamParser, grid_points, make_variant, sweep_case, write_case
+
+
+def make_case(root: str, patches: int):
+    files = {
+        os.path.join("system", "controlDict"): "application simpleFoam;\nendTime 100;\ndeltaT 0.001;\n",
+        os.path.join("constant", "transportProperties"): "nu [0 2 -1 0 0 0 0] 1e-05;\n",
+        os.path.join("0", "U"): "dimensions [0 1 -1 0 0 0 0];\ninternalField uniform (0 0 0);\nboundaryField\n{\n"
+            + "".join(f"    patch{i}\n    {{\n        type fixedValue;\n        value uniform (1 0 0);\n    }}\n"
+                      for i in range(patches)) + "}\n",
+    }
+    for rel, text in files.items():
+        os.makedirs(os.path.join(root, os.path.dirname(rel)), exist_ok=True)
+        with open(os.path.join(root, rel), "w") as f:
+            f.write(text)
+
+
+def write_loop(base, grid, out: str):
+    for index, params in enumerate(grid_points(grid)):
+        write_case(make_variant(base, params, name=f"case_{index}"), out)
+
+
+def bench(run, out: str) -> float:
+    start = time.perf_counter()
+    run(out)
+    elapsed = time.perf_counter() - start
+    shutil.rmtree(out)
+    return elapsed
+
+
+if __name__ == '__main__':
+    cases = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    patches = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    grid = {"system/controlDict/endTime": list(range(100, 100 + cases // 20 * 10, 10)) or [100],
+            "constant/transportProperties/nu": [1e-5 * (i + 1) for i in range(20)]}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        make_case(os.path.join(tmp, "case"), patches)
+        base = OpenFoamParser().parse_case(os.path.join(tmp, "case"))
+        out = os.path.join(tmp, "out")
+        total = len(grid["system/controlDict/endTime"]) * len(grid["constant/transportProperties/nu"])
+        print(f"{total} cases of a case with {patches} patches, {os.cpu_count()} cores")
+
+        loop = bench(lambda path: write_loop(base, grid, path), out)
+        print(f"write_case loop : {loop:.2f} s")
+        serial = bench(lambda path: sweep_case(base, grid, path), out)
+        print(f"sweep_case      : {serial:.2f} s ({loop / serial:.2f}x)")
+        workers = 2
+        while workers <= max(os.cpu_count(), 2):
+            elapsed = bench(lambda path: sweep_case(base, grid, path, workers=workers), out)
+            print(f"{workers:2d} workers      : {elapsed:.2f} s ({loop / elapsed:.2f}x)")
+            workers *= 2
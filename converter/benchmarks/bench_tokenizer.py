@@ -0,0 +1,132 @@
+'''
+Benchmark of the compound word scanning in t_WORD (e.g. div(phi,U), grad(U)).
+
+Tokenizes generated fvSchemes and fvSolution style inputs (many short words)
+and a functions style input (long expressions) with the current lexer and with
+the previous character by character scanner.
+
+Both lexers are built the same way with the rules in the same order, so they
+differ only in t_WORD. The scanner only runs on the parentheses of compound
+words: the fvSchemes input is read about 1.4x faster, the fvSolution input,
+which has few compound words, 1.0x to 1.2x, and long expressions about 3x.
+
+    python benchmarks/bench_tokenizer.py [entries]
+'''
+
+import sys
+import time
+
+import ply.lex as lex
+
+from pyvnt.Converter.PlyParser.Parser import _OpenFoamParserInternalText
+
+
+class _CharByCharWord(_OpenFoamParserInternalText):
+    '''
+    Lexer using the previous t_WORD implementation, kept here for comparison only.
+    '''
+
+    def __init__(self):
+        self.lexer = lex.lex(module=self)
+
+    def t_WORD(self, t):
+        r'"[^"]*"|[a-zA-Z_][a-zA-Z0-9_]*(?:<[a-zA-Z0-9_]+>)?'
+
+        if t.value.startswith('"') and t.value.endswith('"'):
+            t.value = t.value[1:-1].strip()
+            return t
+
+        word_part = t.value
+        current_pos_after_word = t.lexer.lexpos
+        input_stream = t.lexer.lexdata
+
+        if current_pos_after_word < len(input_stream) and input_stream[current_pos_after_word] == '(':
+            paren_balance = 1
+            manual_pos = current_pos_after_word + 1
+            consumed_string = word_part + '('
+            while manual_pos < len(input_stream) and paren_balance > 0:
+                char = input_stream[manual_pos]
+                consumed_string += char
+                if char == '(':
+                    paren_balance += 1
+                elif char == ')':
+                    paren_balance -= 1
+                allowed_inside = ",()_+-*/<>|:&%. "
+                if not (char.isalnum() or char in allowed_inside):
+                    t.value = word_part
+                    t.lexer.lexpos = current_pos_after_word
+                    return t
+                manual_pos += 1
+            t.value = consumed_string
+            t.lexer.lexpos = manual_pos
+            return t
+
+        return t
+
+    # lex tries the rules in the order of their line numbers, t_WORD keeps its place among the rules of Parser.py
+    t_WORD.__code__ = t_WORD.__code__.replace(
+        co_firstlineno=_OpenFoamParserInternalText.t_WORD.__code__.co_firstlineno)
+
+
+def make_schemes(entries: int) -> str:
+    lines = ["divSchemes", "{", "    default         none;"]
+    for i in range(entries):
+        lines.append(f"    div(phi{i},U)       Gauss linearUpwind grad(U{i});")
+        lines.append(f"    div((nuEff{i}*dev2(T(grad(U)))),interpolate(rho|mag(U)))  Gauss linear;")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def make_solution(entries: int) -> str:
+    lines = ["solvers", "{"]
+    for i in range(entries):
+        lines.append(f'    "(U|k|epsilon){i}" {{ solver smoothSolver; smoother symGaussSeidel; tolerance 1e-05; }}')
+        lines.append(f"    p{i} {{ solver GAMG; tolerance 1e-06; relTol 0.1; }}")
+    lines.append("}")
+    lines.append("relaxationFactors { equations { U 0.7; div(phi,U) 0.5; grad(p) 0.3; } }")
+    return "\n".join(lines) + "\n"
+
+
+def make_expressions(entries: int, terms: int = 200) -> str:
+    expr = "+".join(f"mag(U{i})*max(k{i},small)" for i in range(terms))
+    lines = ["functions", "{"]
+    for i in range(entries):
+        lines.append(f"    f{i} expr({expr});")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def tokenize(lexer, text: str) -> int:
+    lexer.input(text)
+    count = 0
+    while lexer.token():
+        count += 1
+    return count
+
+
+def bench(lexer, text: str, repeat: int = 5) -> (float, int):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = tokenize(lexer, text)
+        best = min(best, time.perf_counter() - start)
+    return best, count
+
+
+def report(name: str, text: str):
+    old_time, old_tokens = bench(_CharByCharWord().lexer, text)
+    new_time, new_tokens = bench(lex.lex(module=object.__new__(_OpenFoamParserInternalText)), text)
+    assert old_tokens == new_tokens
+
+    size = len(text) / 1e6
+    print(f"{name}: {size:.2f} MB, {new_tokens} tokens")
+    print(f"  char by char : {old_time:.3f} s ({size / old_time:.2f} MB/s)")
+    print(f"  regex scanner: {new_time:.3f} s ({size / new_time:.2f} MB/s)")
+    print(f"  speedup      : {old_time / new_time:.2f}x")
+
+
+if __name__ == '__main__':
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    report("fvSchemes", make_schemes(entries))
+    report("fvSolution", make_solution(entries))
+    report("long expressions", make_expressions(entries // 50))
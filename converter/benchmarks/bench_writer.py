@@ -0,0 +1,49 @@
+'''
+Benchmark of the text writer (writeTo/write_out) on generated dictionaries.
+
+    python benchmarks/bench_writer.py [entries]
+'''
+
+import io
+import sys
+import time
+
+from pyvnt import OpenFoamParser, write_out
+
+
+def make_mesh_dictionary(entries: int) -> str:
+    lines = ["vertices", "("]
+    # hex vertex labels and vector components are kept small, the parser gives them a 0..100 range
+    lines += [f"    ({i % 100} {(i % 200) * 0.5} 0.1)" for i in range(entries)]
+    lines += [");", "blocks", "("]
+    lines += [f"    hex ({' '.join(str((i + j) % 90) for j in range(8))}) (10 10 1) simpleGrading (1 1 1)"
+              for i in range(entries // 4)]
+    lines += [");", "boundary", "{"]
+    for i in range(entries // 4):
+        lines += [f"    patch{i}", "    {", "        type wall;", f"        nFaces {i};", f"        startFace {i * 10};",
+                  "        physicalType wall;", "    }"]
+    lines += ["}"]
+    return "\n".join(lines) + "\n"
+
+
+def render(tree) -> str:
+    out = io.StringIO()
+    for item in tree.get_ordered_items():
+        write_out(item, out)
+        out.write("\n")
+    return out.getvalue()
+
+
+if __name__ == '__main__':
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 40000
+    tree = OpenFoamParser().parse_file(text=make_mesh_dictionary(entries))
+
+    best = float('inf')
+    for _ in range(7):
+        start = time.perf_counter()
+        text = render(tree)
+        best = min(best, time.perf_counter() - start)
+
+    size = len(text) / 1e6
+    print(f"output: {size:.2f} MB")
+    print(f"write_out: {best:.3f} s ({size / best:.2f} MB/s)")
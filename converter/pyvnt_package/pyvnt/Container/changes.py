@@ -0,0 +1,25 @@
+'''
+Objects told about the changes to the items of nodes, e.g. PathIndex.
+
+A watcher is kept through a weak reference and has a _node_changed(node) method, called with a node or
+List_CP of nodes whose keys or children were added, removed, renamed, reordered or loaded, or with a Key_C
+whose values were changed. Callers check that there are watchers before calling changed, so changes cost
+nothing when nothing is watching.
+'''
+
+import weakref
+
+
+# weak references to the watchers, removed when a watcher is collected
+watchers = []
+
+
+def add_watcher(watcher):
+    watchers.append(weakref.ref(watcher, watchers.remove))
+
+
+def changed(node):
+    for ref in tuple(watchers):
+        watcher = ref()
+        if watcher is not None:
+            watcher._node_changed(node)
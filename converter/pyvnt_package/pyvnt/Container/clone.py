@@ -0,0 +1,62 @@
+import functools
+from pyvnt.Container.node import Node_C
+from pyvnt.Container.lazy_node import Lazy_Node_C
+from pyvnt.Container.key import Key_C, Lazy_Key_C, OrderedValues
+from pyvnt.Container.list import List_CP
+
+
+def clone_tree(node: Node_C, parent: Node_C = None) -> Lazy_Node_C:
+    '''
+    Function to make a copy-on-write clone of the tree under a node
+
+    The clone is built one level at a time, the first time a level is read or edited. Until then
+    the level and everything below it is shared with the original tree. When a level is built,
+    its keys are copied (the Key_C objects, not their values) and its children become clones
+    themselves, so the path down to an edited key is the only part of the tree that is copied.
+
+    Value_P objects are shared between the original and all its clones: edit a clone by replacing
+    values (e.g. Key_C.replace_val) rather than changing a shared value object in place. The
+    original tree should not be edited while its clones are in use, as levels of a clone that
+    were not built yet are read from it.
+
+    Parameters:
+        node: Root of the tree to clone
+        parent: Node to attach the clone to (Optional)
+    '''
+    return Lazy_Node_C(node.name, functools.partial(_clone_level, node), parent)
+
+
+def _clone_level(source: Node_C) -> Node_C:
+    '''
+    Builds one level of a clone: copied keys and cloned children, in the written order
+    '''
+    level = Node_C(source.name)
+    for item in source.get_ordered_items():
+        if isinstance(item, Key_C):
+            level.add_data(_copy_key(item))
+        elif isinstance(item, Node_C):
+            level.add_child(clone_tree(item))
+        elif isinstance(item, List_CP):
+            clones = [clone_tree(child) for child in item.children]
+            level.add_child(List_CP(item.name, values = clones, isNode = True))
+    return level
+
+
+def _copy_key(key: Key_C) -> Key_C:
+    '''
+    Copies a key, sharing its values
+    '''
+    if isinstance(key, Lazy_Key_C) and not key.is_loaded():
+        # the values are parsed once, when either the key or its copy is read
+        return Lazy_Key_C(key.name, functools.partial(_copy_loaded_key, key))
+    copy = Key_C.__new__(Key_C)
+    if key._privateDict is None:
+        copy.__setstate__((key.name, None, key._singleKey, key._singleVal))
+    else:
+        copy.__setstate__((key.name, OrderedValues(key.get_items()), None, None))
+    return copy
+
+
+def _copy_loaded_key(key: Lazy_Key_C) -> Key_C:
+    key.load()
+    return _copy_key(key)
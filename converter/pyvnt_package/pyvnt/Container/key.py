@@ -1,8 +1,8 @@
 from abc import ABC, abstractmethod
-from collections import OrderedDict
 from anytree import NodeMixin
 from pyvnt.Reference.basic import *
 from pyvnt.utils.make_indent import make_indent
+from pyvnt.Container.changes import watchers, changed
 
 
 '''
@@ -12,14 +12,102 @@ Criteria for classes:
 3. the attributed should not be accesible through . operator -- done by name mangling(__var)
 '''
 
+# marks the position of a deleted value in OrderedValues
+_HOLE = object()
+
+
+class OrderedValues:
+    '''
+    Values of a Key_C in their order, indexed by name
+
+    Names and values are kept in two lists with a name -> position index, so a value can be renamed in
+    place without moving the others. Deleted positions are left as holes and compacted once they make
+    up half of the lists, and the last name is read from the end of the list (trailing holes are
+    dropped as soon as they appear).
+
+    Contructor Parameters:
+        items: (name, value) pairs to start with, in order (Optional)
+    '''
+
+    __slots__ = ('_names', '_values', '_index')
+
+    def __init__(self, items = ()):
+        self._names = []
+        self._values = []
+        self._index = {}
+        for name, val in items:
+            self[name] = val
+
+    def __getitem__(self, name):
+        return self._values[self._index[name]]
+
+    def __setitem__(self, name, val):
+        pos = self._index.get(name)
+        if pos is None:
+            self._index[name] = len(self._names)
+            self._names.append(name)
+            self._values.append(val)
+        else:
+            self._values[pos] = val
+
+    def __delitem__(self, name):
+        pos = self._index.pop(name)
+        names, values = self._names, self._values
+        names[pos] = _HOLE
+        values[pos] = None
+        while names and names[-1] is _HOLE:
+            names.pop()
+            values.pop()
+        if 2 * len(self._index) < len(names):
+            items = self.items()
+            self.__init__(items)
+
+    def rename(self, oldName, newName, val):
+        '''
+        Function to replace a value by another one with a new name, keeping its position
+        '''
+        pos = self._index.pop(oldName)
+        self._index[newName] = pos
+        self._names[pos] = newName
+        self._values[pos] = val
+
+    def last_key(self):
+        '''
+        Function to get the name of the last value, None if there are no values
+        '''
+        return self._names[-1] if self._names else None
+
+    def keys(self) -> list:
+        if len(self._index) == len(self._names):
+            return list(self._names)
+        return [name for name in self._names if name is not _HOLE]
+
+    def items(self) -> list:
+        pairs = zip(self._names, self._values)
+        if len(self._index) == len(self._names):
+            return list(pairs)
+        return [(name, val) for name, val in pairs if name is not _HOLE]
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+
 class Key_Parent(ABC):
     '''
     Abstract class to make sure that attributes cannot be inserted into the child class directly
     Do not make objects of this class
     '''
 
+    __slots__ = ('name',)
+
     def __init__(self, name: str = "Parent"):
-        self.__dict__['name'] = name
+        object.__setattr__(self, 'name', name)
 
     @abstractmethod
     def instance_restricted(self):
@@ -29,6 +117,15 @@ class Key_Parent(ABC):
 # Currently the attributes can be edited from outside the class, which should not be possible
 # TODO: Modify such that constructor takes in no attribute by default. After making the constructor, use a method to insert attributes -- done
 class Key_C(Key_Parent):
+    '''
+    A keyword with its values, stored in the order they were added
+
+    Keys are slotted, and a key holding a single value (the most common case) keeps it in two slots
+    instead of a dictionary. The values move to an OrderedValues table once a second value is added.
+    '''
+
+    # _privateDict (an OrderedValues) is None while the key holds exactly one value, stored in _singleKey and _singleVal
+    __slots__ = ('_privateDict', '_singleKey', '_singleVal')
 
     def instance_restricted(self):
         pass
@@ -41,21 +138,67 @@ class Key_C(Key_Parent):
     def __init__(self, name: str = None, *args: Value_P):
         super(Key_C, self).__init__(name)
 
-        tmp = {}
-        for e in args:
-            tmp[e._Value_P__name] = e
-        
-        self._privateDict = OrderedDict(tmp)
+        if len(args) == 1:
+            self._set_single(args[0]._Value_P__name, args[0])
+        else:
+            self._set_values(OrderedValues((e._Value_P__name, e) for e in args))
 
+    def _set_single(self, key, val):
+        object.__setattr__(self, '_privateDict', None)
+        object.__setattr__(self, '_singleKey', key)
+        object.__setattr__(self, '_singleVal', val)
+
+    def _set_values(self, values):
+        if not isinstance(values, OrderedValues):
+            values = OrderedValues(values.items())
+        object.__setattr__(self, '_privateDict', values)
+        object.__setattr__(self, '_singleKey', None)
+        object.__setattr__(self, '_singleVal', None)
+
+    def _values(self) -> OrderedValues:
+        '''
+        Returns the table of values, moving a single value into one first
+        '''
+        privateDict = self._privateDict
+        if privateDict is None:
+            privateDict = OrderedValues(((self._singleKey, self._singleVal),))
+            self._set_values(privateDict)
+        return privateDict
+
+    def _last_key(self):
+        '''
+        Returns the name of the last value without listing the names
+        '''
+        if self._privateDict is None:
+            return self._singleKey
+        return self._privateDict.last_key()
+
+    def __getstate__(self):
+        return (self.name, self._privateDict, self._singleKey, self._singleVal)
+
+    def __setstate__(self, state):
+        name, privateDict, singleKey, singleVal = state
+        setattr = object.__setattr__
+        setattr(self, 'name', name)
+        setattr(self, '_privateDict', privateDict)
+        setattr(self, '_singleKey', singleKey)
+        setattr(self, '_singleVal', singleVal)
 
     def __getattr__(self, key):
         """
         Prevents access to attributes which are not in _privateDict
         """
-        if key in self._privateDict.keys():
-            return self._privateDict[key]
-        else:
-            raise AttributeError(key) 
+        # slots are read with object.__getattribute__ so a key whose slots are not set yet does not recurse
+        try:
+            privateDict = object.__getattribute__(self, '_privateDict')
+            if privateDict is None:
+                if key == object.__getattribute__(self, '_singleKey'):
+                    return object.__getattribute__(self, '_singleVal')
+            elif key in privateDict:
+                return privateDict[key]
+        except AttributeError:
+            pass
+        raise AttributeError(key) 
 
     def __setattr__(self, key, value):
         """
@@ -65,12 +208,22 @@ class Key_C(Key_Parent):
         """
         
         if( key == '_privateDict'):
-            super().__setattr__(key,value)
+            self._set_values(value)
+            if watchers:
+                changed(self)
         else :
             raise AttributeError(key)
 
     def append_val(self, key: "str", val: Value_P):
-        self._privateDict[key] = val
+        privateDict = self._privateDict
+        if privateDict is None and key == self._singleKey:
+            object.__setattr__(self, '_singleVal', val)
+        elif privateDict is not None and not privateDict:
+            self._set_single(key, val)
+        else:
+            self._values()[key] = val
+        if watchers:
+            changed(self)
 
     '''
     # TODO: Take input of the object to be replaced or the obejct name instead of the variable name as the string. -- done in replace_val2
@@ -129,14 +282,20 @@ class Key_C(Key_Parent):
         
         newKey = new._Value_P__name
 
-        if oldKey == newKey:
+        if self._privateDict is None and oldKey == self._singleKey:
+            self._set_single(newKey, new)
+        elif oldKey == newKey:
             # self.__dict__[newKey] = new
-            self._privateDict[newKey] = new
+            self._values()[newKey] = new
         else:
-            if newKey != oldKey and newKey in self._privateDict.keys():
+            values = self._values()
+            if newKey != oldKey and newKey in values:
                 raise KeyRepeatError(newKey)
-            else:
-                self._privateDict = OrderedDict([(newKey, new) if k == oldKey else (k, v) for k, v in self._privateDict.items()])
+            elif oldKey in values:
+                # renamed in place, the other values do not move
+                values.rename(oldKey, newKey, new)
+        if watchers:
+            changed(self)
 
     def delete_val(self, key: str):
         '''
@@ -145,12 +304,14 @@ class Key_C(Key_Parent):
         Parameters: 
             key: name of the key to be deleted
         '''
-        del self._privateDict[key]
+        del self._values()[key]
+        if watchers:
+            changed(self)
 
     def __repr__(self):
-        last_elem = list(self._privateDict.keys())[-1]
+        last_elem = self._last_key()
         res_str = f"Key_C("
-        for key, val in self._privateDict.items():
+        for key, val in self.get_items():
             res_str = res_str + f"{key} : {val}"
             if key != last_elem:
                 res_str = res_str + ", "
@@ -162,10 +323,10 @@ class Key_C(Key_Parent):
         '''
         Function to get all the keys and values stored in the object in a text format
         '''
-        last_elem = list(self._privateDict.keys())[-1]
+        last_elem = self._last_key()
 
         res = f"{self.name} : "
-        for key, val in self._privateDict.items():
+        for key, val in self.get_items():
             if key == 'name':
                 continue
             else:
@@ -179,12 +340,16 @@ class Key_C(Key_Parent):
         '''
         Function to get all the items stored in the object
         '''
+        if self._privateDict is None:
+            return ((self._singleKey, self._singleVal),)
         return self._privateDict.items()
     
     def get_keys(self):
         '''
         Function to get all the keys stored in the object
         '''
+        if self._privateDict is None:
+            return (self._singleKey,)
         return self._privateDict.keys()
     
     def write_out(self, file, indent = 0):
@@ -192,26 +357,100 @@ class Key_C(Key_Parent):
         Function to write the object to a file
         '''
         col_width = 16
-        last_elem = list(self._privateDict.keys())[-1]
+        last_elem = self._last_key()
 
         make_indent(file, indent)
 
-        if len(self._privateDict.values()) == 1 :
+        if self._privateDict is None or len(self._privateDict) == 1 :
             try:
                 file.write(f"{self.name}\n")
-                for key, val in self._privateDict.items():
+                for key, val in self.get_items():
                     val.write_out(file, indent, True)
             except e:
                 file.write(f"{self.name.ljust(col_width)}")
-                for key, val in self._privateDict.items():
+                for key, val in self.get_items():
                     val.write_out(file)
                     if key != last_elem:
                         file.write(" ")
         else:
             file.write(f"{self.name.ljust(col_width)}")
-            for key, val in self._privateDict.items():
+            for key, val in self.get_items():
                 val.write_out(file)
                 if key != last_elem:
                     file.write(" ")
 
-        file.write(";\n")
\ No newline at end of file
+        file.write(";\n")
+
+
+def _loading_slot(slot):
+    '''
+    Property over a slot of Key_C that loads the values of a Lazy_Key_C before they are read
+    '''
+    member = Key_C.__dict__[slot]
+
+    def get(self):
+        if self._loader is not None:
+            self.load()
+        return member.__get__(self, Key_C)
+
+    def set(self, value):
+        member.__set__(self, value)
+
+    return property(get, set)
+
+
+class Lazy_Key_C(Key_C):
+    '''
+    Placeholder key whose values are filled in by a loader the first time they are accessed
+
+    The loader is called with no arguments and returns a Key_C, whose values are moved into this key. Reading,
+    writing or editing the values triggers the load, while the name does not. Once loaded, the key pickles
+    as a Key_C.
+
+    Contructor Parameters:
+        name: Name of the Key object
+        loader: Callable returning the Key_C with the values of this key
+    '''
+
+    __slots__ = ('_loader',)
+
+    _privateDict = _loading_slot('_privateDict')
+    _singleKey = _loading_slot('_singleKey')
+    _singleVal = _loading_slot('_singleVal')
+
+    def __init__(self, name: str, loader):
+        Key_Parent.__init__(self, name)
+        object.__setattr__(self, '_loader', loader)
+
+    def is_loaded(self):
+        '''
+        Function to check if the values of the key have been loaded
+        '''
+        return self._loader is None
+
+    def load(self):
+        '''
+        Function to load the values of the key if they have not been loaded yet
+        '''
+        loader = self._loader
+        if loader is None:
+            return
+        loaded = loader()
+        _, privateDict, singleKey, singleVal = loaded.__getstate__()
+        object.__setattr__(self, '_loader', None)
+        if privateDict is None:
+            self._set_single(singleKey, singleVal)
+        else:
+            self._set_values(privateDict)
+
+    def __reduce_ex__(self, protocol):
+        return (_new_key, (), self.__getstate__())
+
+    def __repr__(self):
+        if not self.is_loaded():
+            return f"Lazy_Key_C(name : {self.name})"
+        return super().__repr__()
+
+
+def _new_key():
+    return Key_C.__new__(Key_C)
@@ -0,0 +1,102 @@
+from anytree import NodeMixin
+from pyvnt.Container.node import Node_C
+from pyvnt.Container.changes import watchers, changed
+
+
+class Lazy_Node_C(Node_C):
+    """
+    Placeholder node whose contents are filled in by a loader the first time they are accessed
+
+    The loader is called with no arguments and returns a Node_C, whose data and children are moved
+    into this node in their written order. Reading data, children, the ordered items or the name index (and so
+    writing, searching or editing the node) triggers the load, while the name and parent do not.
+
+    Contructor Parameters:
+        name: Name of the Node object
+        loader: Callable returning the Node_C with the contents of this node
+        parent: Parent Node of the current Node (Optional)
+        source: Path of the file the contents come from (Optional)
+    """
+
+    def __init__(self, name: str, loader, parent = None, source: str = None):
+        self._loader = None
+        super(Lazy_Node_C, self).__init__(name, parent)
+        self._loader = loader
+        self.source = source
+
+    def is_loaded(self):
+        '''
+        Function to check if the contents of the node have been loaded
+        '''
+        return self._loader is None
+
+    def load(self):
+        '''
+        Function to load the contents of the node if they have not been loaded yet
+        '''
+        loader = self._loader
+        if loader is None:
+            return
+        self._loader = None
+
+        try:
+            loaded = loader()
+        except BaseException:
+            # a failed load can be tried again
+            self._loader = loader
+            raise
+
+        data_ids = {id(item) for item in loaded.data}
+        for item in loaded.get_ordered_items():
+            if id(item) in data_ids:
+                self._data.append(item)
+                self._add_item(item)
+            else:
+                item.parent = self
+        if watchers:
+            changed(self)
+
+    @property
+    def data(self):
+        self.load()
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+
+    @property
+    def _ordered_items(self):
+        self.load()
+        return self.__dict__['_ordered_items']
+
+    @_ordered_items.setter
+    def _ordered_items(self, value):
+        self.__dict__['_ordered_items'] = value
+
+    @property
+    def _name_index(self):
+        self.load()
+        return self.__dict__['_name_index']
+
+    @_name_index.setter
+    def _name_index(self, value):
+        self.__dict__['_name_index'] = value
+
+    @property
+    def children(self):
+        self.load()
+        return NodeMixin.children.fget(self)
+
+    @children.setter
+    def children(self, children):
+        NodeMixin.children.fset(self, children)
+
+    @children.deleter
+    def children(self):
+        NodeMixin.children.fdel(self)
+
+    def __repr__(self):
+        if not self.is_loaded():
+            return f"Lazy_Node_C(name : {self.name}, source : {self.source})"
+        return super().__repr__()
@@ -1,11 +1,16 @@
 from pyvnt.Reference.basic import *
+from pyvnt.Reference.vector import Vector_P
 from pyvnt.Container.node import Node_C
 from anytree import Node, RenderTree, AsciiStyle, NodeMixin
 from pyvnt.Reference.error_classes import SizeError, NoPlaceholdersError, NoValueError, KeyRepeatError
 from pyvnt.utils.make_indent import make_indent
 import warnings
+import numpy as np
 from pyvnt.Container.orderChildMixin import OrderedChildMixin
 
+# Rows formatted per chunk while writing array backed lists
+_WRITE_CHUNK = 65536
+
 class List_CP(OrderedChildMixin,Value_P, NodeMixin):
     '''
     A property that holds a list of elements.
@@ -30,15 +35,23 @@ class List_CP(OrderedChildMixin,Value_P, NodeMixin):
         values: The values of the list.
         default: The default value of the list.
         isNode: If the list is a list of nodes.
+        array: numpy array holding a homogeneous numeric list. (Optional)
     
     Class constructor can be called in the following ways:
         List_CP(name, size, values)
         List_CP(name, values)
         List_CP(name, size, default)
+        List_CP(name, array = array)
+
+    An array backed list keeps its numbers in a single numpy array instead of one Value_P 
+    object per number. A 1-D array is a list with one element holding all the scalars, 
+    a 2-D array has one element per row holding a Vector_P (3 columns) or a List_CP.
+    The numbers are read, compared, appended and written straight from the array; 
+    the list is converted to Value_P objects only when its elements are asked for.
 
     '''
 
-    __slots__ = ['_Value_P__name', '_List_CP__values', '_List_CP__isNode']
+    __slots__ = ['_Value_P__name', '_List_CP__values', '_List_CP__isNode', '_List_CP__array', '_List_CP__buffer']
 
     def __init__(self, 
              name: int, 
@@ -47,14 +60,25 @@ class List_CP(OrderedChildMixin,Value_P, NodeMixin):
              elems: [[Value_P]] = None,
              default: Value_P = None, 
              isNode: bool = False, 
-             parent: Node_C = None):
+             parent: Node_C = None,
+             array: np.ndarray = None):
     
         super(List_CP, self).__init__()
         # Value_P.__init__(self)
         # NodeMixin.__init__(self)
         self.__isNode = isNode
+        self.__array = None
+        self.__buffer = None
 
-        if not self.__isNode:
+        if array is not None:
+            if self.__isNode:
+                raise TypeError("A list of nodes cannot be array backed")
+            if array.ndim not in (1, 2) or array.dtype.kind not in 'iuf':
+                raise TypeError("Array should be a 1-D or 2-D numeric array")
+            self._Value_P__name = name
+            self.__values = None
+            self.__array = array
+        elif not self.__isNode:
             self.__values = [[]]
             if elems is None:
                 elems = [[]]
@@ -75,6 +99,138 @@ class List_CP(OrderedChildMixin,Value_P, NodeMixin):
     
     def instance_restricted(self):
         pass
+
+    def is_array_backed(self):
+        '''
+        Returns if the values of the list are stored in a numpy array.
+        '''
+        return self.__array is not None
+
+    def get_array(self):
+        '''
+        Returns the numpy array backing the list, None if the list stores Value_P objects.
+        '''
+        return self.__array
+
+    def __value_of(self, number):
+        '''
+        Creates the Value_P object for a single number of the array.
+        '''
+        if isinstance(number, int):
+            return Int_P("value", number, minimum=min(0, number), maximum=max(100000, number))
+        return Flt_P("value", number, minimum=min(0.0, number), maximum=max(1e5, number))
+
+    def __row_value(self, row: list):
+        '''
+        Creates the Value_P object for a row of a 2-D array.
+        '''
+        if len(row) == 3:
+            return Vector_P("value", *(Flt_P(c, float(v), minimum=min(0.0, v), maximum=max(1e5, v))
+                                       for c, v in zip("xyz", row)))
+        return List_CP("v", elems=[[self.__value_of(v) for v in row]])
+
+    def __materialize(self):
+        '''
+        Converts an array backed list into the regular list of elements of Value_P objects.
+        '''
+        if self.__array is None:
+            return
+
+        if self.__array.ndim == 1:
+            self.__values = [[self.__value_of(v) for v in self.__array.tolist()]]
+        else:
+            self.__values = [[self.__row_value(row)] for row in self.__array.tolist()] or [[]]
+        self.__array = None
+        self.__buffer = None
+
+    def __number_of(self, val: Value_P):
+        '''
+        Returns the number (1-D) or row of numbers (2-D) held by val if it fits in the array, else None.
+        '''
+        if self.__array.ndim == 1:
+            if type(val) in (Int_P, Flt_P):
+                return val.give_val()
+            return None
+
+        if type(val) in (Vector_P, List_CP):
+            row = val.give_val()
+            if len(row) == self.__array.shape[1] and all(type(v) in (int, float) for v in row):
+                return row
+        return None
+
+    def __append_row(self, number):
+        '''
+        Appends a number (1-D) or a row (2-D) to the array, growing its buffer geometrically.
+        '''
+        arr = self.__array
+        n = len(arr)
+        dtype = np.result_type(arr.dtype, np.asarray(number).dtype)
+        buf = self.__buffer
+        if buf is None or n == len(buf) or buf.dtype != dtype:
+            buf = np.empty((max(2 * n, 8),) + arr.shape[1:], dtype=dtype)
+            buf[:n] = arr
+            self.__buffer = buf
+        buf[n] = number
+        self.__array = buf[:n + 1]
+
+    def __getstate__(self):
+        '''
+        State of the list for copy and pickle. Copies share the array but not its buffer, as the appends of
+        this list write into the room left at the end of the buffer.
+        '''
+        slots = {name: getattr(self, name) for name in List_CP.__slots__ if hasattr(self, name)}
+        slots['_List_CP__buffer'] = None
+        return getattr(self, '__dict__', None) or None, slots
+
+    def pack(self) -> bool:
+        '''
+        Moves the values of a homogeneous numeric list into a numpy array.
+        Names and ranges of the individual values are not kept.
+
+        Returns:
+            True if the list is array backed afterwards.
+        '''
+        if self.__isNode:
+            return False
+        if self.__array is not None:
+            return True
+
+        elems = [elem for elem in self.__values if elem]
+        if len(elems) == 1 and all(type(v) in (Int_P, Flt_P) for v in elems[0]):
+            numbers = [v.give_val() for v in elems[0]]
+        elif elems and all(len(elem) == 1 and type(elem[0]) in (Vector_P, List_CP) for elem in elems):
+            numbers = [elem[0].give_val() for elem in elems]
+        else:
+            return False
+
+        try:
+            arr = np.array(numbers)
+        except ValueError: # rows of different lengths
+            return False
+        if arr.dtype.kind not in 'iuf' or arr.ndim != (1 if type(elems[0][0]) in (Int_P, Flt_P) else 2):
+            return False
+
+        self.__array = arr
+        self.__values = None
+        return True
+
+    def write_array(self, file, indent: int = 0):
+        '''
+        Writes an array backed list in OpenFOAM's counted list format, one row per line,
+        without creating Value_P objects.
+        '''
+        arr = self.__array
+        tabs = "\t" * indent
+        file.write(f"{len(arr)}\n{tabs}(\n")
+        prefix = tabs + "\t"
+        for start in range(0, len(arr), _WRITE_CHUNK):
+            block = arr[start:start + _WRITE_CHUNK].tolist()
+            if arr.ndim == 1:
+                lines = map(str, block)
+            else:
+                lines = ("(" + " ".join(map(str, row)) + ")" for row in block)
+            file.write(prefix + f"\n{prefix}".join(lines) + "\n")
+        file.write(f"{tabs})")
     
     def total_len(self, ar: [[Value_P]]= [[]]) -> int:
         res = 0
@@ -187,10 +343,23 @@ class List_CP(OrderedChildMixin,Value_P, NodeMixin):
         '''
         Returns the value at the given index.
 
+        For an array backed list the value is created from the array and is a copy,
+        asking for a whole element converts the list to Value_P objects.
+
         Parameters: 
             elem: The index of the element.
             index: The index of the value in the element.(Optional)
         '''
+        if self.__array is not None and index != None:
+            if self.__array.ndim == 1:
+                if elem not in (0, -1):
+                    raise IndexError("list index out of range")
+                return self.__value_of(self.__array[index].item())
+            if index not in (0, -1):
+                raise IndexError("list index out of range")
+            return self.__row_value(self.__array[elem].tolist())
+
+        self.__materialize()
 
         if index != None:
             return self.__values[elem][index]
@@ -207,6 +376,13 @@ class List_CP(OrderedChildMixin,Value_P, NodeMixin):
         '''
         self.check_type(value = val)
 
+        if self.__array is not None and self.__array.ndim == 1 and elem in (0, -1):
+            number = self.__number_of(val)
+            if number is not None:
+                self.__append_row(number)
+                return
+        self.__materialize()
+
         self.__values[elem].append(val)
     
     def append_uniq_value(self, elem: int, val: Value_P):
@@ -220,6 +396,7 @@ class List_CP(OrderedChildMixin,Value_P, NodeMixin):
         '''
 
         self.check_type(value = val)
+        self.__materialize()
 
         if val not in self.__values[elem]:
             self.__values[elem].append(val)
@@ -234,6 +411,13 @@ class List_CP(OrderedChildMixin,Value_P, NodeMixin):
             elem: The element to be appended.
         '''
         self.check_type(values = elem)
+
+        if self.__array is not None and self.__array.ndim == 2 and len(elem) == 1:
+            row = self.__number_of(elem[0])
+            if row is not None:
+                self.__append_row(row)
+                return
+        self.__materialize()
         if self.__values == [[]]:
             self.__values = [elem]
         else:
@@ -247,6 +431,7 @@ class List_CP(OrderedChildMixin,Value_P, NodeMixin):
             elem: The element to be appended.
         '''
         self.check_type(values = elem)
+        self.__materialize()
 
         if self.__values == [[]]:
             self.__values = [elem]
@@ -287,7 +472,9 @@ class List_CP(OrderedChildMixin,Value_P, NodeMixin):
             return obj
 
     def __repr__(self):
-        if not self.__isNode:
+        if self.__array is not None:
+            return f"List_CP(name : {self._Value_P__name}, values : array(shape = {self.__array.shape}, dtype = {self.__array.dtype}))"
+        elif not self.__isNode:
             tval = []
             for elem in self.__values:
                 tval.append([val.give_val() for val in elem])
@@ -300,6 +487,8 @@ class List_CP(OrderedChildMixin,Value_P, NodeMixin):
         '''
         Returns the size of the list.
         '''
+        if self.__array is not None:
+            return len(self.__array)
         s = 0
         for elem in self.__values:
             s = s + len(elem)
@@ -315,23 +504,26 @@ class List_CP(OrderedChildMixin,Value_P, NodeMixin):
         '''
         Returns the list.
         '''
-        res = tuple()
+        if self.__array is not None:
+            if self.__array.ndim == 1:
+                return tuple(self.__array.tolist())
+            return tuple(map(tuple, self.__array.tolist()))
 
-        for elem in self.__values:
-            for val in elem:
-                res = res + (val.give_val(),)
-        return res
+        return tuple(val.give_val() for elem in self.__values for val in elem)
     
     def get_elems(self):
         '''
         Returns the elements of the list.
         '''
+        self.__materialize()
         return self.__values
         
     def check_similar_data(self):
         '''
         Checks if all the items inside the list are of the same type.
         '''
+        if self.__array is not None:
+            return True
         return all(isinstance(i, type(self.__values[0][0])) for i in elem for elem in self.__values)
     
     def write_out(self, file, indent: int = 0, vert: bool = False):
@@ -357,6 +549,10 @@ class List_CP(OrderedChildMixin,Value_P, NodeMixin):
 
             make_indent(file, indent)
             file.write(")\n")
+        elif self.__array is not None:
+            if vert:
+                make_indent(file, indent)
+            self.write_array(file, indent)
         elif vert:
             make_indent(file, indent)
             file.write("(\n")
@@ -380,6 +576,8 @@ class List_CP(OrderedChildMixin,Value_P, NodeMixin):
             file.write(')')
     
     def __eq__(self, other):
+        if self.__array is not None and isinstance(other, List_CP) and other.is_array_backed():
+            return bool(np.array_equal(self.__array, other.get_array()))
         return self.give_val() == other.give_val()
     
     def __ne__(self, other):
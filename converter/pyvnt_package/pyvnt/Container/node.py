@@ -1,10 +1,11 @@
 from anytree import Node, RenderTree, AsciiStyle, NodeMixin
-from anytree.search import find_by_attr
 from typing import Any, Type
 from pyvnt.Container.key import Key_C
 from pyvnt.Reference.error_classes import *
 from pyvnt.utils.make_indent import make_indent
 from pyvnt.Container.orderChildMixin import OrderedChildMixin
+from pyvnt.Container.orderedItems import OrderedItems
+from pyvnt.Container.changes import watchers, changed
 
 '''
 Criteria for classes:
@@ -20,6 +21,11 @@ Why we implement _ordered_items : In a node we can add key-value and dictionarie
                                   way we add them .
 '''
 
+# Shared by the nodes without items until their first item is added, so that empty nodes (e.g. Lazy_Node_C
+# placeholders) do not each hold an empty OrderedItems and name index
+_NO_ITEMS = OrderedItems()
+_NO_NAMES = {}
+
 class Node_C(OrderedChildMixin,NodeMixin):
     """
     Class to define nodes of the tree
@@ -30,7 +36,8 @@ class Node_C(OrderedChildMixin,NodeMixin):
         children: List of the children node(s) of the current Node (Optional)
     """
 
-    # __slots__ = ('name', 'parent', 'children', 'data')
+    # parent and children are kept by NodeMixin, which has no slots, in the instance __dict__
+    __slots__ = ('name', 'data', '_ordered_items', '_name_index')
 
     def __init__(self, name: str, parent = None, children: [] = None, *args: Key_C):
 
@@ -48,13 +55,11 @@ class Node_C(OrderedChildMixin,NodeMixin):
             self.children = children
 
         # for Writing in order 
-        self._ordered_items = []
-        for item in self.data:
-            if item not in self._ordered_items:
-                self._ordered_items.append(item)
-        for item in self.children:
-            if item not in self._ordered_items:
-                self._ordered_items.append(item)
+        self._ordered_items = _NO_ITEMS
+        # name -> items with that name (keys and children), in the order they were added
+        self._name_index = _NO_NAMES
+        for item in (*self.data, *self.children):
+            self._add_item(item)
 
     # @property
     # def parent(self):
@@ -74,6 +79,14 @@ class Node_C(OrderedChildMixin,NodeMixin):
     #             new_parent_node._ordered_items.append(self)
     #     print("finsins parent setter")
     
+    def __setstate__(self, state):
+        # slots are restored directly, the parent may not be fully unpickled yet
+        dict_state, slot_state = state if isinstance(state, tuple) else (state, None)
+        if dict_state:
+            self.__dict__.update(dict_state)
+        for key, val in (slot_state or {}).items():
+            object.__setattr__(self, key, val)
+
     def __getattr__(self, key):
         """
         Prevents access to attributes which are not in _privateDict
@@ -108,7 +121,9 @@ class Node_C(OrderedChildMixin,NodeMixin):
              if getattr(item_ref, 'name', None) not in processed_items:
                  new_ordered_items.append(item_ref)
 
-        self._ordered_items = new_ordered_items
+        self._ordered_items = OrderedItems(new_ordered_items)
+        if watchers:
+            changed(self)
 
     def get_ordered_items(self):
         """Returns an iterator over the items (references) in the desired order."""
@@ -145,7 +160,8 @@ class Node_C(OrderedChildMixin,NodeMixin):
 
     def __repr__(self):
         res_str = f"Node_C("
-        for key, val in self.__dict__.items():
+        items = [('name', self.name), ('data', self.data), *self.__dict__.items(), ('_ordered_items', self._ordered_items)]
+        for key, val in items:
             res_str = res_str + f"{key} : {val}, "
         res_str = res_str + ")"
         return res_str
@@ -157,7 +173,68 @@ class Node_C(OrderedChildMixin,NodeMixin):
         Parameter:
             val: Name of the Node that is bein searched for
         '''
-        return find_by_attr(self, val, maxlevel = 2)
+        return self._lookup(val, False)
+
+    def get_key(self, val: str):
+        '''
+        Function to find the Key_C attribute with the given name, None if there is no such key
+
+        Parameter:
+            val: Name of the Key that is being searched for
+        '''
+        return self._lookup(val, True)
+
+    def _lookup(self, name: str, is_key: bool):
+        '''
+        Returns the first key (or child) added with the given name, using the name index
+        '''
+        for attempt in range(2):
+            stale = False
+            for item in self._name_index.get(name, ()):
+                if item.name != name:
+                    stale = True
+                elif isinstance(item, Key_C) == is_key:
+                    return item
+            if not stale:
+                return None
+            # an item was renamed without the node knowing, e.g. a List_CP of nodes
+            self.reindex()
+        return None
+
+    def reindex(self):
+        '''
+        Function to rebuild the name index of the node from its keys and children
+        '''
+        self._name_index = _NO_NAMES
+        for item in self._ordered_items:
+            self._index_item(item)
+
+    def _add_item(self, item):
+        if self._ordered_items is _NO_ITEMS:
+            self._ordered_items = OrderedItems()
+        self._ordered_items.append(item)
+        self._index_item(item)
+
+    def _index_item(self, item):
+        if self._name_index is _NO_NAMES:
+            self._name_index = {}
+        self._name_index.setdefault(item.name, []).append(item)
+
+    def _unindex_item(self, item):
+        index = self._name_index
+        name = item.name
+        bucket = index.get(name)
+        if bucket is None or not any(x is item for x in bucket):
+            # renamed since it was indexed
+            name, bucket = next(((n, b) for n, b in index.items() if any(x is item for x in b)), (None, None))
+            if bucket is None:
+                return
+        for i, x in enumerate(bucket):
+            if x is item:
+                del bucket[i]
+                break
+        if not bucket:
+            del index[name]
 
     def add_data(self, data: Key_C, pos: int = None):
         '''
@@ -169,7 +246,9 @@ class Node_C(OrderedChildMixin,NodeMixin):
         else:
             self.data.append(data)
             
-        self._ordered_items.append(data)
+        self._add_item(data)
+        if watchers:
+            changed(self)
 
     def remove_data(self, data: Key_C):
         '''
@@ -181,6 +260,9 @@ class Node_C(OrderedChildMixin,NodeMixin):
             self._ordered_items.remove(data)
         except:
             raise AttributeError(f"{data.name} does not exist in this node")
+        self._unindex_item(data)
+        if watchers:
+            changed(self)
 
     def reorder_data(self, data: Key_C, pos: int):
         '''
@@ -4,14 +4,17 @@ from typing import Any, Type
 from pyvnt.Container.key import Key_C
 from pyvnt.Reference.error_classes import *
 from pyvnt.utils.make_indent import make_indent
+from pyvnt.Container.changes import watchers, changed
 
 
 class OrderedChildMixin:
     """
     A mixin for any class that can be a child of a Node_C.
     It overrides the parent setter to ensure the child is correctly added
-    to or removed from its parent's `_ordered_items` list.
+    to or removed from its parent's `_ordered_items` list and name index.
     """
+
+    __slots__ = ()
     @property
     def parent(self):
         return super().parent
@@ -24,6 +27,28 @@ class OrderedChildMixin:
 
         if hasattr(old_parent_node, '_ordered_items'):
             old_parent_node._ordered_items.remove(self)
+        if hasattr(old_parent_node, '_name_index'):
+            old_parent_node._unindex_item(self)
         if hasattr(new_parent_node, '_ordered_items'):
             # if self not in new_parent_node._ordered_items:
-            new_parent_node._ordered_items.append(self)
\ No newline at end of file
+            new_parent_node._add_item(self)
+        if watchers:
+            if old_parent_node is not None:
+                changed(old_parent_node)
+            if new_parent_node is not None:
+                changed(new_parent_node)
+
+    def __setattr__(self, key, value):
+        """
+        Keeps the name index of the parent node up to date when the child is renamed
+        """
+        if key == 'name':
+            parent = self.parent
+            if parent is not None and hasattr(parent, '_name_index'):
+                parent._unindex_item(self)
+                super().__setattr__(key, value)
+                parent._index_item(self)
+                if watchers:
+                    changed(parent)
+                return
+        super().__setattr__(key, value)
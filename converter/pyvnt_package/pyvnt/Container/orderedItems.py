@@ -0,0 +1,49 @@
+class OrderedItems:
+    """
+    Insertion ordered set of item references, used for the _ordered_items of a Node_C
+
+    Items are keyed by identity, so appending, removing and checking membership take constant time
+    whatever the number of items, while iteration keeps the order the items were added in.
+
+    Contructor Parameters:
+        items: Items to start with, in order (Optional)
+    """
+
+    __slots__ = ('_items',)
+
+    def __init__(self, items = ()):
+        self._items = {id(item): item for item in items}
+
+    def append(self, item):
+        '''
+        Function to add an item at the end, an item already present keeps its position
+        '''
+        self._items[id(item)] = item
+
+    def remove(self, item):
+        '''
+        Function to remove an item, raises ValueError if the item is not present
+        '''
+        try:
+            del self._items[id(item)]
+        except KeyError:
+            raise ValueError("item is not in the ordered items") from None
+
+    def __contains__(self, item):
+        return id(item) in self._items
+
+    def __iter__(self):
+        return iter(self._items.values())
+
+    def __len__(self):
+        return len(self._items)
+
+    # ids are only valid inside one process, so the items are stored in order
+    def __getstate__(self):
+        return list(self._items.values())
+
+    def __setstate__(self, items):
+        self._items = {id(item): item for item in items}
+
+    def __repr__(self):
+        return repr(list(self._items.values()))
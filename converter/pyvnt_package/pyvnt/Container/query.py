@@ -0,0 +1,307 @@
+'''
+Path queries over trees of Node_C objects.
+
+A path is a sequence of names, written separated by '/' (e.g. 'system/fvSolution/solvers/p/solver'), or by
+'.' when it holds no '/' (e.g. 'solvers.p.solver'). Each segment matches the keys and children of the nodes
+reached so far, or the values of the keys:
+
+    name        items with that name. Where there is none, OpenFOAM regex keys such as "(U|k|epsilon)"
+                (written with quotes, kept without them by the parser) are tried, and the last one matching
+                the name is used, like OpenFOAM does (except right after **)
+    p*, U?      items whose names match the wildcards, like fnmatch
+    "(U|k).*"   items whose names fully match the regular expression, which may hold '/' and '.'
+    **          any number of levels of nodes, none included
+
+A path can also be given as a tuple of segments, which are not split any further.
+'''
+
+import fnmatch
+import functools
+import re
+from pyvnt.Container.node import Node_C
+from pyvnt.Container.key import Key_C
+from pyvnt.Container.list import List_CP
+from pyvnt.Container.lazy_node import Lazy_Node_C
+from pyvnt.Container.changes import add_watcher
+
+
+_DEEP = '**'
+
+_QUOTED = re.compile(r'"[^"]*"')
+
+# names of keys and nodes that OpenFOAM reads as regular expressions, while div(phi,U) is a plain name
+_PATTERN_NAME = re.compile(r'[|*+?\[\\^$]')
+
+
+def split_path(path) -> tuple:
+    '''
+    Function to split a path into its segments
+
+    Parameters:
+        path: Path as a '/' or '.' separated string, or a tuple of segments
+    '''
+    if not isinstance(path, str):
+        return tuple(path)
+    return _split(path)
+
+
+@functools.lru_cache(maxsize=1024)
+def _split(path: str) -> tuple:
+    sep = '/' if '/' in _QUOTED.sub('', path) else '.'
+    return tuple(re.findall(r'"[^"]*"|[^"' + re.escape(sep) + r']+', path))
+
+
+@functools.lru_cache(maxsize=1024)
+def _matcher(segment: str):
+    '''
+    Returns None for a plain name, or the function telling if a name matches the segment
+    '''
+    if len(segment) >= 2 and segment[0] == segment[-1] == '"':
+        return re.compile(segment[1:-1]).fullmatch
+    if any(c in segment for c in '*?['):
+        return re.compile(fnmatch.translate(segment)).match
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _name_pattern(name: str):
+    if not _PATTERN_NAME.search(name):
+        return None
+    try:
+        return re.compile(name)
+    except re.error:
+        return None
+
+
+def _is_container(item) -> bool:
+    return isinstance(item, Node_C) or (isinstance(item, List_CP) and item.is_a_node())
+
+
+def _items_of(item) -> list:
+    '''
+    Returns the (name, item) pairs under an item, in the written order
+    '''
+    if isinstance(item, Node_C):
+        return [(entry.name, entry) for entry in item.get_ordered_items()]
+    if isinstance(item, Key_C):
+        return list(item.get_items())
+    if isinstance(item, List_CP) and item.is_a_node():
+        return [(child.name, child) for child in item.children]
+    return []
+
+
+def _named(item, name: str, patterns: bool = True) -> list:
+    '''
+    Returns the items under an item with the given name, or else the last regex key matching it
+    '''
+    if isinstance(item, Node_C):
+        found = item._name_index.get(name, ())
+        if any(entry.name != name for entry in found):
+            item.reindex() # an item was renamed without the node knowing, e.g. a List_CP of nodes
+            found = item._name_index.get(name, ())
+        if found:
+            return list(found)
+    else:
+        found = [entry for entry_name, entry in _items_of(item) if entry_name == name]
+        if found or isinstance(item, Key_C):
+            return found
+    if not patterns:
+        return []
+    for entry_name, entry in reversed(_items_of(item)):
+        pattern = _name_pattern(entry_name)
+        if pattern is not None and pattern.fullmatch(name):
+            return [entry]
+    return []
+
+
+def _descendants(item, containers_only: bool) -> list:
+    '''
+    Returns the items under a node at any depth, depth first in the written order
+    '''
+    result = []
+    stack = [iter(_items_of(item))]
+    while stack:
+        for _, entry in stack[-1]:
+            container = _is_container(entry)
+            if container or not containers_only:
+                result.append(entry)
+            if container:
+                stack.append(iter(_items_of(entry)))
+                break
+        else:
+            stack.pop()
+    return result
+
+
+def _evaluate(roots: list, segments: tuple) -> list:
+    current = roots
+    for position, segment in enumerate(segments):
+        found = []
+        if segment == _DEEP:
+            last = position == len(segments) - 1
+            for item in current:
+                if not last and _is_container(item):
+                    found.append(item)
+                if _is_container(item):
+                    found.extend(_descendants(item, not last))
+        else:
+            match = _matcher(segment)
+            for item in current:
+                if match is None:
+                    # after ** only the items with the name, not every regex key on the way
+                    found.extend(_named(item, segment, position == 0 or segments[position - 1] != _DEEP))
+                else:
+                    found.extend(entry for name, entry in _items_of(item) if match(name))
+        current = _unique(found)
+    return current
+
+
+def _unique(items: list) -> list:
+    seen = set()
+    result = []
+    for item in items:
+        if id(item) not in seen:
+            seen.add(id(item))
+            result.append(item)
+    return result
+
+
+def query(node: Node_C, path) -> list:
+    '''
+    Function to find the items (keys, nodes, lists of nodes or values) at a path below a node
+
+    Parameters:
+        node: Node the path starts from
+        path: Path of the items, see the module documentation
+
+    Returns:
+        List of the items found, in the written order
+    '''
+    return _evaluate([node], split_path(path))
+
+
+def query_one(node: Node_C, path):
+    '''
+    Function to find the first item at a path below a node, None if there is no such item
+
+    Parameters:
+        node: Node the path starts from
+        path: Path of the item, see the module documentation
+    '''
+    found = query(node, path)
+    return found[0] if found else None
+
+
+class PathIndex:
+    '''
+    Index of the items of a tree by their path from its root
+
+    The index is built in one traversal of the tree, and the results of queries are kept until the tree
+    changes, so repeated queries take constant time. The nodes tell the index when their keys or children
+    change, and only the paths under the changed nodes are indexed again, at the next query. Lazy_Node_C
+    nodes that are not loaded yet are not loaded by the index, but when a query goes through them.
+
+    Contructor Parameters:
+        root: Node the paths start from
+    '''
+
+    def __init__(self, root: Node_C):
+        self.root = root
+        self._items = {}        # path -> items with that path, in the written order
+        self._names = {}        # path of indexed containers -> names of the items under them
+        self._containers = {}   # id -> (container, path) of the indexed containers
+        self._keys = {}         # id -> (key, path of the container holding it) of the indexed keys
+        self._dirty = set()     # paths of containers changed since they were indexed
+        self._results = {}      # segments of a query -> its results
+        self._build((), [root])
+        add_watcher(self)
+
+    def _node_changed(self, node):
+        # a changed key changes the results of the queries through the container holding it
+        entry = self._containers.get(id(node)) or self._keys.get(id(node))
+        if entry is not None and entry[0] is node:
+            self._dirty.add(entry[1])
+
+    def _build(self, path: tuple, containers: list):
+        stack = [(path, containers)]
+        while stack:
+            path, containers = stack.pop()
+            names = {}
+            for container in containers:
+                self._containers[id(container)] = (container, path)
+                if isinstance(container, Lazy_Node_C) and not container.is_loaded():
+                    continue
+                for name, item in _items_of(container):
+                    self._items.setdefault(path + (name,), []).append(item)
+                    names[name] = None
+                    if isinstance(item, Key_C):
+                        self._keys[id(item)] = (item, path)
+            self._names[path] = list(names)
+            for name in names:
+                child = path + (name,)
+                child_containers = [item for item in self._items[child] if _is_container(item)]
+                if child_containers:
+                    stack.append((child, child_containers))
+
+    def _drop(self, path: tuple):
+        stack = [path]
+        while stack:
+            path = stack.pop()
+            for name in self._names.pop(path, ()):
+                child = path + (name,)
+                for item in self._items.pop(child, ()):
+                    if _is_container(item):
+                        self._containers.pop(id(item), None)
+                        stack.append(child)
+                    elif isinstance(item, Key_C):
+                        self._keys.pop(id(item), None)
+
+    def _refresh(self):
+        dirty = sorted(self._dirty, key=len)
+        self._dirty.clear()
+        self._results.clear()
+        rebuilt = set()
+        for path in dirty:
+            if any(path[:i] in rebuilt for i in range(len(path) + 1)):
+                continue
+            containers = [self.root] if path == () else \
+                [item for item in self._items.get(path, ()) if _is_container(item)]
+            self._drop(path)
+            self._build(path, containers)
+            rebuilt.add(path)
+
+    def query(self, path) -> list:
+        '''
+        Function to find the items at a path below the root, see query
+
+        Parameters:
+            path: Path of the items, see the module documentation
+        '''
+        if self._dirty:
+            self._refresh()
+        segments = split_path(path)
+        if all(segment != _DEEP and _matcher(segment) is None for segment in segments):
+            found = self._items.get(segments)
+            if found is not None:
+                return list(found)
+        found = self._results.get(segments)
+        if found is None:
+            found = _evaluate([self.root], segments)
+            if not self._dirty: # a query loading Lazy_Node_C nodes changes the tree
+                self._results[segments] = found
+        return list(found)
+
+    def query_one(self, path):
+        '''
+        Function to find the first item at a path below the root, None if there is no such item
+        '''
+        found = self.query(path)
+        return found[0] if found else None
+
+    def __len__(self):
+        if self._dirty:
+            self._refresh()
+        return sum(len(items) for items in self._items.values())
+
+    def __repr__(self):
+        return f"PathIndex(root : {self.root.name}, items : {len(self)})"
@@ -0,0 +1,512 @@
+'''
+Compact binary format for pyvnt trees.
+
+Layout (all integers little-endian):
+
+    header        magic b'PYVNTBIN', format version (u16), string count (u32)
+    string table  length of every string in characters (u32 each), size of the utf-8 blob (u64),
+                  then all strings as one utf-8 blob
+    body          one record for the dumped object
+
+A record starts with an opcode (u8) and refers to names, keywords and words by their index in the
+string table, so repeated keywords like "value" or "uniform" are stored once. Node_C, Key_C and
+List_CP records are followed by the records of their contents. Array backed lists store the raw
+bytes of their numpy array.
+
+Loading creates the objects without going through their constructors (the data was validated
+when the tree was built), which makes it much faster than parsing the text again.
+'''
+
+import gc
+import struct
+from itertools import accumulate
+
+import numpy as np
+
+from pyvnt.Reference.basic import Int_P, Flt_P, Str_P, Enm_P
+from pyvnt.Reference.vector import Vector_P
+from pyvnt.Reference.tensor import Tensor_P
+from pyvnt.Reference.dimension_set import Dim_Set_P, Dim_Type
+from pyvnt.Reference.error_classes import BinaryFormatError, VersionError
+from pyvnt.Container.node import Node_C, _NO_ITEMS, _NO_NAMES
+from pyvnt.Container.orderedItems import OrderedItems
+from pyvnt.Container.key import Key_C, OrderedValues
+from pyvnt.Container.list import List_CP
+
+__all__ = ['dump', 'dumps', 'load', 'loads', 'FORMAT_VERSION']
+
+MAGIC = b'PYVNTBIN'
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct('<8sHI')
+_U32 = struct.Struct('<I')
+_U64 = struct.Struct('<Q')
+_OP = struct.Struct('<B')
+_OP_NAME = struct.Struct('<BI')
+_OP_NAME_COUNT = struct.Struct('<BII')
+_OP_NAME_INTS = struct.Struct('<BIqqq')
+_OP_NAME_FLOATS = struct.Struct('<BIBddd')
+_OP_NAME_STR_COUNT = struct.Struct('<BIII')
+_NUMBER = struct.Struct('<cq')
+_FLOAT = struct.Struct('<cd')
+
+# Record opcodes
+_NODE = 1
+_LIST_NODE = 2
+_KEY = 3
+_INT = 16
+_FLT = 17
+_STR = 18
+_ENM = 19
+_VECTOR = 20
+_TENSOR = 21
+_DIM_SET = 22
+_INT_NUMBERS = 23 # Int_P whose numbers do not fit in 64 bits
+_FLT_NUMBERS = 24 # Flt_P whose numbers are not all floats or small ints
+_LIST = 32
+_ARRAY = 33
+
+_I64_MIN = -2 ** 63
+_I64_MAX = 2 ** 63 - 1
+_F64_EXACT = 2 ** 53
+
+
+class _Encoder:
+    '''
+    Walks a tree and collects the records of the body and the strings they refer to
+    '''
+
+    def __init__(self):
+        self.strings = {}
+        self.chunks = []
+        self.dispatch = {
+            Key_C: self.key,
+            List_CP: self.list,
+            Int_P: self.int_p,
+            Flt_P: self.flt_p,
+            Str_P: self.str_p,
+            Enm_P: self.enm_p,
+            Vector_P: self.vector_p,
+            Tensor_P: self.tensor_p,
+            Dim_Set_P: self.dim_set_p,
+        }
+
+    def string(self, s) -> int:
+        index = self.strings.get(s)
+        if index is None:
+            if not isinstance(s, str):
+                raise TypeError(f"Cannot store name {s!r} of type {type(s)}")
+            index = self.strings[s] = len(self.strings)
+        return index
+
+    def number(self, n):
+        if type(n) is int and _I64_MIN <= n <= _I64_MAX:
+            self.chunks.append(_NUMBER.pack(b'i', n))
+        elif type(n) is float:
+            self.chunks.append(_FLOAT.pack(b'f', n))
+        elif isinstance(n, (int, np.integer)): # too large for 64 bits or numpy scalar
+            self.chunks.append(_NUMBER.pack(b'I', self.string(str(int(n)))))
+        elif isinstance(n, np.floating):
+            self.chunks.append(_FLOAT.pack(b'f', float(n)))
+        else:
+            raise TypeError(f"Cannot store number {n!r} of type {type(n)}")
+
+    def record(self, obj):
+        encode = self.dispatch.get(type(obj))
+        if encode is None:
+            if isinstance(obj, Node_C): # e.g. Lazy_Node_C, its contents are loaded while dumping
+                encode = self.node
+            elif isinstance(obj, Key_C): # e.g. Lazy_Key_C
+                encode = self.key
+            else:
+                raise TypeError(f"Object of type {type(obj)} cannot be stored")
+        encode(obj)
+
+    def node(self, node):
+        items = node.get_ordered_items()
+        self.chunks.append(_OP_NAME_COUNT.pack(_NODE, self.string(node.name), len(items)))
+        for item in items:
+            self.record(item)
+
+    def key(self, key):
+        items = key.get_items()
+        self.chunks.append(_OP_NAME_COUNT.pack(_KEY, self.string(key.name), len(items)))
+        for name, val in items:
+            self.chunks.append(_U32.pack(self.string(name)))
+            self.record(val)
+
+    def list(self, lst):
+        if lst.is_a_node():
+            children = lst.children
+            self.chunks.append(_OP_NAME_COUNT.pack(_LIST_NODE, self.string(lst.name), len(children)))
+            for child in children:
+                self.record(child)
+        elif lst.is_array_backed():
+            arr = lst.get_array()
+            arr = np.ascontiguousarray(arr, dtype=arr.dtype.newbyteorder('<'))
+            self.chunks.append(_OP_NAME_COUNT.pack(_ARRAY, self.string(lst._Value_P__name), self.string(arr.dtype.str)))
+            self.chunks.append(_OP.pack(arr.ndim))
+            self.chunks.extend(_U64.pack(n) for n in arr.shape)
+            self.chunks.append(arr.tobytes())
+        else:
+            elems = lst.get_elems()
+            self.chunks.append(_OP_NAME_COUNT.pack(_LIST, self.string(lst._Value_P__name), len(elems)))
+            for elem in elems:
+                self.chunks.append(_U32.pack(len(elem)))
+                for val in elem:
+                    self.record(val)
+
+    def int_p(self, val):
+        name = self.string(val._Value_P__name)
+        numbers = (val._Int_P__default, val._Int_P__minimum, val._Int_P__maximum)
+        if all(type(n) is int and _I64_MIN <= n <= _I64_MAX for n in numbers):
+            self.chunks.append(_OP_NAME_INTS.pack(_INT, name, *numbers))
+        else:
+            self.chunks.append(_OP_NAME.pack(_INT_NUMBERS, name))
+            for n in numbers:
+                self.number(n)
+
+    def flt_p(self, val):
+        name = self.string(val._Value_P__name)
+        numbers = (val._Flt_P__default, val._Flt_P__minimum, val._Flt_P__maximum)
+        # ints among the numbers (e.g. minimum = 0) are flagged so they come back as ints
+        flags = 0
+        for bit, n in enumerate(numbers):
+            if type(n) is int and -_F64_EXACT <= n <= _F64_EXACT:
+                flags |= 1 << bit
+            elif type(n) is not float:
+                break
+        else:
+            self.chunks.append(_OP_NAME_FLOATS.pack(_FLT, name, flags, *numbers))
+            return
+        self.chunks.append(_OP_NAME.pack(_FLT_NUMBERS, name))
+        for n in numbers:
+            self.number(n)
+
+    def str_p(self, val):
+        self.chunks.append(_OP_NAME_COUNT.pack(_STR, self.string(val._Value_P__name), self.string(val._Str_P__default)))
+
+    def enm_p(self, val):
+        items = val.get_items()
+        self.chunks.append(_OP_NAME_STR_COUNT.pack(_ENM, self.string(val._Value_P__name),
+                                                   self.string(val._Enm_P__default), len(items)))
+        self.chunks.extend(_U32.pack(self.string(item)) for item in items)
+
+    def vector_p(self, val):
+        self.chunks.append(_OP_NAME.pack(_VECTOR, self.string(val._Value_P__name)))
+        self.record(val._Vector_P__x)
+        self.record(val._Vector_P__y)
+        self.record(val._Vector_P__z)
+
+    def tensor_p(self, val):
+        self.chunks.append(_OP_NAME.pack(_TENSOR, self.string(val._Value_P__name)))
+        for row in val._Tensor_P__values:
+            for v in row:
+                self.record(v)
+
+    def dim_set_p(self, val):
+        self.chunks.append(_OP_NAME.pack(_DIM_SET, self.string(val._Value_P__name)))
+        for n in val.give_val():
+            self.number(n)
+
+
+class _Decoder:
+    '''
+    Rebuilds the objects of a body, bypassing their constructors
+    '''
+
+    def __init__(self, data, pos: int, strings: list):
+        self.data = data
+        self.pos = pos
+        self.strings = strings
+        self.dispatch = {
+            _NODE: self.node,
+            _LIST_NODE: self.list_node,
+            _KEY: self.key,
+            _INT: self.int_p,
+            _INT_NUMBERS: self.int_p_numbers,
+            _FLT: self.flt_p,
+            _FLT_NUMBERS: self.flt_p_numbers,
+            _STR: self.str_p,
+            _ENM: self.enm_p,
+            _VECTOR: self.vector_p,
+            _TENSOR: self.tensor_p,
+            _DIM_SET: self.dim_set_p,
+            _LIST: self.list,
+            _ARRAY: self.array,
+        }
+
+    def record(self, parent = None):
+        op = self.data[self.pos]
+        decode = self.dispatch.get(op)
+        if decode is None:
+            raise BinaryFormatError(f"unknown record {op} at byte {self.pos}")
+        return decode(parent)
+
+    def name(self):
+        index, = _U32.unpack_from(self.data, self.pos + 1)
+        self.pos += 5
+        return self.strings[index]
+
+    def name_count(self):
+        _, index, count = _OP_NAME_COUNT.unpack_from(self.data, self.pos)
+        self.pos += _OP_NAME_COUNT.size
+        return self.strings[index], count
+
+    def number(self):
+        tag, n = _NUMBER.unpack_from(self.data, self.pos)
+        if tag == b'f':
+            _, n = _FLOAT.unpack_from(self.data, self.pos)
+        elif tag == b'I':
+            n = int(self.strings[n])
+        self.pos += 9
+        return n
+
+    def node(self, parent):
+        name, count = self.name_count()
+        node = Node_C.__new__(Node_C)
+        d = node.__dict__
+        data = []
+        items = []
+        children = d['_NodeMixin__children'] = []
+        d['_NodeMixin__parent'] = parent
+        index = {} if count else _NO_NAMES
+        object.__setattr__(node, 'name', name)
+        object.__setattr__(node, 'data', data)
+        object.__setattr__(node, '_name_index', index)
+        for _ in range(count):
+            item = self.record(node)
+            items.append(item)
+            if type(item) is Key_C:
+                data.append(item)
+            else:
+                children.append(item)
+            index.setdefault(item.name, []).append(item)
+        object.__setattr__(node, '_ordered_items', OrderedItems(items) if items else _NO_ITEMS)
+        return node
+
+    def list_node(self, parent):
+        name, count = self.name_count()
+        lst = List_CP.__new__(List_CP)
+        lst._Value_P__name = ""
+        lst._List_CP__isNode = True
+        lst._List_CP__values = []
+        lst._List_CP__array = None
+        lst._List_CP__buffer = None
+        d = lst.__dict__
+        d['name'] = name
+        d['data'] = []
+        d['_NodeMixin__parent'] = parent
+        d['_NodeMixin__children'] = [self.record(lst) for _ in range(count)]
+        return lst
+
+    def key(self, parent):
+        name, count = self.name_count()
+        key = Key_C.__new__(Key_C)
+        if count == 1: # single value keys are the common case
+            index, = _U32.unpack_from(self.data, self.pos)
+            self.pos += 4
+            key.__setstate__((name, None, self.strings[index], self.record()))
+            return key
+        items = []
+        for _ in range(count):
+            index, = _U32.unpack_from(self.data, self.pos)
+            self.pos += 4
+            items.append((self.strings[index], self.record()))
+        key.__setstate__((name, OrderedValues(items), None, None))
+        return key
+
+    def int_p(self, parent):
+        _, index, default, minimum, maximum = _OP_NAME_INTS.unpack_from(self.data, self.pos)
+        self.pos += _OP_NAME_INTS.size
+        val = Int_P.__new__(Int_P)
+        val._Value_P__name = self.strings[index]
+        val._Int_P__default = default
+        val._Int_P__minimum = minimum
+        val._Int_P__maximum = maximum
+        return val
+
+    def int_p_numbers(self, parent):
+        val = Int_P.__new__(Int_P)
+        val._Value_P__name = self.name()
+        val._Int_P__default = self.number()
+        val._Int_P__minimum = self.number()
+        val._Int_P__maximum = self.number()
+        return val
+
+    def flt_p(self, parent):
+        _, index, flags, default, minimum, maximum = _OP_NAME_FLOATS.unpack_from(self.data, self.pos)
+        self.pos += _OP_NAME_FLOATS.size
+        val = Flt_P.__new__(Flt_P)
+        val._Value_P__name = self.strings[index]
+        val._Flt_P__default = int(default) if flags & 1 else default
+        val._Flt_P__minimum = int(minimum) if flags & 2 else minimum
+        val._Flt_P__maximum = int(maximum) if flags & 4 else maximum
+        return val
+
+    def flt_p_numbers(self, parent):
+        val = Flt_P.__new__(Flt_P)
+        val._Value_P__name = self.name()
+        val._Flt_P__default = self.number()
+        val._Flt_P__minimum = self.number()
+        val._Flt_P__maximum = self.number()
+        return val
+
+    def str_p(self, parent):
+        name, default = self.name_count()
+        val = Str_P.__new__(Str_P)
+        val._Value_P__name = name
+        val._Str_P__default = self.strings[default]
+        return val
+
+    def enm_p(self, parent):
+        _, name, default, count = _OP_NAME_STR_COUNT.unpack_from(self.data, self.pos)
+        self.pos += _OP_NAME_STR_COUNT.size
+        strings = self.strings
+        indices = struct.unpack_from(f'<{count}I', self.data, self.pos)
+        self.pos += 4 * count
+        val = Enm_P.__new__(Enm_P)
+        val._Value_P__name = strings[name]
+        val._Enm_P__items = {strings[i] for i in indices}
+        val._Enm_P__default = strings[default]
+        return val
+
+    def vector_p(self, parent):
+        val = Vector_P.__new__(Vector_P)
+        val._Value_P__name = self.name()
+        val._Vector_P__x = self.record()
+        val._Vector_P__y = self.record()
+        val._Vector_P__z = self.record()
+        return val
+
+    def tensor_p(self, parent):
+        val = Tensor_P.__new__(Tensor_P)
+        val._Value_P__name = self.name()
+        val._Tensor_P__values = [[self.record() for _ in range(3)] for _ in range(3)]
+        return val
+
+    def dim_set_p(self, parent):
+        val = Dim_Set_P.__new__(Dim_Set_P)
+        val._Value_P__name = self.name()
+        val._Dim_Set_P__Dim_Type = Dim_Type
+        val._Dim_Set_P__dimm = [self.number() for _ in range(7)]
+        return val
+
+    def list(self, parent):
+        name, count = self.name_count()
+        elems = []
+        for _ in range(count):
+            n, = _U32.unpack_from(self.data, self.pos)
+            self.pos += 4
+            elems.append([self.record() for _ in range(n)])
+        return _make_list(name, elems, None)
+
+    def array(self, parent):
+        name, dtype = self.name_count()
+        ndim = self.data[self.pos]
+        shape = struct.unpack_from(f'<{ndim}Q', self.data, self.pos + 1)
+        self.pos += 1 + 8 * ndim
+        dtype = np.dtype(self.strings[dtype])
+        count = 1
+        for n in shape:
+            count *= n
+        end = self.pos + count * dtype.itemsize
+        if end > len(self.data):
+            raise BinaryFormatError("array data is truncated")
+        arr = np.frombuffer(self.data, dtype, count, self.pos).reshape(shape).astype(dtype.newbyteorder('='))
+        self.pos = end
+        return _make_list(name, None, arr)
+
+
+def _make_list(name, elems, array):
+    lst = List_CP.__new__(List_CP)
+    lst._Value_P__name = name
+    lst._List_CP__isNode = False
+    lst._List_CP__values = elems
+    lst._List_CP__array = array
+    lst._List_CP__buffer = None
+    return lst
+
+
+def dumps(obj) -> bytes:
+    '''
+    Function to serialise a tree (or any Node_C, Key_C, List_CP or Value_P object) to bytes
+
+    Lazy_Node_C placeholders are loaded and stored with their contents.
+
+    Parameters:
+        obj: Object to be serialised
+
+    Returns:
+        bytes of the binary format
+    '''
+    encoder = _Encoder()
+    encoder.record(obj)
+
+    strings = list(encoder.strings)
+    blob = ''.join(strings).encode('utf-8', 'surrogatepass')
+    head = [_HEADER.pack(MAGIC, FORMAT_VERSION, len(strings)),
+            struct.pack(f'<{len(strings)}I', *map(len, strings)),
+            _U64.pack(len(blob)),
+            blob]
+    return b''.join(head + encoder.chunks)
+
+
+def loads(data):
+    '''
+    Function to rebuild an object serialised with dumps
+
+    Parameters:
+        data: bytes (or any buffer) produced by dumps
+
+    Returns:
+        The rebuilt object
+    '''
+    data = memoryview(data).cast('B')
+    if len(data) < _HEADER.size:
+        raise BinaryFormatError("data is too short")
+    magic, version, count = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise BinaryFormatError("wrong magic number")
+    if version != FORMAT_VERSION:
+        raise VersionError(version)
+
+    try:
+        pos = _HEADER.size
+        lengths = struct.unpack_from(f'<{count}I', data, pos)
+        pos += 4 * count
+        size, = _U64.unpack_from(data, pos)
+        pos += 8
+        text = bytes(data[pos:pos + size]).decode('utf-8', 'surrogatepass')
+        pos += size
+        ends = list(accumulate(lengths))
+        strings = [text[end - n:end] for n, end in zip(lengths, ends)]
+
+        decoder = _Decoder(data, pos, strings)
+        # the cyclic garbage collector would otherwise run over and over while the objects are created
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            obj = decoder.record()
+        finally:
+            if gc_enabled:
+                gc.enable()
+    except (struct.error, IndexError, UnicodeDecodeError, ValueError) as e:
+        raise BinaryFormatError(f"data is truncated or corrupt ({e})") from e
+    if decoder.pos != len(data):
+        raise BinaryFormatError(f"{len(data) - decoder.pos} unexpected bytes after the data")
+    return obj
+
+
+def dump(obj, file):
+    '''
+    Function to serialise an object into a binary file object (see dumps)
+    '''
+    file.write(dumps(obj))
+
+
+def load(file):
+    '''
+    Function to rebuild an object from a binary file object (see loads)
+    '''
+    return loads(file.read())
@@ -1,8 +1,10 @@
 import ply.lex as lex
 import ply.yacc as yacc
 from pyvnt.Reference.error_classes import ParserError
+from pyvnt.Converter.PlyParser.parse_cache import ParseCache
 from pyvnt.Reference.basic import *
 from pyvnt.Container.node import *
+from pyvnt.Container.lazy_node import Lazy_Node_C
 from pyvnt.Container.list import *
 from pyvnt.Container.key import *
 from pyvnt.Reference.dimension_set import *
@@ -13,6 +15,89 @@ import re
 import ast
 import os
 import yaml
+import importlib.util
+import mmap
+import warnings
+import numpy as np
+import fnmatch
+import functools
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Lexer and parser tables are generated once (see build_tables.py) and shipped
+# inside this package, so creating a parser never rebuilds the grammar or
+# writes parser.out/parsetab.py anywhere.
+_LEXTAB = f"{__package__}.lextab"
+_PARSETAB = f"{__package__}.parsetab"
+
+# Bodies of counted numeric lists, e.g. 3(1 2 3) or 2((0 0 0) (1 0 0)) or 2(4(0 1 2 3) 4(4 5 6 7))
+_SCALAR_LIST_BODY = re.compile(r'[\s0-9eE+\-.]*\)')
+_TUPLE_LIST_BODY = re.compile(r'(?:\s*(?:\d+\s*)?\([\s0-9eE+\-.]*\))*\s*\)')
+_INNER_COUNT = re.compile(r'(?<![^\s()])(\d+)\s*\(')
+_NUMERIC_BODY = re.compile(r'[\s0-9eE+\-.()]*')
+
+# Parentheses and characters that cannot appear inside a compound word like div(phi,U)
+_COMPOUND_WORD_STOP = re.compile(r'[()]|[^\w,+\-*/<>|:&%. ]')
+
+
+def _scan_numeric_list(text, pos, count):
+    """
+    Scans the body of a counted numeric list starting just after its opening parenthesis.
+
+    Args:
+        text (str): Text being lexed.
+        pos (int): Position just after the opening parenthesis.
+        count (int): Number of entries announced before the list.
+
+    Returns:
+        (array, end) with end the position after the closing parenthesis,
+        or None if the body is not a homogeneous numeric list of `count` entries.
+    """
+    match = _SCALAR_LIST_BODY.match(text, pos)
+    if match:
+        end = match.end()
+        body = text[pos:end - 1]
+        rows = 0
+    else:
+        # found with str.find rather than _TUPLE_LIST_BODY, whose repeated group takes memory in proportion to the list
+        end = _skip_counted_list(text, pos, count)
+        if end is None or _NUMERIC_BODY.match(text, pos, end).end() != end:
+            return None
+        body = text[pos:end - 1]
+        counts = _INNER_COUNT.findall(body)
+        body = _INNER_COUNT.sub('(', body)
+        rows = body.count('(')
+        if rows != count:
+            return None
+
+    integral = not any(c in body for c in '.eE')
+    dtype = np.int64 if integral and not rows else float
+    if rows:
+        # nan marks the end of every row, the rows are read as floats
+        body = body.replace('(', ' ').replace(')', ' nan ')
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        try:
+            values = np.fromstring(body, dtype=dtype, sep=' ') if body.strip() else np.empty(0, dtype)
+        except (ValueError, DeprecationWarning):
+            return None
+
+    if not rows:
+        return (values, end) if len(values) == count else None
+
+    # Every row has to hold the same number of components, so that the ends of the rows are evenly spaced
+    width, rest = divmod(len(values), rows)
+    if rest or width < 2 or not np.isnan(values[width - 1::width]).all():
+        return None
+    # the counts written in front of the rows, as in 2(4(0 1 2 3) 4(4 5 6 7)), have to match the rows
+    if counts and (np.array(counts, dtype=np.int64) != width - 1).any():
+        return None
+    values = values.reshape(rows, width)[:, :-1]
+    if integral:
+        if np.abs(values).max() >= 2 ** 53:
+            return None
+        values = values.astype(np.int64)
+    return np.ascontiguousarray(values), end
 
 
 '''
@@ -47,7 +132,9 @@ statement : WORD anylist SEMICOLON
 
 anylist : anylist sitem | sitem
 
-sitem : word | number | dimension | vector | empty
+sitem : word | number | dimension | vector | numlist | empty
+
+numlist : NUMLIST
 
 vector : LPAREN NUMBER NUMBER NUMBER RPAREN
 
@@ -67,6 +154,289 @@ Todo: Add macros and code block supports
 
 '''
 
+class _BlockList(list):
+    """
+    Accumulator for the `blocks` rule.
+
+    Keeps an insertion ordered name -> position index so that a repeated
+    keyword replaces the earlier entry (as OpenFOAM does) without rescanning
+    every previous block on each reduction.
+    """
+    __slots__ = ('_positions',)
+
+    def __init__(self, items):
+        super().__init__(items)
+        self._positions = {}
+        for i, item in enumerate(items):
+            name = getattr(item, 'name', None)
+            if name is not None:
+                self._positions.setdefault(name, i)
+
+    def add(self, item):
+        name = getattr(item, 'name', None)
+        pos = self._positions.get(name) if name is not None else None
+        if pos is None:
+            if name is not None:
+                self._positions[name] = len(self)
+            self.append(item)
+        else:
+            self[pos] = item
+
+# Tokens the prescan of parse_file(lazy=True) stops at: brackets and semicolons outside comments and strings
+_STRUCTURE = re.compile(r'//[^\n]*|/\*.*?\*/|"[^"]*"|[{}();]', re.S)
+# End of a list of rows of numbers, e.g. the last ')' of 2((0 0 0) (1 0 0))
+_ROWS_END = re.compile(r'\)\s*\)')
+# Whitespace, commas and comments in front of an entry
+_LEADING = re.compile(r'(?:[\s,]+|//[^\n]*|/\*.*?\*/)*', re.S)
+
+# The expressions of the prescan, and the same expressions over the bytes of a memory-mapped file
+_PRESCAN_PATTERNS = (_STRUCTURE, _LEADING, _SCALAR_LIST_BODY, _TUPLE_LIST_BODY, _ROWS_END)
+_PRESCAN_BYTE_PATTERNS = tuple(re.compile(p.pattern.encode(), p.flags & ~re.UNICODE) for p in _PRESCAN_PATTERNS)
+
+
+class _MappedText:
+    """
+    Memory-mapped file read like a str by the prescan and the lazy entries. Positions are byte offsets and only
+    the slices taken out of it are decoded, so the file is never copied into memory as a whole, and processes
+    reading the same file share its pages.
+    """
+    __slots__ = ('data',)
+
+    def __init__(self, data):
+        self.data = data
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.data[index].decode('utf-8')
+        return chr(self.data[index])
+
+    def find(self, sub, start=0, end=None):
+        return self.data.find(sub.encode(), start, len(self.data) if end is None else end)
+
+    def rfind(self, sub, start=0, end=None):
+        return self.data.rfind(sub.encode(), start, len(self.data) if end is None else end)
+
+    def count(self, char, start=0, end=None):
+        # mmap has no count, numpy counts a character over a view of the pages
+        end = len(self.data) if end is None else end
+        if end <= start:
+            return 0
+        return int(np.count_nonzero(np.frombuffer(self.data, np.uint8, end - start, start) == ord(char)))
+
+
+def _prescan_source(text):
+    """
+    Returns the object the expressions of the prescan run over, and the expressions.
+    """
+    if isinstance(text, _MappedText):
+        return text.data, _PRESCAN_BYTE_PATTERNS
+    return text, _PRESCAN_PATTERNS
+
+
+class _Entry:
+    """
+    Entry of a dictionary found by the prescan: its name, where its text starts and ends, and for
+    dictionaries the entries inside. kind is 'dict', 'key' or 'nodelist' (a list of dictionaries).
+    item is the object built from the entry, where it is kept (see SourceTree).
+    """
+    __slots__ = ('name', 'kind', 'start', 'end', 'entries', 'item')
+
+    def __init__(self, name, kind, start, end=None):
+        self.name = name
+        self.kind = kind
+        self.start = start
+        self.end = end
+        self.entries = [] if kind == 'dict' else None
+        self.item = None
+
+
+def _list_count(text, pos):
+    """
+    Returns the count written in front of the parenthesis at pos, as in 3(1 2 3), or None.
+    """
+    end = pos - 1
+    while end >= 0 and text[end] in ' \t\r\n':
+        end -= 1
+    start = end
+    while start >= 0 and text[start].isdigit():
+        start -= 1
+    if start == end or (start >= 0 and (text[start].isalnum() or text[start] in '_.-')):
+        return None
+    return int(text[start + 1:end + 1])
+
+
+def _skip_counted_list(text, pos, count):
+    """
+    Finds the end of a counted list of numbers or of rows of numbers with str.find and str.count, which
+    go through large fields much faster than a regular expression.
+
+    Args:
+        text (str or _MappedText): Text of the file.
+        pos (int): Position just after the opening parenthesis.
+        count (int): Number of entries announced before the list.
+
+    Returns:
+        The position after the closing parenthesis, or None if the list is not of that simple shape.
+    """
+    end = text.find(')', pos)
+    if end < 0:
+        return None
+    if text.find('(', pos, end) >= 0:
+        # rows of numbers: the list ends at the first ')' that follows the ')' of a row
+        source, patterns = _prescan_source(text)
+        match = patterns[4].search(source, pos)
+        if match is None:
+            return None
+        end = match.end() - 1
+        rows = text.count('(', pos, end)
+        if rows != count or text.count(')', pos, end) != rows:
+            return None
+    for char in '{};"/':
+        if text.find(char, pos, end) >= 0:
+            return None
+    return end + 1
+
+
+# Type of the item parsed out of each kind of entry
+_ENTRY_TYPES = {'dict': Node_C, 'key': Key_C, 'nodelist': List_CP}
+
+
+def _map_file(path):
+    """
+    Maps a file into memory for reading, None for an empty file, which cannot be mapped.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _line_column(text, pos):
+    line_start = text.rfind('\n', 0, pos) + 1
+    return text.count('\n', 0, line_start) + 1, pos - line_start + 1
+
+
+def _prescan(text, lexer, pos=0, endpos=None):
+    """
+    Finds the entries of every dictionary of a file in one pass, balancing the brackets without
+    building any object. Counted numeric lists are skipped over at once.
+
+    Args:
+        text (str or _MappedText): Text of the file.
+        lexer: Lexer reading the names of the entries.
+        pos (int): Where the scanned part of the text starts. Defaults to 0.
+        endpos (int): Where the scanned part of the text ends. Defaults to None (the end of the text).
+
+    Returns:
+        List of the _Entry objects at the top level of the file.
+    """
+    if endpos is None:
+        endpos = len(text)
+    source, (structure, leading, scalar_body, tuple_body, _) = _prescan_source(text)
+
+    def entry_start(start, end):
+        start = leading.match(source, start, endpos).end()
+        return start if start < end else None
+
+    def entry_name(start):
+        # the name is lexed out of a window of the text, widened if the name may go past it
+        size = 256
+        while True:
+            end = min(start + size, endpos)
+            if source is not text:
+                # the bytes of a memory-mapped file are decoded, so the window may not end inside a character
+                while end < endpos and source[end] & 0xC0 == 0x80:
+                    end -= 1
+            window = text[start:end]
+            lexer.input(window)
+            try:
+                token = lexer.token()
+            except ParserError:
+                token = None
+            if (token is None or lexer.lexpos >= len(window)) and start + size < endpos:
+                size *= 16
+                continue
+            if token is None or token.type != 'WORD':
+                raise ParserError("Expected a keyword", *_line_column(text, start))
+            # lexpos counts characters of the window, the positions of a memory-mapped file are bytes
+            length = lexer.lexpos if source is text else len(window[:lexer.lexpos].encode('utf-8'))
+            return token.value, start + length
+
+    def error(message, pos):
+        raise ParserError(message, *_line_column(text, pos))
+
+    root = []
+    levels = [root]     # entries of the dictionaries the scan is in
+    opened = []         # dictionaries the scan is in
+    nested = []         # closing brackets expected inside the current entry
+    nodelist = False    # whether the current entry holds dictionaries inside parentheses
+    start = pos         # where the current entry starts
+    search = structure.search
+    while True:
+        match = search(source, pos, endpos)
+        if match is None:
+            break
+        char = text[match.start()]
+        pos = match.end()
+        if char == '(':
+            count = _list_count(text, match.start())
+            end = _skip_counted_list(text, pos, count) if count is not None else None
+            if end is None:
+                body = scalar_body.match(source, pos, endpos) or tuple_body.match(source, pos, endpos)
+                end = body.end() if body else None
+            if end is not None:
+                pos = end
+            else:
+                nested.append(')')
+        elif char == '{':
+            if nested:
+                nested.append('}')
+                nodelist = True
+            else:
+                name_start = entry_start(start, match.start())
+                if name_start is None:
+                    error("Dictionary without a keyword", match.start())
+                name, name_end = entry_name(name_start)
+                # only whitespace and comments may come between the name and the bracket
+                if leading.match(source, name_end, match.start()).end() != match.start():
+                    error("Expected '{' after the keyword", name_end)
+                entry = _Entry(name, 'dict', name_start)
+                levels[-1].append(entry)
+                levels.append(entry.entries)
+                opened.append(entry)
+                start = pos
+        elif char == ')' or char == '}':
+            if nested:
+                if nested.pop() != char:
+                    error(f"Unbalanced '{char}'", match.start())
+            elif char == '}' and opened:
+                if entry_start(start, match.start()) is not None:
+                    error("Entry without a ';'", match.start())
+                if not opened[-1].entries:
+                    error(f"Empty dictionary '{opened[-1].name}'", match.start())
+                opened.pop().end = pos
+                levels.pop()
+                start = pos
+            else:
+                error(f"Unbalanced '{char}'", match.start())
+        elif char == ';' and not nested:
+            name_start = entry_start(start, match.start())
+            if name_start is None:
+                error("Entry without a keyword", match.start())
+            levels[-1].append(_Entry(entry_name(name_start)[0], 'nodelist' if nodelist else 'key', name_start, pos))
+            nodelist = False
+            start = pos
+
+    if nested or opened or pos > endpos:
+        raise ParserError("Unexpected end of file (EOF).")
+    if entry_start(start, endpos) is not None:
+        error("Entry without a ';'", endpos)
+    return root
+
+
 class _OpenFoamParserInternalText:
 
     # Basic Tokens 
@@ -81,7 +451,8 @@ class _OpenFoamParserInternalText:
                 'LPAREN',
                 'RPAREN',
                 'LSQUABRAC',
-                'RSQUABRAC'
+                'RSQUABRAC',
+                'NUMLIST'
                 )
 
     t_LBRACE = r'\{'
@@ -95,9 +466,40 @@ class _OpenFoamParserInternalText:
     t_RSQUABRAC=r'\]'
     t_ignore = ' \t,'
 
+    # Shared by every instance, built on first use
+    _lexer = None
+    _parser = None
+
     def __init__(self):
-        self.lexer = lex.lex(module=self)
-        self.parser = yacc.yacc(module=self)
+        cls = type(self)
+        if cls._parser is None:
+            cls._lexer, cls._parser = self.build()
+        self.lexer = cls._lexer.clone()
+        self.parser = cls._parser
+
+    def build(self, write_tables: bool = False, outputdir: str = None):
+        """
+        Builds the lexer and the LALR parser from the shipped tables.
+
+        Args:
+            write_tables (bool): Regenerate the table modules instead of loading them.
+            outputdir (str): Directory to write the regenerated tables into.
+
+        Returns:
+            (lexer, parser) tuple.
+        """
+        if write_tables:
+            lexer = lex.lex(module=self)
+            lexer.writetab(_LEXTAB, outputdir or os.path.dirname(__file__))
+            parser = yacc.yacc(module=self, tabmodule=_PARSETAB, outputdir=outputdir, debug=False)
+            return lexer, parser
+
+        # lex only reads tables in optimize mode, and would write them if missing
+        has_lextab = importlib.util.find_spec(_LEXTAB) is not None
+        lexer = lex.lex(module=self, optimize=has_lextab, lextab=_LEXTAB)
+        parser = yacc.yacc(module=self, tabmodule=_PARSETAB, write_tables=False,
+                           debug=False, errorlog=yacc.NullLogger())
+        return lexer, parser
 
     def t_newline(self,t):
         r'\n+'
@@ -113,9 +515,8 @@ class _OpenFoamParserInternalText:
         t.lexer.lineno+=1
         pass
 
-    # TODO: Find Better approch for t_WORD (like we can make ast but its too over cooked)
     def t_WORD(self,t):
-        r'"[^"]*"|[a-zA-Z_][a-zA-Z0-9_]*'
+        r'"[^"]*"|[a-zA-Z_][a-zA-Z0-9_]*(?:<[a-zA-Z0-9_]+>)?'
 
         if t.value.startswith('"') and t.value.endswith('"'):
             t.value = t.value[1:-1].strip()
@@ -128,45 +529,62 @@ class _OpenFoamParserInternalText:
         # Check if the character immediately after the word is an opening parenthesis
         if current_pos_after_word < len(input_stream) and input_stream[current_pos_after_word] == '(':
             paren_balance = 1
-            manual_pos = current_pos_after_word + 1
-            consumed_string = word_part + '('
 
-            # Manually scan forward until parentheses are balanced 
-            while manual_pos < len(input_stream) and paren_balance > 0:
-                char = input_stream[manual_pos]
-                consumed_string += char
+            # Jump from one parenthesis (or character not allowed inside) to the next
+            # until the parentheses are balanced, then slice the whole token once
+            for stop in _COMPOUND_WORD_STOP.finditer(input_stream, current_pos_after_word + 1):
+                char = stop.group()
                 if char == '(':
                     paren_balance += 1
                 elif char == ')':
                     paren_balance -= 1
-
-                # Check for allowed character 
-                allowed_inside = ",()_+-*/<>|:&%. " 
-
-                if not (char.isalnum() or char in allowed_inside):
+                    if paren_balance == 0:
+                        # Successfully found balanced parentheses
+                        t.value = input_stream[t.lexpos:stop.end()]
+                        t.lexer.lexpos = stop.end() # Advance lexer position past the entire match
+                        return t
+                else:
                      # Found a character not allowed inside
-                     print(f"Warning: Invalid character '{char}' found inside potential complex token at {t.lineno}:{self.get_column(input_stream, manual_pos)}.")
+                     print(f"Warning: Invalid character '{char}' found inside potential complex token at {t.lineno}:{self.get_column(input_stream, stop.start())}.")
                      t.value = word_part
                      t.lexer.lexpos = current_pos_after_word # Set lexer position after the simple word
                      return t
 
-                manual_pos += 1 # Move to the next character
-                
-            if paren_balance == 0:
-                # Successfully found balanced parentheses
-                t.value = consumed_string
-                t.lexer.lexpos = manual_pos # Advance lexer position past the entire match
-                return t
-            else:
-                 # Loop finished, but parentheses are NOT balanced
-                 t.value = word_part
-                 t.lexer.lexpos = current_pos_after_word
-                 raise ParserError("Unbalanced parentheses",t.lineno,t.lexpos - len(word_part))
+            # Reached the end of input, but parentheses are NOT balanced
+            t.value = word_part
+            t.lexer.lexpos = current_pos_after_word
+            raise ParserError("Unbalanced parentheses",t.lineno,self.get_column(input_stream, t.lexpos))
 
         else:
             t.value = word_part
             return t
 
+    def t_NUMLIST(self,t):
+        r'\d+[ \t\r\n]*\('
+        # Counted numeric lists (points, faces, nonuniform fields) are scanned in one
+        # pass into a numpy array instead of one token and one Value_P per number
+        digits = re.match(r'\d+', t.value).group()
+        text = t.lexer.lexdata
+
+        # Numbers in front of the count make it an argument (e.g. blockMesh edges: arc 0 1 (...))
+        prev = t.lexpos - 1
+        while prev >= 0 and text[prev] in ' \t\r\n':
+            prev -= 1
+        scanned = None
+        if prev < 0 or not (text[prev].isdigit() or text[prev] == '.'):
+            scanned = _scan_numeric_list(text, t.lexer.lexpos, int(digits))
+
+        if scanned is None:
+            t.type = 'NUMBER'
+            t.value = int(digits)
+            t.lexer.lexpos = t.lexpos + len(digits)
+            return t
+
+        t.value, end = scanned
+        t.lexer.lineno += text.count('\n', t.lexpos, end)
+        t.lexer.lexpos = end
+        return t
+
     def t_NUMBER(self,t):
         r'-?\d+(\.\d+)?([eE][-+]?\d+)?'
         t.value = float(t.value) if '.' in t.value or 'e' in t.value else int(t.value)
@@ -204,39 +622,13 @@ class _OpenFoamParserInternalText:
         '''blocks : blocks block
                 | block'''
         
-        # Here p[1] is list and p[2] is object 
+        # Here p[1] is _BlockList and p[2] is object 
 
         if len(p) == 3:
-            isDuplicate = False  # To check for a duplicate key
-            for i, item in enumerate(p[1]):
-                    if item.name == p[2].name:
-                        p[1][i] = p[2]  # Replace old value with new one
-                        isDuplicate = True
-                        break
-            if not isDuplicate:
-                p[0] = p[1] + [p[2]]
-            else:
-                p[0] = p[1]  # Ensure p[0] is assigned
-
+            p[1].add(p[2])  # Duplicate keys replace the old value in place
+            p[0] = p[1]
         else:
-            p[0] = [p[1]] if p[1] is not None else [[]]
-        
-        
-        # if len(p) == 3:
-        #     isDuplicate=False # to check the duplicate key
-        #     print(isinstance(p[1],list))
-
-        #     if isinstance(p[2],Key_C):
-        #         for i,item in enumerate(p[1]):
-        #             print(p[2].name)
-        #             if item.name == p[2].name:
-        #                 p[1][i] = p[2]  # Replace old value with new one
-        #                 isDuplicate=True
-        #                 break
-        #     if isDuplicate==False:
-        #         p[0] = p[1] + [p[2]]
-        # else:
-        #     p[0] = [p[1]] if p[1] is not None else [[]]
+            p[0] = _BlockList([p[1]] if p[1] is not None else [[]])
 
     def p_block(self,p):
         '''block : dictionary
@@ -368,10 +760,17 @@ class _OpenFoamParserInternalText:
             | number
             | dimension
             | vector
+            | numlist
             | empty
         '''
         p[0]=p[1]
 
+    def p_numlist(self,p):
+        '''
+        numlist : NUMLIST
+        '''
+        p[0]=List_CP("value",array=p[1])
+
     def p_word(self,p):
         '''
         word : WORD
@@ -420,7 +819,7 @@ class _OpenFoamParserInternalText:
             lexer: Optional lexer object to extract more details.
         """
         if p:
-            column = self.get_column(self.lexer.lexdata, p.lexpos) if self.lexer else None
+            column = self.get_column(p.lexer.lexdata, p.lexpos)
             error = ParserError(
                 f"Unexpected token '{p.value}' of type '{p.type}'",
                 lineno=p.lineno,
@@ -441,7 +840,13 @@ class _OpenFoamParserInternalText:
         Returns:
             The parsed object(Node_C).
         """
-        return self.parser.parse(text, lexer=self.lexer)
+        self.lexer.lineno = 1
+        try:
+            return self.parser.parse(text, lexer=self.lexer)
+        finally:
+            # the lexer (and its last match) would otherwise hold on to the text until the next parse
+            self.lexer.input('')
+            self.lexer.lexmatch = None
 
 class _OpenFoamParserInternalYaml:
     """
@@ -642,18 +1047,100 @@ class OpenFoamParser:
     Main class for parsing OpenFOAM files and directories.
     Provides methods to parse individual files or entire case directories.
     """
-    def __init__(self):
+    def __init__(self,cache :ParseCache=None):
+        """
+        Args:
+            cache (ParseCache): On-disk cache of parsed trees used by parse_file. Defaults to None (no caching).
+        """
         self._parseInternalText=_OpenFoamParserInternalText()
         self._parseInternalYaml=_OpenFoamParserInternalYaml()
+        self.cache=cache
+
+    def _parse_text(self,text :str):
+        """
+        Parses OpenFOAM dictionary text, going through the cache when there is one.
+        """
+        if self.cache is None:
+            return self._parseInternalText.parse(text)
+        key=self.cache.key(text)
+        parsed=self.cache.get(key)
+        if parsed is None:
+            parsed=self._parseInternalText.parse(text)
+            self.cache.put(key,parsed)
+        return parsed
+
+    def _parse_prescanned(self,text,lazy :bool=True):
+        """
+        Parses OpenFOAM dictionary text one entry at a time: the text is prescanned for the entries of every
+        dictionary, and each entry is parsed from its part of the text, right away or (lazy) the first time
+        it is accessed.
+
+        Args:
+            text (str or _MappedText): Text of the file, or the memory-mapped file.
+            lazy (bool): Build the dictionaries and keys when they are accessed. Defaults to True.
+        """
+        return self._build_level(text,"root",_prescan(text,self._parseInternalText.lexer.clone()),lazy)
 
-    def parse_file(self,text :str=None,fileType :str='txt',path:str=None):
+    def _build_level(self,text,name :str,entries :list,lazy :bool=True):
+        """
+        Builds a node with the entries found by the prescan, parsed or as Lazy_Node_C and Lazy_Key_C placeholders.
+        """
+        items=_BlockList([]) # Duplicate keys replace the old value in place
+        for entry in entries:
+            if not lazy:
+                items.add(self._parse_entry(text,entry))
+            elif entry.kind=='dict':
+                items.add(Lazy_Node_C(entry.name,functools.partial(self._build_level,text,entry.name,entry.entries)))
+            elif entry.kind=='key':
+                items.add(Lazy_Key_C(entry.name,functools.partial(self._parse_entry,text,entry)))
+            else: # lists of dictionaries are children of the node, so they are built right away
+                items.add(self._parse_entry(text,entry))
+        node=Node_C(name)
+        for item in items:
+            if isinstance(item,Key_C):
+                node.add_data(item)
+            else:
+                node.add_child(item)
+        return node
+
+    def _parse_entry(self,text,entry :_Entry):
+        """
+        Parses the text of a single entry found by the prescan.
+        """
+        try:
+            parsed=self._parseInternalText.parse(text[entry.start:entry.end])
+        except ParserError as e:
+            # report the position in the whole file rather than in the entry
+            if e.lineno is not None:
+                line,column=_line_column(text,entry.start)
+                if e.lineno==1 and e.column is not None:
+                    e.column+=column-1
+                e.lineno+=line-1
+            raise
+        items=parsed.get_ordered_items()
+        if len(items)!=1 or not isinstance(items[0],_ENTRY_TYPES[entry.kind]):
+            raise ParserError(f"Could not read the entry '{entry.name}'",*_line_column(text,entry.start))
+        return items[0]
+
+    def parse_file(self,text :str=None,fileType :str='txt',path:str=None,lazy :bool=False,memory_map :bool=False):
         """
         Parses an OpenFOAM file and returns the resulting object.
 
+        With lazy, the text is only prescanned for where its dictionaries and keys are, and each of them is built
+        the first time it is accessed (see Lazy_Node_C and Lazy_Key_C), so reading a few keys of a large file
+        does not parse the rest of it. Syntax errors inside an entry are raised when the entry is accessed.
+
+        With memory_map, a text file is mapped into memory instead of being read into a string, and each entry
+        is decoded and parsed from its own part of the map. The whole text is never held in memory, and
+        processes parsing the same file share its pages. A lazy tree keeps the file mapped until all its
+        entries are built.
+
         Args:
             text (str): The input text to parse. Defaults to None.
             fileType (str): The type of file ('txt' or 'yaml'). Defaults to 'txt'.
             path (str): The path to the file. Defaults to None.
+            lazy (bool): Build the tree as it is accessed, for text files only (the cache is not used). Defaults to False.
+            memory_map (bool): Parse a text file given by path from a memory map (the cache is not used). Defaults to False.
 
         Returns:
             The parsed object structure(Node tree) or None if the file is invalid.
@@ -661,14 +1148,24 @@ class OpenFoamParser:
         if path!=None:
             filename=os.path.basename(path)
             filename_root, ext = os.path.splitext(filename)
+            mapped=None
             if os.path.isfile(path):
-                with open(path, 'r') as tF:
-                    text = tF.read()
+                if memory_map and ext in ('','.txt'):
+                    mapped=_map_file(path)
+                if mapped is None:
+                    with open(path, 'r') as tF:
+                        text = tF.read()
             else:
                 print("Path does not to file")
                 return None
-            if ext in ('','.txt'):
-                parsed=self._parseInternalText.parse(text)
+            if mapped is not None:
+                try:
+                    parsed=self._parse_prescanned(_MappedText(mapped),lazy)
+                finally:
+                    if not lazy: # the entries of a lazy tree are read from the map when they are accessed
+                        mapped.close()
+            elif ext in ('','.txt'):
+                parsed=self._parse_prescanned(text) if lazy else self._parse_text(text)
             elif ext=='.yaml':
                 parsed=self._parseInternalYaml.parseYaml(text)
             parsed.name=filename_root
@@ -676,34 +1173,86 @@ class OpenFoamParser:
             if text==None:
                 print("Please enter filetype")
             if fileType=='txt':
-                parsed=self._parseInternalText.parse(text)
+                parsed=self._parse_prescanned(text) if lazy else self._parse_text(text)
             elif fileType=='yaml':
                 parsed=self._parseInternalYaml.parseYaml(text)
             else:
                 print("This File Formate supported")
         return parsed
 
-    def parse_case(self,path :str):
+    def parse_case(self,path :str,workers :int=None,include :list=None,exclude :list=None,max_depth :int=None,
+                   memory_map :bool=False):
         """
         Parse OpenFoam Case File and return the entire case tree.
+
+        Files are selected with glob patterns matched against their path relative to the case,
+        using '/' as separator (e.g. 'system/*' or 'constant/*Properties'). Files that are not
+        selected, and binary files, are added as Lazy_Node_C placeholders that are parsed the
+        first time their contents are accessed.
         
         Args:
             path (str): Path to the Case File Or a single
+            workers (int): Number of processes used to parse the files. Defaults to None (parse in this process).
+            include (list): Glob patterns of the files to parse. Defaults to None (all files).
+            exclude (list): Glob patterns of the files not to parse. Defaults to None.
+            max_depth (int): Deepest folder level walked, 0 being the case folder itself. Defaults to None (no limit).
+            memory_map (bool): Parse the files from memory maps, see parse_file. Defaults to False.
             
         Returns:
             The parsed node object 
         """
         masterNode = Node_C(os.path.basename(os.path.normpath(path)))
-        for filename in os.listdir(path):
+        entries = []
+        self._collect_case(path, masterNode, entries, '', 0, include, exclude, max_depth, memory_map)
+        files = [item for _, item in entries if isinstance(item, str)]
+
+        if workers is not None and workers > 1 and len(files) > 1:
+            chunksize = max(1, len(files) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_case_worker,
+                                     initargs=(self.cache,)) as executor:
+                parsed = list(executor.map(functools.partial(_parse_case_file, memory_map=memory_map), files,
+                                           chunksize=chunksize))
+        else:
+            parsed = [self.parse_file(path=file_path, memory_map=memory_map) for file_path in files]
+
+        # children are attached in directory order whatever order the files finished in
+        parsed = iter(parsed)
+        for parentNode, item in entries:
+            if isinstance(item, str):
+                filnode = next(parsed)
+                filnode.name = os.path.basename(item)
+                filnode.source = item # marks the node as a file of the case, like the Lazy_Node_C placeholders
+                parentNode.add_child(filnode)
+            else:
+                parentNode.add_child(item)
+        return masterNode
+
+    def _collect_case(self, path, parentNode, entries, relpath, depth, include, exclude, max_depth, memory_map):
+        """
+        Walks a case directory in sorted order, creating the folder and placeholder nodes and recording
+        (parent node, node or path of a file to parse) pairs in the order they are attached.
+        """
+        for filename in sorted(os.listdir(path)):
             file_path = os.path.join(path, filename)
+            file_relpath = relpath + filename
             if os.path.isdir(file_path):  # If it's a folder, process it recursively
-                folderNode = self.parse_case(file_path)
-                masterNode.add_child(folderNode)
-            elif os.path.isfile(file_path):  # If it's a file, process it
-                filnode = self.parse_file(path=file_path)
-                filnode.name=filename
-                masterNode.add_child(filnode)
-        return masterNode
+                if max_depth is not None and depth >= max_depth:
+                    continue
+                folderNode = Node_C(filename)
+                entries.append((parentNode, folderNode))
+                self._collect_case(file_path, folderNode, entries, file_relpath + '/', depth + 1,
+                                   include, exclude, max_depth, memory_map)
+            elif os.path.isfile(file_path):  # If it's a file, it is parsed afterwards or on first access
+                selected = (include is None or any(fnmatch.fnmatchcase(file_relpath, p) for p in include)) \
+                    and not (exclude and any(fnmatch.fnmatchcase(file_relpath, p) for p in exclude))
+                if _is_binary_file(file_path):
+                    loader = functools.partial(_binary_file_error, file_path)
+                elif not selected:
+                    loader = functools.partial(self.parse_file, path=file_path, memory_map=memory_map)
+                else:
+                    entries.append((parentNode, file_path))
+                    continue
+                entries.append((parentNode, Lazy_Node_C(filename, loader, source=file_path)))
 
     def get_value(self,node:Node_C,*keys):
         """
@@ -720,7 +1269,16 @@ class OpenFoamParser:
         for key in keys:
             found = False  # Flag to check if key is found
             datas=None
-            if (isinstance(result,(Key_C, Node_C))):
+            if isinstance(result,Node_C):
+                # keys first, then children, each found through the name index of the node
+                found_item=result.get_key(key)
+                if found_item is None:
+                    found_item=result.get_child(key)
+                if found_item is None:
+                    return None
+                result=found_item
+                continue
+            elif isinstance(result,Key_C):
                 datas=result.get_data() + [result.get_child(key)]
             elif isinstance(result,List_CP):
                 datas=result.get_elems() + list(result.children)
@@ -736,3 +1294,36 @@ class OpenFoamParser:
             if not found:
                 return None  # Return None if any key in the Parsed Tree is not found
         return result
+
+
+def _is_binary_file(file_path, size=8192):
+    """
+    Binary OpenFOAM files (format binary, compressed fields, meshes) contain NUL bytes or are not text.
+    """
+    with open(file_path, 'rb') as f:
+        head = f.read(size)
+    if b'\0' in head:
+        return True
+    try:
+        head.decode('utf-8')
+    except UnicodeDecodeError as e:
+        # a multi-byte character may be cut at the end of the chunk
+        return e.start < len(head) - 3
+    return False
+
+
+def _binary_file_error(file_path):
+    raise ParserError(f"{file_path} is a binary file and cannot be parsed")
+
+
+# Parser of a parse_case worker process, created once by the pool initializer
+_case_parser = None
+
+
+def _init_case_worker(cache):
+    global _case_parser
+    _case_parser = OpenFoamParser(cache)
+
+
+def _parse_case_file(file_path, memory_map=False):
+    return _case_parser.parse_file(path=file_path, memory_map=memory_map)
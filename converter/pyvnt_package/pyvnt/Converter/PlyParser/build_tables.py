@@ -0,0 +1,34 @@
+'''
+Regenerates the lexer (lextab.py) and parser (parsetab.py) tables that are
+shipped with this package.
+
+Run this after changing any token or grammar rule in Parser.py:
+
+    python -m pyvnt.Converter.PlyParser.build_tables
+'''
+
+import os
+import sys
+from pyvnt.Converter.PlyParser.Parser import _OpenFoamParserInternalText
+
+
+def build_tables(outputdir: str = None):
+    '''
+    Writes fresh lextab.py and parsetab.py into outputdir (defaults to this package).
+    '''
+    if outputdir is None:
+        outputdir = os.path.dirname(os.path.abspath(__file__))
+
+    # Stale tables would otherwise be loaded instead of regenerated
+    for tab in ('lextab', 'parsetab'):
+        tab_path = os.path.join(outputdir, f"{tab}.py")
+        if os.path.exists(tab_path):
+            os.remove(tab_path)
+        sys.modules.pop(f"{__package__}.{tab}", None)
+
+    builder = object.__new__(_OpenFoamParserInternalText)
+    builder.build(write_tables=True, outputdir=outputdir)
+
+
+if __name__ == '__main__':
+    build_tables(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,10 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('COMMA', 'DOLLAR', 'LBRACE', 'LPAREN', 'LSQUABRAC', 'NUMBER', 'NUMLIST', 'RBRACE', 'RPAREN', 'RSQUABRAC', 'SEMICOLON', 'WORD'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_newline>\\n+)|(?P<t_comm>/\\*(.|\\n)*?\\*/)|(?P<t_comments>\\//.*\\n)|(?P<t_WORD>"[^"]*"|[a-zA-Z_][a-zA-Z0-9_]*(?:<[a-zA-Z0-9_]+>)?)|(?P<t_NUMLIST>\\d+[ \\t\\r\\n]*\\()|(?P<t_NUMBER>-?\\d+(\\.\\d+)?([eE][-+]?\\d+)?)|(?P<t_DOLLAR>\\$)|(?P<t_LBRACE>\\{)|(?P<t_LPAREN>\\()|(?P<t_LSQUABRAC>\\[)|(?P<t_RBRACE>\\})|(?P<t_RPAREN>\\))|(?P<t_RSQUABRAC>\\])|(?P<t_COMMA>,)|(?P<t_SEMICOLON>;)', [None, ('t_newline', 'newline'), ('t_comm', 'comm'), None, ('t_comments', 'comments'), ('t_WORD', 'WORD'), ('t_NUMLIST', 'NUMLIST'), ('t_NUMBER', 'NUMBER'), None, None, (None, 'DOLLAR'), (None, 'LBRACE'), (None, 'LPAREN'), (None, 'LSQUABRAC'), (None, 'RBRACE'), (None, 'RPAREN'), (None, 'RSQUABRAC'), (None, 'COMMA'), (None, 'SEMICOLON')])]}
+_lexstateignore = {'INITIAL': ' \t,'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
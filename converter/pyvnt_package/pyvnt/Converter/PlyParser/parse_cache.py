@@ -0,0 +1,174 @@
+'''
+On-disk cache of parsed OpenFOAM dictionaries.
+
+Entries are keyed by the sha256 of the parser version and the text being parsed, so an
+unchanged file is never parsed twice and any change to the grammar, the parser or the tree
+classes invalidates every entry. The cache directory is bounded in size, evicting the least
+recently used entries first. Trees are stored in the pyvnt binary format.
+'''
+
+import functools
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from pyvnt.Converter.Binary.binary import dump, load
+
+
+_ENTRY_SUFFIX = '.tree'
+
+
+@functools.lru_cache(maxsize=None)
+def parser_version() -> str:
+    '''
+    Hash of everything that decides the tree produced for a given text: the shipped parser
+    tables, the parser module and the tree classes (Container and Reference packages).
+    '''
+    parser_dir = os.path.dirname(os.path.abspath(__file__))
+    pyvnt_dir = os.path.dirname(os.path.dirname(parser_dir))
+    sources = [os.path.join(parser_dir, f) for f in ('Parser.py', 'lextab.py', 'parsetab.py')]
+    for package in ('Container', 'Reference'):
+        package_dir = os.path.join(pyvnt_dir, package)
+        sources += [os.path.join(package_dir, f) for f in sorted(os.listdir(package_dir)) if f.endswith('.py')]
+
+    digest = hashlib.sha256()
+    for source in sources:
+        with open(source, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class ParseCache:
+    '''
+    Size bounded, least recently used cache of parsed trees stored in a directory
+
+    Contructor Parameters:
+        directory: Folder holding the cache entries, created if it does not exist
+        max_bytes: Maximum total size of the entries (Optional, defaults to 256 MB)
+    '''
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+        # key -> entry size, least recently used first
+        self._entries = OrderedDict()
+        self._size = 0
+        found = []
+        for filename in os.listdir(directory):
+            if filename.endswith(_ENTRY_SUFFIX):
+                stat = os.stat(os.path.join(directory, filename))
+                found.append((stat.st_mtime, filename[:-len(_ENTRY_SUFFIX)], stat.st_size))
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._size += size
+
+    def __getstate__(self):
+        # worker processes get their own view of the directory
+        return {'directory': self.directory, 'max_bytes': self.max_bytes}
+
+    def __setstate__(self, state):
+        self.__init__(state['directory'], state['max_bytes'])
+
+    def key(self, text: str, kind: str = 'txt') -> str:
+        '''
+        Function to get the cache key of a text parsed as the given kind of file
+        '''
+        digest = hashlib.sha256()
+        digest.update(parser_version().encode())
+        digest.update(kind.encode())
+        digest.update(text.encode('utf-8', 'surrogatepass'))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + _ENTRY_SUFFIX)
+
+    def get(self, key: str):
+        '''
+        Function to get the tree stored for a key, or None if there is no usable entry
+        '''
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                tree = load(f)
+        except FileNotFoundError:
+            self._forget(key)
+        except Exception:
+            # unreadable entry (e.g. written by an interrupted process), parse again
+            self._forget(key)
+            self._remove(path)
+        else:
+            self.hits += 1
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            else: # written by another process
+                self._entries[key] = os.path.getsize(path)
+                self._size += self._entries[key]
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            return tree
+        self.misses += 1
+        return None
+
+    def put(self, key: str, tree):
+        '''
+        Function to store the tree parsed for a key, evicting the least recently used entries if needed
+        '''
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                dump(tree, f)
+            size = os.path.getsize(tmp_path)
+            if size > self.max_bytes:
+                self._remove(tmp_path)
+                return
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+
+        self._forget(key)
+        self._entries[key] = size
+        self._size += size
+        while self._size > self.max_bytes:
+            old_key = next(iter(self._entries))
+            self._forget(old_key)
+            self._remove(self._path(old_key))
+
+    def clear(self):
+        '''
+        Function to remove every entry of the cache
+        '''
+        for key in list(self._entries):
+            self._remove(self._path(key))
+        self._entries.clear()
+        self._size = 0
+
+    def stats(self) -> dict:
+        '''
+        Function to get the hit and miss counters and the current size of the cache
+        '''
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries), 'bytes': self._size}
+
+    def _forget(self, key):
+        size = self._entries.pop(key, None)
+        if size is not None:
+            self._size -= size
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"ParseCache(directory : {self.directory}, entries : {len(self._entries)}, hits : {self.hits}, misses : {self.misses})"
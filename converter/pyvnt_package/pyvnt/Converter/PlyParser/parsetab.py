@@ -0,0 +1,67 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'COMMA DOLLAR LBRACE LPAREN LSQUABRAC NUMBER NUMLIST RBRACE RPAREN RSQUABRAC SEMICOLON WORDfile : blocksblocks : blocks block\n                | blockblock : dictionary\n                | listblock\n                | statement\n                | hexEdge_items\n                | coordlists\n                | emptylistblock : WORD LPAREN blocks RPAREN SEMICOLONcoordlists : coordlists coodlist\n                    | coodlist\n        \n        coodlist : LPAREN anylist RPAREN\n        hexEdge_items : hexEdge_items hexEdge_item\n                        | hexEdge_item\n        hexEdge_item : hex_item \n                        | edge_itemhex_item : WORD LPAREN NUMBER NUMBER NUMBER NUMBER NUMBER NUMBER NUMBER NUMBER RPAREN LPAREN NUMBER NUMBER NUMBER RPAREN word gradlistedge_item : WORD number number gradlistgradlist : coodlist \n                    | LPAREN coordlists RPAREN\n        dictionary : WORD LBRACE blocks RBRACEstatement : WORD anylist SEMICOLONanylist : anylist sitem\n                | sitem\n        sitem : word\n            | number\n            | dimension\n            | vector\n            | numlist\n            | empty\n        \n        numlist : NUMLIST\n        \n        word : WORD\n        \n        number : NUMBER\n        \n        vector : LPAREN NUMBER NUMBER NUMBER RPAREN\n        \n        dimension : LSQUABRAC NUMBER NUMBER NUMBER NUMBER NUMBER NUMBER NUMBER RSQUABRAC \n        empty :'
+    
+_lr_action_items = {'WORD':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,22,23,24,25,26,27,28,29,30,31,33,35,36,39,40,42,43,47,49,52,53,54,58,60,66,67,68,77,83,85,],[10,10,-3,-4,-5,-6,18,-8,-9,20,20,-15,-12,-16,-17,-2,-14,-11,-33,10,10,20,-34,-26,-27,-25,-28,-29,-30,-31,-32,20,-27,10,10,-23,-24,-13,-22,-19,-20,20,-10,20,-35,-34,-21,-36,20,-18,]),'LPAREN':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,33,35,36,39,40,42,43,44,47,49,52,53,54,58,60,61,66,67,68,77,78,84,85,],[11,11,-3,-4,-5,-6,-7,11,-9,22,34,-15,-12,-16,-17,-2,-14,37,-11,-33,11,11,34,-34,-26,-27,-25,-28,-29,-30,-31,-32,34,-27,11,11,-23,-24,54,-13,-22,-19,-20,60,-10,34,11,-35,-34,-21,-36,79,54,-18,]),'$end':([0,1,2,3,4,5,6,7,8,9,12,13,14,15,16,17,19,42,47,49,52,53,58,68,85,],[-37,0,-1,-3,-4,-5,-6,-7,-8,-9,-15,-12,-16,-17,-2,-14,-11,-23,-13,-22,-19,-20,-10,-21,-18,]),'RBRACE':([3,4,5,6,7,8,9,12,13,14,15,16,17,19,21,39,42,47,49,52,53,58,68,85,],[-3,-4,-5,-6,-7,-8,-9,-15,-12,-16,-17,-2,-14,-11,-37,49,-23,-13,-22,-19,-20,-10,-21,-18,]),'RPAREN':([3,4,5,6,7,8,9,11,12,13,14,15,16,17,19,20,22,24,25,27,28,29,30,31,33,35,36,40,42,43,47,49,52,53,54,58,59,60,61,63,66,67,68,76,77,82,85,],[-3,-4,-5,-6,-7,-8,-9,-37,-15,-12,-16,-17,-2,-14,-11,-33,-37,-34,-26,-25,-28,-29,-30,-31,-32,47,-27,50,-23,-24,-13,-22,-19,-20,-37,-10,66,-37,68,66,-35,-34,-21,78,-36,83,-18,]),'LBRACE':([10,],[21,]),'NUMBER':([10,11,18,20,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,41,43,45,46,48,51,54,55,56,57,59,60,62,64,65,66,67,69,70,71,72,73,74,77,79,80,81,],[24,24,24,-33,41,24,-34,-26,24,-25,-28,-29,-30,-31,45,-32,46,24,-27,48,24,51,-24,55,56,57,59,24,62,63,64,65,67,69,65,70,-35,56,71,72,73,74,75,76,-36,80,81,82,]),'LSQUABRAC':([10,11,20,23,24,25,26,27,28,29,30,31,33,35,36,43,54,60,66,67,77,],[32,32,-33,32,-34,-26,-27,-25,-28,-29,-30,-31,-32,32,-27,-24,32,32,-35,-34,-36,]),'NUMLIST':([10,11,20,23,24,25,26,27,28,29,30,31,33,35,36,43,54,60,66,67,77,],[33,33,-33,33,-34,-26,-27,-25,-28,-29,-30,-31,-32,33,-27,-24,33,33,-35,-34,-36,]),'SEMICOLON':([10,20,23,24,25,26,27,28,29,30,31,33,36,43,50,66,77,],[-37,-33,42,-34,-26,-27,-25,-28,-29,-30,-31,-32,-27,-24,58,-35,-36,]),'RSQUABRAC':([75,],[77,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'file':([0,],[1,]),'blocks':([0,21,22,],[2,39,40,]),'block':([0,2,21,22,39,40,],[3,16,3,3,16,16,]),'dictionary':([0,2,21,22,39,40,],[4,4,4,4,4,4,]),'listblock':([0,2,21,22,39,40,],[5,5,5,5,5,5,]),'statement':([0,2,21,22,39,40,],[6,6,6,6,6,6,]),'hexEdge_items':([0,2,21,22,39,40,],[7,7,7,7,7,7,]),'coordlists':([0,2,21,22,39,40,54,],[8,8,8,8,8,8,61,]),'empty':([0,2,10,11,21,22,23,35,39,40,54,60,],[9,9,31,31,9,9,31,31,9,9,31,31,]),'hexEdge_item':([0,2,7,21,22,39,40,],[12,12,17,12,12,12,12,]),'coodlist':([0,2,8,21,22,39,40,44,54,61,84,],[13,13,19,13,13,13,13,53,13,19,53,]),'hex_item':([0,2,7,21,22,39,40,],[14,14,14,14,14,14,14,]),'edge_item':([0,2,7,21,22,39,40,],[15,15,15,15,15,15,15,]),'anylist':([10,11,54,60,],[23,35,35,35,]),'word':([10,11,23,35,54,60,83,],[25,25,25,25,25,25,84,]),'number':([10,11,18,23,26,35,38,54,60,],[26,36,38,36,44,36,44,36,36,]),'sitem':([10,11,23,35,54,60,],[27,27,43,43,27,27,]),'dimension':([10,11,23,35,54,60,],[28,28,28,28,28,28,]),'vector':([10,11,23,35,54,60,],[29,29,29,29,29,29,]),'numlist':([10,11,23,35,54,60,],[30,30,30,30,30,30,]),'gradlist':([44,84,],[52,85,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> file","S'",1,None,None,None),
+  ('file -> blocks','file',1,'p_file','Parser.py',341),
+  ('blocks -> blocks block','blocks',2,'p_blocks','Parser.py',353),
+  ('blocks -> block','blocks',1,'p_blocks','Parser.py',354),
+  ('block -> dictionary','block',1,'p_block','Parser.py',365),
+  ('block -> listblock','block',1,'p_block','Parser.py',366),
+  ('block -> statement','block',1,'p_block','Parser.py',367),
+  ('block -> hexEdge_items','block',1,'p_block','Parser.py',368),
+  ('block -> coordlists','block',1,'p_block','Parser.py',369),
+  ('block -> empty','block',1,'p_block','Parser.py',370),
+  ('listblock -> WORD LPAREN blocks RPAREN SEMICOLON','listblock',5,'p_listblock','Parser.py',374),
+  ('coordlists -> coordlists coodlist','coordlists',2,'p_coodlists','Parser.py',392),
+  ('coordlists -> coodlist','coordlists',1,'p_coodlists','Parser.py',393),
+  ('coodlist -> LPAREN anylist RPAREN','coodlist',3,'p_coordlist','Parser.py',402),
+  ('hexEdge_items -> hexEdge_items hexEdge_item','hexEdge_items',2,'p_hexEdge_items','Parser.py',407),
+  ('hexEdge_items -> hexEdge_item','hexEdge_items',1,'p_hexEdge_items','Parser.py',408),
+  ('hexEdge_item -> hex_item','hexEdge_item',1,'p_hexEdge_item','Parser.py',416),
+  ('hexEdge_item -> edge_item','hexEdge_item',1,'p_hexEdge_item','Parser.py',417),
+  ('hex_item -> WORD LPAREN NUMBER NUMBER NUMBER NUMBER NUMBER NUMBER NUMBER NUMBER RPAREN LPAREN NUMBER NUMBER NUMBER RPAREN word gradlist','hex_item',18,'p_hex_item','Parser.py',421),
+  ('edge_item -> WORD number number gradlist','edge_item',4,'p_edge_item','Parser.py',444),
+  ('gradlist -> coodlist','gradlist',1,'p_gradelist','Parser.py',448),
+  ('gradlist -> LPAREN coordlists RPAREN','gradlist',3,'p_gradelist','Parser.py',449),
+  ('dictionary -> WORD LBRACE blocks RBRACE','dictionary',4,'p_dictionary','Parser.py',458),
+  ('statement -> WORD anylist SEMICOLON','statement',3,'p_statement','Parser.py',473),
+  ('anylist -> anylist sitem','anylist',2,'p_anylist','Parser.py',480),
+  ('anylist -> sitem','anylist',1,'p_anylist','Parser.py',481),
+  ('sitem -> word','sitem',1,'p_sitem','Parser.py',490),
+  ('sitem -> number','sitem',1,'p_sitem','Parser.py',491),
+  ('sitem -> dimension','sitem',1,'p_sitem','Parser.py',492),
+  ('sitem -> vector','sitem',1,'p_sitem','Parser.py',493),
+  ('sitem -> numlist','sitem',1,'p_sitem','Parser.py',494),
+  ('sitem -> empty','sitem',1,'p_sitem','Parser.py',495),
+  ('numlist -> NUMLIST','numlist',1,'p_numlist','Parser.py',501),
+  ('word -> WORD','word',1,'p_word','Parser.py',507),
+  ('number -> NUMBER','number',1,'p_number','Parser.py',513),
+  ('vector -> LPAREN NUMBER NUMBER NUMBER RPAREN','vector',5,'p_vector','Parser.py',522),
+  ('dimension -> LSQUABRAC NUMBER NUMBER NUMBER NUMBER NUMBER NUMBER NUMBER RSQUABRAC','dimension',9,'p_dimension','Parser.py',528),
+  ('empty -> <empty>','empty',0,'p_empty','Parser.py',534),
+]
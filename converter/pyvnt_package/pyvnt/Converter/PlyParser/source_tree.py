@@ -0,0 +1,584 @@
+'''
+Trees parsed from OpenFOAM dictionary text that remember the span of text of every entry.
+
+The text is prescanned (see parse_file(lazy=True)) for the entries of every dictionary, each key and list of
+dictionaries is parsed from its own span, and the spans are kept along with the tree. An edit of the text is
+then parsed incrementally: only the smallest key, list of dictionaries or dictionary holding the edit is
+parsed again and spliced into the tree, instead of the whole text. The other way round, the entries whose
+objects were changed are written back to the file with patch_file, leaving the rest of the text as it is.
+'''
+
+import os
+
+from pyvnt.Container.node import Node_C
+from pyvnt.Container.key import Key_C
+from pyvnt.Container.list import List_CP
+from pyvnt.Container.changes import watchers, changed, add_watcher
+from pyvnt.Reference.error_classes import ParserError
+from pyvnt.Converter.PlyParser.Parser import OpenFoamParser, _BlockList, _ENTRY_TYPES, _prescan
+from pyvnt.Converter.Writer.writer import _indent, _render_dict, _render_item
+
+__all__ = ['SourceTree', 'patch_file']
+
+
+class SourceTree:
+    '''
+    Tree parsed from the text of an OpenFOAM dictionary, with the span of text each entry was read from
+
+    The tree is made of the usual Node_C, Key_C and List_CP objects, under root. When the text is edited
+    with edit, the entry holding the edit is parsed again and spliced into the objects already in the tree,
+    so a key keeps being the same Key_C object and a dictionary the same Node_C object. Should the edit
+    change the extent of that entry (e.g. remove its ';' or add a key next to it), the entries around it
+    are tried in turn, up to the whole text.
+
+    The tree also notes which of its objects are changed (see pyvnt.Container.changes), for patch_file to
+    write only their entries back to the file.
+
+    Contructor Parameters:
+        text: Text of the dictionary (Optional if path is given)
+        parser: Parser of the entries (Optional, defaults to a new OpenFoamParser)
+        path: Path of the file the text is read from if it is not given, and patch_file writes to
+    '''
+
+    def __init__(self, text: str = None, parser: OpenFoamParser = None, path: str = None):
+        if text is None:
+            if path is None:
+                raise ValueError("The text or the path of the dictionary is needed")
+            # line endings are kept, so positions in the text are positions in the file
+            with open(path, encoding='utf-8', newline='') as file:
+                text = file.read()
+        self.parser = parser if parser is not None else OpenFoamParser()
+        self.path = path
+        self.text = text
+        self.root = Node_C("root")
+        self._lexer = self.parser._parseInternalText.lexer.clone()
+        self._parsed = ""       # text the entries were found in, the text before an edit with a syntax error
+        self._ascii = True      # the text has no multi-byte characters, so positions are byte offsets
+        self._entries = []      # entries at the top level of the text
+        self._spans = {}        # id of an item -> its entry
+        self._names = {}        # id of an item -> its name when its entry was found
+        self._inner = {}        # id of a node or key in a list of dictionaries -> (node or key, entry of the list)
+        self._dirty = {}        # id of a changed item -> item
+        self._editing = False
+        self._valid = True
+        self._parse_all(text)
+        add_watcher(self)
+
+    def is_valid(self):
+        '''
+        Function to check if the tree is parsed from the current text, which is not so after an edit
+        that left the text with a syntax error, until an edit makes the text valid again
+        '''
+        return self._valid
+
+    def is_changed(self):
+        '''
+        Function to check if objects of the tree were changed since they were parsed or written with patch_file
+        '''
+        return bool(self._dirty)
+
+    def span(self, item) -> tuple:
+        '''
+        Function to get the (start, end) positions in the text of the entry an item was parsed from
+
+        Parameters:
+            item: Node_C, Key_C or List_CP of the tree
+        '''
+        entry = self._spans.get(id(item))
+        if entry is None or entry.item is not item or not self._valid:
+            raise KeyError(f"{getattr(item, 'name', item)} was not parsed from the text")
+        return entry.start, entry.end
+
+    def edit(self, start: int, end: int, text: str):
+        '''
+        Function to replace a part of the text and parse the entry holding the change again
+
+        Parameters:
+            start: Position in the text where the replaced part starts
+            end: Position in the text where the replaced part ends
+            text: Text replacing the part
+
+        Returns:
+            The Node_C, Key_C or List_CP parsed again (root if the whole text was)
+
+        Raises ParserError if the new text cannot be parsed, in which case the text is changed but the tree
+        is kept as it was until an edit makes the text valid again.
+        '''
+        if not 0 <= start <= end <= len(self.text):
+            raise ValueError(f"Span ({start}, {end}) is not in the text of length {len(self.text)}")
+        new_text = self.text[:start] + text + self.text[end:]
+        delta = len(text) - (end - start)
+
+        self._editing = True # the objects follow the text, they are not changes to write
+        try:
+            chain = self._enclosing(start, end) if self._valid else []
+            for depth in range(len(chain) - 1, -1, -1):
+                entry = chain[depth]
+                try:
+                    new = self._parse_span(new_text, entry, entry.end + delta)
+                except ParserError:
+                    continue # the edit changed the extent of the entry, try the one around it
+                self._move(entry.end, delta, chain[:depth + 1])
+                self._splice(entry, new, chain[depth - 1].item if depth else self.root)
+                self.text = self._parsed = new_text
+                self._ascii = self._ascii and text.isascii()
+                return entry.item
+
+            try:
+                self._parse_all(new_text)
+            except ParserError:
+                self.text = new_text
+                self._valid = False
+                raise
+            return self.root
+        finally:
+            self._editing = False
+
+    def _node_changed(self, item):
+        # items of other trees, and items not written yet (their node is changed too), are left out
+        if self._editing:
+            return
+        entry = self._spans.get(id(item))
+        inner = self._inner.get(id(item))
+        if item is self.root or (entry is not None and entry.item is item) or (inner is not None and inner[0] is item):
+            self._dirty[id(item)] = item
+
+    def _parse_all(self, text: str):
+        entries = _prescan(text, self._lexer)
+        items = self._build_items(text, entries, self._entries)
+        self._set_items(self.root, items)
+        self.text = self._parsed = text
+        self._ascii = text.isascii()
+        self._entries = entries
+        self._spans = {}
+        self._names = {}
+        self._inner = {}
+        self._register(entries)
+        self._valid = True
+
+    def _parse_span(self, text: str, entry, end: int):
+        '''
+        Parses the span of an entry after an edit, which has to hold a single entry of the same name and kind
+        '''
+        found = _prescan(text, self._lexer, entry.start, end)
+        if len(found) != 1:
+            raise ParserError(f"The text of '{entry.name}' holds {len(found)} entries")
+        new = found[0]
+        if (new.name, new.kind, new.start, new.end) != (entry.name, entry.kind, entry.start, end):
+            raise ParserError(f"The text of '{entry.name}' holds another entry")
+        if new.kind == 'dict':
+            new.item = self._build_items(text, new.entries, entry.entries)
+        else:
+            new.item = self.parser._parse_entry(text, new)
+        return new
+
+    def _build_items(self, text: str, entries: list, old_entries) -> list:
+        '''
+        Builds the items of a dictionary from its entries, keeping in each entry the object built from it.
+        Entries whose text is the same as one of the old entries of the dictionary keep its objects.
+        '''
+        unchanged = {}
+        for old in old_entries:
+            unchanged.setdefault((old.kind, self._parsed[old.start:old.end]), []).append(old)
+        items = _BlockList([]) # Duplicate keys replace the old value in place
+        for entry in entries:
+            same = unchanged.get((entry.kind, text[entry.start:entry.end]))
+            if same:
+                self._adopt(same.pop(0), entry)
+            elif entry.kind == 'dict':
+                entry.item = self._build(text, entry.name, entry.entries)
+            else:
+                entry.item = self.parser._parse_entry(text, entry)
+            items.add(entry.item)
+        return items
+
+    def _build(self, text: str, name: str, entries: list) -> Node_C:
+        node = Node_C(name)
+        self._set_items(node, self._build_items(text, entries, ()))
+        return node
+
+    def _adopt(self, old, entry):
+        '''
+        Gives the objects of an old entry to the entry of the same text found after an edit
+        '''
+        stack = [(old, entry)]
+        while stack:
+            old, entry = stack.pop()
+            entry.item = old.item
+            if entry.entries:
+                stack.extend(zip(old.entries, entry.entries))
+
+    def _enclosing(self, start: int, end: int) -> list:
+        '''
+        Returns the entries holding a span, from the outermost to the innermost
+        '''
+        chain = []
+        entries = self._entries
+        while entries:
+            for entry in entries:
+                # text inserted right before or after an entry is not in it
+                if entry.start <= start and end <= entry.end and \
+                        not (start == end and (start == entry.start or end == entry.end)):
+                    chain.append(entry)
+                    entries = entry.entries
+                    break
+            else:
+                break
+        return chain
+
+    def _move(self, after: int, delta: int, enclosing):
+        '''
+        Moves the spans of the entries at or after a position, and stretches the spans of the enclosing entries
+        '''
+        enclosing = {id(entry) for entry in enclosing}
+        stack = [self._entries]
+        while stack:
+            for entry in stack.pop():
+                if entry.start >= after:
+                    entry.start += delta
+                    entry.end += delta
+                elif id(entry) in enclosing:
+                    entry.end += delta
+                else:
+                    continue
+                if entry.entries:
+                    stack.append(entry.entries)
+
+    def _splice(self, entry, new, parent):
+        '''
+        Moves what was parsed again into the objects of the tree, and the new spans into the entries
+        '''
+        item = entry.item
+        if new.kind == 'key':
+            item.__setstate__(new.item.__getstate__())
+            if watchers:
+                changed(parent)
+        elif new.kind == 'nodelist':
+            self._unregister([entry])
+            item.children = new.item.children
+            self._register([entry])
+        else:
+            self._unregister(entry.entries)
+            self._set_items(item, new.item)
+            entry.entries = new.entries
+            self._register(new.entries)
+
+    def _set_items(self, node: Node_C, items: list):
+        '''
+        Replaces the keys and dictionaries of a node, keeping the ones in front that are already in place
+        '''
+        current = node.get_ordered_items()
+        same = 0
+        while same < min(len(current), len(items)) and current[same] is items[same]:
+            same += 1
+        for item in current[same:]:
+            if isinstance(item, Key_C):
+                node.remove_data(item)
+            else:
+                item.parent = None
+        for item in items[same:]:
+            if isinstance(item, Key_C):
+                node.add_data(item)
+            else:
+                item.parent = node
+
+    def _register(self, entries: list):
+        stack = [entries]
+        while stack:
+            for entry in stack.pop():
+                item = entry.item
+                self._spans[id(item)] = entry
+                self._names[id(item)] = item.name
+                if entry.kind == 'nodelist':
+                    for inner in _inner_items(item):
+                        self._inner[id(inner)] = (inner, entry)
+                if entry.entries:
+                    stack.append(entry.entries)
+
+    def _unregister(self, entries: list):
+        stack = [entries]
+        while stack:
+            for entry in stack.pop():
+                item = entry.item
+                if self._spans.get(id(item)) is entry:
+                    del self._spans[id(item)]
+                    del self._names[id(item)]
+                if entry.kind == 'nodelist':
+                    for inner in _inner_items(item):
+                        if self._inner.get(id(inner), (None,))[0] is inner:
+                            del self._inner[id(inner)]
+                if entry.entries:
+                    stack.append(entry.entries)
+
+    def _patches(self) -> list:
+        '''
+        Returns the replacements of the text that write the changed items, in the order of the text
+        '''
+        places = {} # id of an entry -> (entries it is in, entries enclosing it)
+        stack = [(self._entries, ())]
+        while stack:
+            siblings, enclosing = stack.pop()
+            for entry in siblings:
+                places[id(entry)] = (siblings, enclosing)
+                if entry.entries:
+                    stack.append((entry.entries, enclosing + (entry,)))
+
+        patches = []
+        for item in self._dirty.values():
+            if item is self.root:
+                self._node_patches(item, self._entries, (), None, patches)
+                continue
+            entry = self._spans.get(id(item))
+            if entry is None or entry.item is not item:
+                inner = self._inner.get(id(item))
+                if inner is None or inner[0] is not item:
+                    continue # not in the tree any more, or new in a node that is written anyway
+                entry = inner[1]
+            if id(entry) not in places:
+                continue
+            siblings, enclosing = places[id(entry)]
+            if entry.kind == 'dict' and entry.item is item:
+                self._node_patches(item, entry.entries, enclosing + (entry,), (entry, siblings, enclosing), patches)
+            else:
+                patches.append(self._replace(entry, siblings, enclosing))
+
+        # replacements inside the span of another replacement are written by it
+        patches.sort(key=lambda patch: (patch.start, -patch.end))
+        kept = []
+        cover = None
+        for patch in patches:
+            if cover is not None and patch.end <= cover.end and \
+                    (patch.start < patch.end or cover.start < patch.start < cover.end):
+                continue
+            kept.append(patch)
+            if patch.start < patch.end and (cover is None or patch.end > cover.end):
+                cover = patch
+        kept.sort(key=lambda patch: (patch.start, patch.end))
+        return kept
+
+    def _node_patches(self, node: Node_C, entries: list, enclosing: tuple, own, patches: list):
+        '''
+        Adds the replacements writing the keys and children added to, removed from or renamed in a node
+        '''
+        items = node.get_ordered_items()
+        position = {id(item): i for i, item in enumerate(items)}
+        kept = [entry for entry in entries if id(entry.item) in position]
+        order = [position[id(entry.item)] for entry in kept]
+        if order != sorted(order) or (items and not kept):
+            # the items were reordered or all replaced, the whole node is written again
+            if own is not None:
+                patches.append(self._replace(*own))
+            else:
+                patches.append(_Patch(0, len(self.text), _render_dict(node), self._entries, list(entries), items,
+                                      (), None, 0))
+            return
+
+        for entry in entries:
+            if id(entry.item) not in position:
+                patches.append(self._delete(entry, entries, enclosing))
+            elif self._names.get(id(entry.item)) != entry.item.name:
+                patches.append(self._replace(entry, entries, enclosing))
+
+        # the added items are written after the kept entry in front of them, or before the first kept entry
+        depth = len(enclosing)
+        tabs = _indent(depth)
+        anchors = dict(zip(order, kept))
+        added = []
+        anchor = None
+        for i, item in enumerate(items + [None]):
+            if item is not None and i not in anchors:
+                added.append(item)
+                continue
+            if added and anchor is not None:
+                text = "".join(f"\n{tabs}{_render_item(new, depth)}" for new in added)
+                patches.append(_Patch(anchor.end, anchor.end, text, entries, [], added, enclosing, anchor, 1))
+            elif added:
+                first = anchors[i]
+                text = "".join(f"{_render_item(new, depth)}\n{tabs}" for new in added)
+                patches.append(_Patch(first.start, first.start, text, entries, [], added, enclosing, first, 0))
+            anchor = anchors.get(i)
+            added = []
+
+    def _replace(self, entry, siblings: list, enclosing: tuple):
+        text = _render_item(entry.item, len(enclosing))
+        name = entry.item.name
+        if entry.kind == 'key' and len(text) > entry.end - entry.start and text.startswith(name):
+            # without the keyword column of the writer, the key may fit in place of the old one
+            text = f"{name} {text[len(name):].lstrip(' ')}"
+        return _Patch(entry.start, entry.end, text, siblings, [entry], [entry.item], enclosing, entry, 0)
+
+    def _delete(self, entry, siblings: list, enclosing: tuple):
+        # the line of the entry goes with it when nothing else is on it
+        start = entry.start
+        line = self.text.rfind("\n", 0, start)
+        if not self.text[line + 1:start].strip():
+            start = max(line, 0)
+        return _Patch(start, entry.end, "", siblings, [entry], [], enclosing, entry, 0)
+
+    def _byte_length(self, start: int, end: int) -> int:
+        return end - start if self._ascii else len(self.text[start:end].encode('utf-8'))
+
+    def _patch(self, path: str) -> int:
+        if not self._valid:
+            raise ValueError("The text of the tree has a syntax error, it cannot be written to the file")
+        patches = self._patches()
+        if not patches:
+            self._dirty.clear()
+            return 0
+        if os.path.getsize(path) != self._byte_length(0, len(self.text)):
+            raise ValueError(f"{path} does not hold the text of the tree")
+
+        # replacements up to the first longer one are padded with spaces and written in place, and the file
+        # is written again from the first longer one on
+        tail = None
+        for patch in patches:
+            old = self._byte_length(patch.start, patch.end)
+            new = len(patch.text.encode('utf-8'))
+            patch.offset = self._byte_length(0, patch.start)
+            if tail is None and new > old:
+                tail = patch
+            if tail is None:
+                patch.written = patch.text + " " * (old - new)
+
+        pieces = []
+        pos = 0
+        for patch in patches:
+            pieces.append(self.text[pos:patch.start])
+            pieces.append(patch.written)
+            pos = patch.end
+        pieces.append(self.text[pos:])
+        new_text = "".join(pieces)
+
+        written = 0
+        with open(path, 'r+b') as file:
+            shift = 0
+            for patch in patches:
+                file.seek(patch.offset)
+                if patch is tail:
+                    data = new_text[patch.start + shift:].encode('utf-8')
+                    file.write(data)
+                    file.truncate()
+                    written += len(data)
+                    break
+                data = patch.written.encode('utf-8')
+                file.write(data)
+                written += len(data)
+                shift += len(patch.written) - (patch.end - patch.start)
+
+        self._editing = True
+        try:
+            self._update(patches, new_text)
+        finally:
+            self._editing = False
+        self._dirty.clear()
+        return written
+
+    def _update(self, patches: list, new_text: str):
+        '''
+        Moves the entries after the replacements, and finds the entries of the written items
+        '''
+        ascii = self._ascii and all(patch.written.isascii() for patch in patches)
+        shift = 0
+        for patch in patches:
+            start = patch.start + shift
+            delta = len(patch.written) - (patch.end - patch.start)
+            self._move(patch.end + shift, delta, patch.enclosing)
+            try:
+                found = _prescan(new_text, self._lexer, start, start + len(patch.written)) if patch.items else []
+            except ParserError:
+                found = None
+            if found is None or not _adopt_items(found, patch.items):
+                # the written text is not read back as the items, it is parsed again as a whole
+                self._entries = []
+                try:
+                    self._parse_all(new_text)
+                except ParserError:
+                    self.text = new_text
+                    self._valid = False
+                    raise
+                return
+            index = 0
+            if patch.anchor is not None:
+                index = next(i for i, entry in enumerate(patch.siblings) if entry is patch.anchor) + patch.after
+            self._unregister(patch.removed)
+            patch.siblings[index:index + len(patch.removed)] = found
+            self._register(found)
+            shift += delta
+        self.text = self._parsed = new_text
+        self._ascii = ascii
+
+    def __repr__(self):
+        return f"SourceTree(entries : {len(self._spans)}, length : {len(self.text)}, valid : {self._valid})"
+
+
+class _Patch:
+    '''
+    Replacement of a span of the text by written items, and of the entries in the span by the entries of the items
+    '''
+    __slots__ = ('start', 'end', 'text', 'siblings', 'removed', 'items', 'enclosing', 'anchor', 'after',
+                 'written', 'offset')
+
+    def __init__(self, start, end, text, siblings, removed, items, enclosing, anchor, after):
+        self.start = start
+        self.end = end
+        self.text = text
+        self.siblings = siblings        # entries the removed entries are in, and the new entries go in
+        self.removed = removed
+        self.items = items
+        self.enclosing = enclosing      # entries enclosing the span
+        self.anchor = anchor            # entry the new entries go in place of (after=0) or after (after=1)
+        self.after = after
+        self.written = text             # text with the padding written to the file
+        self.offset = 0                 # position of the span in the file, in bytes
+
+
+def _inner_items(nodes: List_CP):
+    '''
+    Yields the nodes and keys inside a list of dictionaries
+    '''
+    for node in nodes.descendants:
+        yield node
+        if isinstance(node, Node_C):
+            yield from node.data
+
+
+def _adopt_items(entries: list, items: list) -> bool:
+    '''
+    Gives the written items to the entries found in their text, checking that they are the same entries
+    '''
+    stack = [(entries, items)]
+    while stack:
+        entries, items = stack.pop()
+        if len(entries) != len(items):
+            return False
+        for entry, item in zip(entries, items):
+            if not isinstance(item, _ENTRY_TYPES[entry.kind]) or isinstance(item, List_CP) != (entry.kind == 'nodelist'):
+                return False
+            entry.item = item
+            if entry.entries is not None:
+                stack.append((entry.entries, item.get_ordered_items()))
+    return True
+
+
+def patch_file(tree: SourceTree, path: str = None) -> int:
+    '''
+    Function to write the changes to the objects of a SourceTree to its file, writing only the changed entries
+
+    Keys whose values were changed (e.g. with replace_val), lists of dictionaries whose nodes were changed, and
+    keys and nodes added to, removed from or renamed in a node are written with the text writer in the place
+    of their old text. The rest of the file, comments and formatting included, is left as it is. Replacements
+    no longer than the text they replace are written in place, padded with spaces, up to the first longer
+    one, from which on the file is written again. Values changed in place, not through their Key_C, are not
+    seen as changes. The file has to hold the text of the tree, including the edits made with SourceTree.edit.
+
+    Parameters:
+        tree: SourceTree of the text of the file
+        path: Path of the file (Optional, defaults to the path the tree was read from)
+
+    Returns:
+        Number of bytes written to the file
+    '''
+    path = path if path is not None else tree.path
+    if path is None:
+        raise ValueError("The tree was not read from a file, the path of the file is needed")
+    return tree._patch(path)
@@ -1,68 +1,48 @@
 
 import os
 from pyvnt.Container.node import Node_C
-from .dictionaryFileIterator import DictionaryFileIterator
-from .dictionaryFile import DictionaryFile
+from . import backends
 
 
-def read(filepath : str, verifyFile: bool = True) -> Node_C:
+def read(filepath : str, verifyFile: bool = True, backend: str = None) -> Node_C:
   '''
   Reads dictionary file from the given filepath and returns a node tree 
   representation of it.
+  The backend is 'cpp' (OpenFOAM's parser through the compiled libraries) or
+  'ply' (the pure python parser). By default the C++ backend is used when its
+  libraries can be loaded, falling back to the PLY parser otherwise.
   '''  
-  file = DictionaryFile(filepath, verifyFile)
-  itr = DictionaryFileIterator(file)
+  return backends.READERS[backends.selectBackend(backend)](filepath, verifyFile)
 
-  path = file.filepath
 
-  root_name = path.split('/')[-1]
-  # print(root_name)
-
-  root = _createTree(root_name, itr)
-  itr.close()
-  file.close()
-
-  return root
-
-
-def _createTree(parentName: str, itr: DictionaryFileIterator) -> Node_C:
+def _createTree(parentName: str, itr) -> Node_C:
   '''
-  Recursively traverse the openfoam's dictionary data structure and create the
-  node-tree structure.
+  Traverse the openfoam's dictionary data structure and create the node-tree
+  structure in a single pass. Uses an explicit stack of the open dictionaries
+  instead of recursion, and adds every entry to its node in file order.
   '''
-  data = {}
-  while itr.hasEntry():
-    key = itr.getCurrentEntryKeyword()
-    value = None
-
-    # print(f"{key}, {itr.isCurrentEntryList()}")
-
-    if itr.isCurrentEntryDict():
-      # print(key)
-      itr.stepIn()
-      value = _createTree(key, itr)
+  root = Node_C(parentName)
+  node = root
+  stack = []
+
+  while True:
+    if itr.hasEntry():
+      if itr.isCurrentEntryDict():
+        child = Node_C(itr.getCurrentEntryKeyword())
+        node.add_child(child)
+        itr.stepIn()
+        stack.append(node)
+        node = child
+        continue
+
+      node.add_data(itr.getKeyData())
+      itr.step()
+    elif stack:
+      # end of a sub-dictionary, continue after its entry in the parent
       itr.stepOut()
+      itr.step()
+      node = stack.pop()
     else:
-      value = itr.getKeyData()
-      # print(value)
-
-    print(key)
-    # print(f"{key}, {type(value)}")
-    data[key] = value
-    itr.step()
-
-  # create node
-  children = [] 
-  itms = []
-
-  for key, val in data.items():
-    if isinstance(val,Node_C):
-      children.append(val)
-    else:
-      itms.append(val)
-
-  node = Node_C(parentName, None, children, *itms)
-
-  return node
-
+      break
 
+  return root
@@ -0,0 +1,106 @@
+
+import os, errno
+
+from pyvnt.Container.node import Node_C
+from pyvnt.Reference.error_classes import ParserError
+from .exceptions import (
+  InvalidDictionaryFileError,
+  ReaderBackendUnavailableError,
+)
+
+
+CPP = 'cpp'
+PLY = 'ply'
+BACKENDS = (CPP, PLY)
+
+# reason the OpenFOAM-linked libraries could not be loaded, '' once loaded
+_cppError = None
+_plyParser = None
+
+
+def isCppBackendAvailable() -> bool:
+  '''
+  Checks if the compiled dictionaryFile libraries can be loaded. The libraries
+  are loaded on the first call only.
+  '''
+  global _cppError
+  if _cppError is None:
+    try:
+      from . import sharedLibs
+      _cppError = ''
+    except (OSError, AttributeError) as e: # AttributeError: a library without a symbol, e.g. built from older sources
+      _cppError = str(e)
+  return _cppError == ''
+
+
+def selectBackend(backend: str = None) -> str:
+  '''
+  Returns the backend to read with. If no backend is given, the C++ iterator
+  is used when its libraries are available and the PLY parser otherwise.
+  '''
+  if backend is None:
+    return CPP if isCppBackendAvailable() else PLY
+
+  if backend not in BACKENDS:
+    raise ValueError(f"Unknown reader backend '{backend}', expected one of {BACKENDS}")
+
+  if backend == CPP and not isCppBackendAvailable():
+    raise ReaderBackendUnavailableError(CPP, _cppError)
+
+  return backend
+
+
+def readWithCpp(filepath: str, verifyFile: bool = True) -> Node_C:
+  '''
+  Reads the dictionary file with OpenFOAM's parser through the compiled
+  libraries.
+  '''
+  from .dictionaryFile import DictionaryFile
+  from .dictionaryFileIterator import DictionaryFileIterator
+  from . import _createTree
+
+  file = DictionaryFile(filepath, verifyFile)
+  itr = DictionaryFileIterator(file)
+
+  root_name = os.path.basename(file.filepath)
+  root = _createTree(root_name, itr)
+  itr.close()
+  file.close()
+
+  return root
+
+
+def readWithPly(filepath: str, verifyFile: bool = True) -> Node_C:
+  '''
+  Reads the dictionary file with the pure python PLY parser. Syntax errors are
+  raised as InvalidDictionaryFileError, like the C++ backend does when the
+  file is verified.
+  '''
+  global _plyParser
+  from pyvnt.Converter.PlyParser.Parser import OpenFoamParser
+
+  path = os.path.abspath(filepath)
+  if not os.path.isfile(path):
+    raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), path)
+
+  if _plyParser is None:
+    _plyParser = OpenFoamParser()
+
+  with open(path, 'r') as f:
+    text = f.read()
+
+  try:
+    root = _plyParser.parse_file(text=text)
+  except ParserError as e:
+    if not verifyFile:
+      raise
+    raise InvalidDictionaryFileError(path, str(e))
+
+  root.name = os.path.basename(path)
+  return root
+
+
+READERS = {
+  CPP: readWithCpp,
+  PLY: readWithPly,
+}
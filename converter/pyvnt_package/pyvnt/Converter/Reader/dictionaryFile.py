@@ -20,15 +20,17 @@ class DictionaryFile:
         self.filepath
       )
 
+    self.__codec = 'ascii'
+
     if verifyFile:
-      isValid, error = fileUtils.verifyDictionaryFile(self.filepath)
-      if not isValid:
+      # validated while opening, so the file is parsed only once
+      self.__fileptr, error = fileUtils.openDictionaryFileChecked(self.filepath)
+      if self.__fileptr is None:
         raise InvalidDictionaryFileError(self.filepath, error)
-
-    self.__codec = 'ascii'
-    self.__fileptr = DictionaryFileLib.openDictionaryFile(
-      bytes(self.filepath, self.__codec)
-    )
+    else:
+      self.__fileptr = DictionaryFileLib.openDictionaryFile(
+        bytes(self.filepath, self.__codec)
+      )
 
   def close(self):
     '''
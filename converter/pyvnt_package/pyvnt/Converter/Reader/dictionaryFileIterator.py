@@ -1,5 +1,7 @@
 
 from enum import Enum
+from typing import NamedTuple
+import numpy as np
 from pyvnt import (
   Key_C, 
   Int_P, 
@@ -18,6 +20,7 @@ from .exceptions import (
   IteratorOutOfRange,
   InvalidPrimitiveEntryOperation,
   InvalidDictionaryEntryOperation,
+  ValueBufferError,
 )
 from .sharedLibs import DictionaryFileIteratorLib
 from .dictionaryFile import DictionaryFile
@@ -38,6 +41,30 @@ class ValueType(Enum):
   UNDEFINED = 6
 
 
+_STRING = ValueType.STRING.value
+_INTEGER = ValueType.INTEGER.value
+_PUNCTUATION = ValueType.PUNCTUATION.value
+_SCALARS = (ValueType.FLOAT.value, ValueType.DOUBLE.value, ValueType.LONG_DOUBLE.value)
+
+
+class EntryValues(NamedTuple):
+  '''
+  Value tokens of an entry, filled in place by the library in a single call.
+  For token i, types[i] is its ValueType value, labels[i] holds integers,
+  scalars[i] holds floats and strings[stringOffsets[i]:stringOffsets[i+1]] 
+  holds the bytes of words and punctuation.
+  LONG_DOUBLE tokens are read into scalars as doubles like the others. This
+  loses nothing: OpenFOAM keeps them as doubleScalar, and the per-token
+  getCurrentEntryValueAt_LongDouble widened that double, which ctypes then
+  turned back into a python float.
+  '''
+  types: np.ndarray
+  labels: np.ndarray
+  scalars: np.ndarray
+  stringOffsets: np.ndarray
+  strings: np.ndarray
+
+
 class DictionaryFileIterator:
   '''
   A uni-directional, read-only iterator to recursively traverse the OpenFOAM's
@@ -181,10 +208,25 @@ class DictionaryFileIterator:
     if self.isCurrentEntryDict():
       raise InvalidDictionaryEntryOperation
 
+    values = self.__getValueArrays()
+    types = values.types.tolist()
+    labels = values.labels.tolist()
+    scalars = values.scalars.tolist()
+    offsets = values.stringOffsets.tolist()
+    strings = str(values.strings.tobytes(), CODEC)
+
     stack = [[]]
 
-    for index in range(self.__getCurrentEntryValueCount()):
-      val = self.__getValueAt(index)
+    for index, valType in enumerate(types):
+      if valType == _STRING or valType == _PUNCTUATION:
+        val = strings[offsets[index]:offsets[index+1]]
+      elif valType == _INTEGER:
+        val = labels[index]
+      elif valType in _SCALARS:
+        val = scalars[index]
+      else:
+        val = None
+
       if val == '(' or val == '[':
         stack.append([])
       elif val == ')':
@@ -204,12 +246,29 @@ class DictionaryFileIterator:
       elif val == ',':
         pass
       else:
-        prop = self.__getValuePropertyAt(index)
+        prop = self.__makeValueProperty(index, ValueType(valType), val)
         stack[-1].append(prop)
     # print(stack)
 
     return stack[0]
 
+  def getValueArrays(self) -> EntryValues:
+    '''
+    Returns the value tokens of current entry as numpy arrays, filled by the 
+    library in one call instead of one call per token.
+    Raises an error if iterator is out of range.
+    Raises an error if current entry is not primitive entry.
+    '''
+    self.__checkValidity()
+
+    if not self.hasEntry():
+      raise IteratorOutOfRange
+
+    if self.isCurrentEntryDict():
+      raise InvalidDictionaryEntryOperation
+
+    return self.__getValueArrays()
+
   def getRawValues(self) -> list:
     '''
     Return list of raw python objects for the values in current entry.
@@ -244,6 +303,40 @@ class DictionaryFileIterator:
     '''
     return DictionaryFileIteratorLib.getCurrentEntryValueCount(self.__iteratorPtr)
 
+  def __getValueArrays(self) -> EntryValues:
+    '''
+    Allocates the buffers for the values of the current entry and lets the
+    library fill them.
+    '''
+    count = self.__getCurrentEntryValueCount()
+    stringSize = DictionaryFileIteratorLib.getCurrentEntryStringSize(
+      self.__iteratorPtr
+    )
+
+    values = EntryValues(
+      types=np.empty(count, dtype=np.int32),
+      labels=np.empty(count, dtype=np.int64),
+      scalars=np.empty(count, dtype=np.float64),
+      stringOffsets=np.empty(count + 1, dtype=np.int32),
+      strings=np.empty(stringSize, dtype=np.uint8),
+    )
+
+    written = DictionaryFileIteratorLib.getCurrentEntryValues(
+      self.__iteratorPtr,
+      values.types.ctypes.data,
+      values.labels.ctypes.data,
+      values.scalars.ctypes.data,
+      values.stringOffsets.ctypes.data,
+      values.strings.ctypes.data,
+      count,
+      stringSize
+    )
+
+    if written != count:
+      raise ValueBufferError
+
+    return values
+
   def __getCurrentEntryValueTypeAt(self, index: int) -> ValueType:
     '''
     Returns the ValueType of token at a given index in values of an entry.
@@ -351,7 +444,12 @@ class DictionaryFileIterator:
     '''
     valType = self.__getCurrentEntryValueTypeAt(index)
     val = self.__getValueAt(index, valType)
+    return self.__makeValueProperty(index, valType, val)
 
+  def __makeValueProperty(self, index : int, valType: ValueType, val) -> Value_P:
+    '''
+    Returns a Value_P object for a value of the given type at the given index.
+    '''
     if valType == ValueType.INTEGER:
       return Int_P(f'val{index+1}', val, INT_MIN, INT_MAX)
 
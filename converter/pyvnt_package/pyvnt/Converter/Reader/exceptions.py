@@ -63,4 +63,24 @@ class InvalidDictionaryEntryOperation(Exception):
   Invalid operation for a dictionary entry.
   '''
   def __str__(self):
-    return "Invalid operation for dictionary entry"
\ No newline at end of file
+    return "Invalid operation for dictionary entry"
+
+
+class ValueBufferError(Exception):
+  '''
+  Buffers given for the values of an entry are too small.
+  '''
+  def __str__(self):
+    return "Value buffers are too small for the current entry"
+
+
+class ReaderBackendUnavailableError(Exception):
+  '''
+  Requested reader backend cannot be used on this machine.
+  '''
+  def __init__(self, backend: str, reason: str):
+    self.backend = backend
+    self.reason = reason
+
+  def __str__(self):
+    return f"Reader backend '{self.backend}' is not available : {self.reason}"
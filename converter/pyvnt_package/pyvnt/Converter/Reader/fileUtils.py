@@ -1,22 +1,38 @@
 
-import os
-import subprocess as sp
+import ctypes
 
+from .sharedLibs import DictionaryFileLib
 
-EXECUTABLE_PATH = os.path.join(
-  os.path.dirname(__file__),
-  'cpp_src/dictionaryFileChecker/bin/dictionaryFileChecker'
-)
+
+CODEC = 'ascii'
+ERROR_BUFFER_SIZE = 4096
+
+
+def openDictionaryFileChecked(filepath : str) -> tuple[int, str]:
+  '''
+  Opens the given file with the already loaded dictionaryFile library, checking
+  it against the syntax of OpenFOAM's dictionary files in the same parse.
+  Returns the pointer to the C++ DictionaryFile object, or None with the error
+  message if the file is not valid.
+  '''
+  errorBuffer = ctypes.create_string_buffer(ERROR_BUFFER_SIZE)
+  fileptr = DictionaryFileLib.openDictionaryFileChecked(
+    bytes(filepath, CODEC),
+    errorBuffer,
+    ERROR_BUFFER_SIZE
+  )
+  return (fileptr, str(errorBuffer.value, CODEC, 'replace'))
 
 
 def verifyDictionaryFile(filepath : str) -> tuple[bool, str]:
   '''
   Checks if the given file follows the syntax of OpenFOAM's dictionary files. 
-  Uses the custom utility 'dictionaryFileChecker' in a subprocess. The call to
-  this function is blocking as it waits for the subprocess to exit.
+  The file is parsed in-process by the dictionaryFile library, so no
+  subprocess is spawned.
   '''
-  args = (EXECUTABLE_PATH, filepath)
-  res = sp.run(args, stdout=sp.PIPE, stderr=sp.STDOUT)
-  isValid = (res.returncode == 0) and (len(res.stdout) == 0)
-  output = str(res.stdout, encoding='ascii')
-  return (isValid, output)
+  fileptr, error = openDictionaryFileChecked(filepath)
+  if fileptr is None:
+    return (False, error)
+
+  DictionaryFileLib.closeDictionaryFile(fileptr)
+  return (True, error)
@@ -11,6 +11,7 @@ class DictionaryFileLib:
   )
   _lib = ctypes.CDLL(_libFilePath)
   openDictionaryFile = _lib.openDictionaryFile
+  openDictionaryFileChecked = _lib.openDictionaryFileChecked
   closeDictionaryFile = _lib.closeDictionaryFile
 
 #   _function_signature_dict = {
@@ -35,6 +36,14 @@ class DictionaryFileLib:
 DictionaryFileLib.openDictionaryFile.argtypes = [ctypes.c_char_p]
 DictionaryFileLib.openDictionaryFile.restype = ctypes.c_void_p
 
+# filepath, error message buffer and its size in bytes
+DictionaryFileLib.openDictionaryFileChecked.argtypes = [
+  ctypes.c_char_p,
+  ctypes.c_char_p,
+  ctypes.c_int
+]
+DictionaryFileLib.openDictionaryFileChecked.restype = ctypes.c_void_p
+
 DictionaryFileLib.closeDictionaryFile.argtypes = [ctypes.c_void_p]
 DictionaryFileLib.closeDictionaryFile.restype = None
 
@@ -63,6 +72,8 @@ class DictionaryFileIteratorLib:
   getCurrentEntryValueAt_Float = _lib.getCurrentEntryValueAt_Float
   getCurrentEntryValueAt_Double = _lib.getCurrentEntryValueAt_Double
   getCurrentEntryValueAt_LongDouble = _lib.getCurrentEntryValueAt_LongDouble
+  getCurrentEntryStringSize = _lib.getCurrentEntryStringSize
+  getCurrentEntryValues = _lib.getCurrentEntryValues
 
 
 DictionaryFileIteratorLib.createIterator.argtypes = [ctypes.c_void_p]
@@ -152,3 +163,25 @@ DictionaryFileIteratorLib.getCurrentEntryValueAt_LongDouble.argtypes = [
 ]
 DictionaryFileIteratorLib.getCurrentEntryValueAt_LongDouble.restype \
   = ctypes.c_longdouble
+
+
+DictionaryFileIteratorLib.getCurrentEntryStringSize.argtypes = [
+  ctypes.c_void_p
+]
+DictionaryFileIteratorLib.getCurrentEntryStringSize.restype = ctypes.c_int
+
+
+# buffers are passed as raw pointers to numpy arrays:
+# types (int32), labels (int64), scalars (float64), stringOffsets (int32),
+# strings (uint8), followed by the token and string capacities
+DictionaryFileIteratorLib.getCurrentEntryValues.argtypes = [
+  ctypes.c_void_p,
+  ctypes.c_void_p,
+  ctypes.c_void_p,
+  ctypes.c_void_p,
+  ctypes.c_void_p,
+  ctypes.c_void_p,
+  ctypes.c_int,
+  ctypes.c_int
+]
+DictionaryFileIteratorLib.getCurrentEntryValues.restype = ctypes.c_int
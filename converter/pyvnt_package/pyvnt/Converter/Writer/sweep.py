@@ -0,0 +1,185 @@
+'''
+Parameter sweeps over a case tree.
+
+A sweep takes a base case and a grid of keyword paths to lists of values, and writes one case folder for every
+combination of the values. Variants are clone_tree copies of the base, so only the files a variant edits are
+copied and rendered; the other files are written from the base once per process.
+'''
+
+import copy
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from pyvnt.Container.node import Node_C
+from pyvnt.Container.key import Key_C, OrderedValues
+from pyvnt.Container.clone import clone_tree
+from pyvnt.Container.changes import watchers, changed
+from pyvnt.Container.query import query
+from pyvnt.Reference.basic import Value_P, Int_P, Flt_P, Enm_P
+from pyvnt.Converter.Writer.writer import _CaseWriter
+
+
+def grid_points(grid: dict):
+    '''
+    Function to iterate over the combinations of the values of a parameter grid
+
+    The combinations are given as dictionaries of keyword paths to values, the last path of the grid
+    changing the fastest.
+
+    Parameters:
+        grid: Dictionary of keyword paths to lists of values
+    '''
+    paths = list(grid)
+    for values in itertools.product(*(grid[path] for path in paths)):
+        yield dict(zip(paths, values))
+
+
+def make_variant(base: Node_C, params: dict, name: str = None) -> Node_C:
+    '''
+    Function to make a copy-on-write variant of a tree with some of its values changed
+
+    Keyword paths are query paths (see pyvnt.Container.query) of the keys to change, e.g.
+    'system/controlDict/endTime' or '0/*/boundaryField/inlet/value'. A value replaces the last value of the
+    keys, so the dimensions of 'nu [0 2 -1 0 0 0 0] 1e-05;' are kept, while a tuple or list of values replaces
+    all the values of the keys.
+    Values are Value_P objects, or python int, float and str values which become Int_P, Flt_P and Enm_P objects
+    like they would when parsed.
+
+    Parameters:
+        base: Tree the variant is made from, which should not be edited while the variant is in use
+        params: Dictionary of keyword paths to values
+        name: Name of the variant (Optional, defaults to the name of the base)
+    '''
+    variant = clone_tree(base)
+    if name is not None:
+        variant.name = name
+    for path, value in params.items():
+        set_value(variant, path, value)
+    return variant
+
+
+def set_value(tree: Node_C, path, value):
+    '''
+    Function to change the value of the keys found by a path (see make_variant)
+
+    Parameters:
+        tree: Node the path starts from
+        path: Path of the keys, see pyvnt.Container.query
+        value: New value, or tuple or list of new values, of the keys
+    '''
+    keys = [item for item in query(tree, path) if isinstance(item, Key_C)]
+    if not keys:
+        raise KeyError(f"No key found at the path {path}")
+
+    for key in keys:
+        if isinstance(value, (tuple, list)):
+            values = [_make_value(val) for val in value]
+            if len(values) == 1:
+                key._set_single(values[0]._Value_P__name, values[0])
+            else:
+                key._set_values(OrderedValues(_positional(values)))
+            if watchers:
+                changed(key)
+            continue
+
+        new = _make_value(value)
+        last = key._last_key()
+        if last is None:
+            key.append_val(new._Value_P__name, new)
+        else:
+            key.replace_val(last, new)
+
+
+def _make_value(value) -> Value_P:
+    if isinstance(value, Value_P):
+        return value
+    if isinstance(value, bool):
+        raise TypeError(f"Cannot make a value out of {value!r}, use the words true or false")
+    if isinstance(value, int):
+        return Int_P("value", default=value, maximum=max(100000, value), minimum=min(0, value))
+    if isinstance(value, float):
+        return Flt_P("value", default=value, maximum=max(1e5, value), minimum=min(0, value))
+    if isinstance(value, str):
+        return Enm_P(value, {value}, value)
+    raise TypeError(f"Cannot make a value out of {value!r} of type {type(value)}")
+
+
+def _positional(values: list):
+    '''
+    Yields the values named after their position, like the parser names the values of a list, so that
+    values with the same name (e.g. two numbers) do not replace each other. The values are copies, as the
+    same values are given to every variant.
+    '''
+    for i, val in enumerate(values):
+        val = copy.copy(val)
+        val._Value_P__name = f"v{i}"
+        yield val._Value_P__name, val
+
+
+def sweep_case(base: Node_C, grid: dict, path: str, workers: int = None, name: str = None,
+               max_pending: int = None) -> list:
+    '''
+    Function to write a case folder for every combination of the values of a parameter grid
+
+    The cases are made with make_variant and written with the rules of write_case, in processes when workers
+    are given. Cases are handed to the processes in chunks and at most max_pending chunks are waiting at any
+    time, so grids of any size are written without holding all their cases in memory.
+
+    Parameters:
+        base: Case tree (e.g. read with OpenFoamParser.parse_case) the cases are made from
+        grid: Dictionary of keyword paths to lists of values (see make_variant)
+        path: Path to the folder where the case folders are to be created
+        workers: Number of processes writing the cases. Defaults to None (write in this process)
+        name: Format string of the case folder names, given the index of the case and the name of the base case,
+              e.g. '{case}_{index:03d}' (Optional, defaults to the base name followed by the zero padded index)
+        max_pending: Maximum number of chunks of cases waiting to be written (Optional, defaults to 4 per process)
+
+    Returns:
+        List of (case folder, parameters) tuples in the order of grid_points
+    '''
+    total = 1
+    for values in grid.values():
+        total *= len(values)
+    if name is None:
+        name = f"{{case}}_{{index:0{len(str(max(total - 1, 0)))}d}}"
+
+    cases = []
+    def tasks():
+        for index, params in enumerate(grid_points(grid)):
+            case_path = os.path.join(path, name.format(index=index, case=base.name))
+            cases.append((case_path, params))
+            yield case_path, params
+
+    writer = _CaseWriter(base)
+    if workers is None or workers <= 1 or total <= 1:
+        for case_path, params in tasks():
+            writer.write(make_variant(base, params), case_path)
+        return cases
+
+    chunksize = max(1, min(64, total // (workers * 4)))
+    if max_pending is None:
+        max_pending = workers * 4
+    task_iter = tasks()
+    chunks = iter(lambda: list(itertools.islice(task_iter, chunksize)), [])
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_sweep_worker, initargs=(writer,)) as executor:
+        pending = set()
+        for chunk in chunks:
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    future.result()
+            pending.add(executor.submit(_write_cases, chunk))
+        for future in pending:
+            future.result()
+    return cases
+
+
+def _init_sweep_worker(writer):
+    global _sweep_writer
+    _sweep_writer = writer
+
+
+def _write_cases(chunk):
+    for case_path, params in chunk:
+        _sweep_writer.write(make_variant(_sweep_writer.base, params), case_path)
@@ -1,4 +1,5 @@
 from pyvnt.Container.node import *
+from pyvnt.Container.lazy_node import Lazy_Node_C
 from pyvnt.Container.key import *
 from pyvnt.Container.list import *
 from pyvnt.Reference.basic import *
@@ -7,7 +8,47 @@ from pyvnt.Reference.dimension_set import *
 from pyvnt.Reference.vector import *
 from pyvnt.Reference.tensor import *
 from pyvnt.utils.make_indent import make_indent
+import io
+import os
 import re
+import shutil
+from operator import attrgetter
+
+# Number of pending chunks after which the text buffer is written to the file
+_FLUSH_CHUNKS = 8192
+
+# Width of the keyword column of key entries
+_COL_WIDTH = 16
+
+_INDENTS = ["\t" * i for i in range(32)]
+
+# Names of nodes that are read back without quotes, e.g. inlet but not (wall|top)
+_PLAIN_NAME = re.compile(r'[a-zA-Z_][a-zA-Z0-9_]*(?:<[a-zA-Z0-9_]+>)?')
+
+
+def _indent(level: int) -> str:
+    if level < len(_INDENTS):
+        return _INDENTS[level]
+    return "\t" * level
+
+
+class _TextBuffer:
+    '''
+    Collects the rendered text in chunks and writes it to the file in large blocks.
+
+    Value_P objects write themselves through its write method, like they would to a file.
+    '''
+
+    def __init__(self, file):
+        self.file = file
+        self.chunks = []
+        self.write = self.chunks.append
+
+    def flush(self):
+        if self.chunks:
+            self.file.write("".join(self.chunks))
+            self.chunks.clear()
+
 
 def writeTo(root, path,fileType='txt'):
     '''
@@ -28,122 +69,266 @@ def writeTo(root, path,fileType='txt'):
         if re.search(ptt, file_name):
             raise ValueError("File name cannot have .txt extension")
 
-        with open(path + f"\\{file_name}.txt", "w") as file: # Creates a file with the same name as the root node
-            print(path )
-            # for d in root.get_data():
-            #     write_out(d, file)
-            
-            # for writing filr in ordered way
-            for child in root.get_ordered_items():
-                write_out(child, file)
-                file.write("\n")
+        with open(os.path.join(path, f"{file_name}.txt"), "w") as file: # Creates a file with the same name as the root node
+            _write_dict(root, file)
     elif fileType=='yaml':
         ptt = r"$.yaml"
         if re.search(ptt, file_name):
             raise ValueError("File name cannot have .txt extension")
 
-        with open(path + f"\\{file_name}.yaml", "w") as file: # Creates a file with the same name as the root node
+        with open(os.path.join(path, f"{file_name}.yaml"), "w") as file: # Creates a file with the same name as the root node
 
             
             for child in root.get_ordered_items():
                 write_out_Yaml(child, file)
                 file.write("\n")
 
-def write_out(obj, file, indent = 0, list_in_key = False):
+def write_case(case, path) -> str:
     '''
-    Function to write the current object to the file text formate
+    Function to write a case tree (e.g. read with OpenFoamParser.parse_case) to a case folder
+
+    The case node becomes a folder in the given path. Nodes read from a file, and nodes holding keys, lists or
+    a FoamFile header, are written as OpenFOAM text files named after the node, and the other nodes as folders.
 
     Parameters:
-        file: File object to write the object to
-        indent: Required indentation needed for the object to be written
+        case: Case tree to be written
+        path: Path to the folder where the case folder is to be created
 
+    Returns:
+        Path of the case folder
     '''
+    case_path = os.path.join(path, case.name)
+    _CaseWriter().write(case, case_path)
+    return case_path
 
+def _write_dict(root, file):
     '''
-    TODO: need to fix this nested list or vectorv in list file write ( (11, 55, 77) (11, 1, 77) ) -> ( (11 55 77) (11 1 77) )
+    Writes the contents of a dictionary file node, in the written order
     '''
+    buf = _TextBuffer(file)
+    for child in root.get_ordered_items():
+        _write_text(child, buf, 0, False)
+        buf.write("\n")
+    buf.flush()
 
-    if type(obj) == Node_C: # If object is a node
-        make_indent(file, indent)
-        file.write(f"{obj.name}\n")
-        make_indent(file, indent)
-        file.write("{\n")
+def _is_case_file(node) -> bool:
+    if getattr(node, 'source', None) is not None:
+        return True
+    if node.data or node.get_child('FoamFile') is not None:
+        return True
+    return any(isinstance(child, List_CP) for child in node.children)
 
-        # for writing filr in ordered way
-        for child in obj.get_ordered_items():
-            write_out(child, file,indent+1)
-            file.write("\n")
+def _is_placeholder(node) -> bool:
+    # a file that was never parsed is copied as it is, as it cannot have been edited
+    return isinstance(node, Lazy_Node_C) and not node.is_loaded() and node.source is not None
 
-        make_indent(file, indent)
-        file.write("}\n")
-    
-    elif type(obj) == Key_C: # If object is a key
-        col_width = 16
-        last_elem = list(obj.get_keys())[-1]
+def _is_unchanged(node, original) -> bool:
+    # a clone of the original that was never built cannot have been edited
+    return original is not None and (node is original or (isinstance(node, Lazy_Node_C) and not node.is_loaded()))
 
-        make_indent(file, indent)
 
-        if len(list(obj.get_keys())) == 1 and type(list(obj.get_items())[0][1]) == List_CP:
-            file.write(f"{obj.name}\n")
-            for key, val in obj.get_items():
-                write_out(val, file, indent, True)
-        else:
-            if len(obj.name) >= col_width:
-                file.write(f"{obj.name} ")
+class _CaseWriter:
+    '''
+    Writes case trees to folders
+
+    Files that were never parsed are copied from their source. Given the base case the written trees are
+    clone_tree variants of, the files a variant did not edit are not rendered again either: the files the base
+    did not parse are copied, and the others are rendered once and their text reused.
+    '''
+
+    def __init__(self, base = None):
+        self.base = base
+        self._texts = {}
+        self._sources = {}
+        if base is not None:
+            self._find_sources(base, ())
+
+    def _find_sources(self, folder, relpath):
+        # decided once, so every variant gets the same bytes whatever the base loaded since
+        for item in folder.get_ordered_items():
+            if not isinstance(item, Node_C):
+                continue
+            item_relpath = relpath + (item.name,)
+            if not _is_case_file(item):
+                self._find_sources(item, item_relpath)
+            elif _is_placeholder(item):
+                self._sources[item_relpath] = item.source
+
+    def write(self, case, case_path):
+        self._write_folder(case, self.base, case_path, ())
+
+    def _write_folder(self, folder, original, dir_path, relpath):
+        if _is_unchanged(folder, original):
+            folder = original
+        os.makedirs(dir_path, exist_ok=True)
+        for item in folder.get_ordered_items():
+            if not isinstance(item, Node_C):
+                raise ValueError(f"Folder {folder.name} of the case can only hold nodes, found {item}")
+            item_original = original.get_child(item.name) if original is not None else None
+            item_path = os.path.join(dir_path, item.name)
+            item_relpath = relpath + (item.name,)
+            if _is_case_file(item if item_original is None else item_original):
+                self._write_file(item, item_original, item_path, item_relpath)
             else:
-                file.write(f"{obj.name.ljust(col_width)}")
-            for key, val in obj.get_items():
-                write_out(val, file)
-                if key != last_elem:
-                    file.write(" ")
+                self._write_folder(item, item_original, item_path, item_relpath)
+
+    def _write_file(self, node, original, file_path, relpath):
+        if _is_unchanged(node, original):
+            if relpath in self._sources:
+                shutil.copyfile(self._sources[relpath], file_path)
+                return
+            text = self._texts.get(relpath)
+            if text is None:
+                text = self._texts[relpath] = _render_dict(original)
+        elif _is_placeholder(node):
+            shutil.copyfile(node.source, file_path)
+            return
+        else:
+            text = _render_dict(node)
+        with open(file_path, "w") as file:
+            file.write(text)
 
-        file.write(";\n")
+def _render_dict(root) -> str:
+    out = io.StringIO()
+    _write_dict(root, out)
+    return out.getvalue()
 
-    elif type(obj) == List_CP: # If object is a list
-        if obj.is_a_node():
-            make_indent(file, indent)
-            file.write(f"{obj.name}\n")
+def _render_item(obj, indent) -> str:
+    '''
+    Renders an entry of a dictionary, without the indentation in front of it and the newline after it
+    '''
+    out = io.StringIO()
+    write_out(obj, out, indent)
+    return out.getvalue()[len(_indent(indent)):].rstrip("\n")
 
-            make_indent(file, indent)
-            file.write("(\n")
+def write_out(obj, file, indent = 0, list_in_key = False):
+    '''
+    Function to write the current object to the file text formate
 
-            for child in obj.children:
-                write_out(child, file, indent+1)
-                file.write("\n")
+    Parameters:
+        file: File object to write the object to
+        indent: Required indentation needed for the object to be written
 
-            make_indent(file, indent)
-            file.write(");\n")
+    '''
 
-        elif list_in_key:
-            make_indent(file, indent)
-            file.write("(\n")
-            for elem in obj.get_elems():
-                make_indent(file, indent+1)
-                for val in elem:
-                    write_out(val, file)
-                    file.write(" ")
-                file.write("\n")
-            make_indent(file, indent)
-            file.write(")")
-            
+    '''
+    TODO: need to fix this nested list or vectorv in list file write ( (11, 55, 77) (11, 1, 77) ) -> ( (11 55 77) (11 1 77) )
+    '''
+    buf = _TextBuffer(file)
+    _write_text(obj, buf, indent, list_in_key)
+    buf.flush()
+
+def _write_text(obj, buf, indent, list_in_key):
+    writer = _TEXT_WRITERS.get(type(obj))
+    if writer is None:
+        if isinstance(obj, Node_C): # e.g. a lazily loaded node
+            writer = _write_node
+        elif isinstance(obj, Key_C): # e.g. a lazily parsed key
+            writer = _write_key
         else:
-            # res = "( "
-            file.write('( ')
-            for elem in obj.get_elems():
-                for val in elem:
-                    write_out(val, file)
-                    file.write(" ")
-            file.write(')')
-            # file.write(res)
-    
-    elif type(obj) in (Int_P , Flt_P , Enm_P , Vector_P, Tensor_P,Dim_Set_P) :
-        obj.write_out(file)
-    
-    # elif type(obj) == Dim_Set_P: # special case for dimension set
-    #     file.write(" ".join(i for i in str(obj.give_val()).split(",")))
-    
+            raise ValueError(f"Object of type {type(obj)} not supported for writing out to file")
+    writer(obj, buf, indent, list_in_key)
+
+def _write_node(obj, buf, indent, list_in_key):
+    tabs = _indent(indent)
+    write = buf.write
+    name = obj.name if _PLAIN_NAME.fullmatch(obj.name) else f'"{obj.name}"'
+    write(f"{tabs}{name}\n{tabs}{{\n")
+
+    # for writing filr in ordered way
+    for child in obj.get_ordered_items():
+        _write_text(child, buf, indent+1, False)
+        write("\n")
+
+    write(f"{tabs}}}\n")
+
+def _write_key(obj, buf, indent, list_in_key):
+    items = list(obj.get_items())
+    write = buf.write
+    write(_indent(indent))
+
+    if len(items) == 1 and type(items[0][1]) == List_CP:
+        write(f"{obj.name}\n")
+        _write_list(items[0][1], buf, indent, True)
     else:
-        raise ValueError(f"Object of type {type(obj)} not supported for writing out to file")
+        name = obj.name
+        write(f"{name} " if len(name) >= _COL_WIDTH else name.ljust(_COL_WIDTH))
+        if items:
+            _write_values([val for key, val in items], buf)
+            buf.chunks[-1] = buf.chunks[-1][:-1] # no separator after the last value
+
+    write(";\n")
+    if len(buf.chunks) > _FLUSH_CHUNKS:
+        buf.flush()
+
+def _write_list(obj, buf, indent, list_in_key):
+    write = buf.write
+    if obj.is_a_node():
+        tabs = _indent(indent)
+        write(f"{tabs}{obj.name}\n{tabs}(\n")
+
+        for child in obj.children:
+            _write_text(child, buf, indent+1, False)
+            write("\n")
+
+        write(f"{tabs});\n")
+
+    elif obj.is_array_backed(): # Numeric lists are written straight from the array
+        if list_in_key:
+            write(_indent(indent))
+        buf.flush()
+        obj.write_array(buf.file, indent)
+
+    elif list_in_key:
+        tabs = _indent(indent)
+        elem_tabs = _indent(indent+1)
+        write(f"{tabs}(\n")
+        for elem in obj.get_elems():
+            write(elem_tabs)
+            _write_values(elem, buf)
+            write("\n")
+        write(f"{tabs})")
+        
+    else:
+        write('( ')
+        for elem in obj.get_elems():
+            _write_values(elem, buf)
+        write(')')
+
+def _write_value(obj, buf, indent, list_in_key):
+    obj.write_out(buf)
+
+def _write_values(values, buf):
+    '''
+    Writes values each followed by a space, formatting scalars directly instead of through write_out.
+    '''
+    write = buf.write
+    for val in values:
+        scalar = _SCALAR_VALUES.get(type(val))
+        if scalar is not None:
+            write(f"{scalar(val)} ")
+        else:
+            _write_text(val, buf, 0, False)
+            write(" ")
+
+_TEXT_WRITERS = {
+    Node_C: _write_node,
+    Key_C: _write_key,
+    List_CP: _write_list,
+    Int_P: _write_value,
+    Flt_P: _write_value,
+    Enm_P: _write_value,
+    Vector_P: _write_value,
+    Tensor_P: _write_value,
+    Dim_Set_P: _write_value,
+}
+
+# Values whose write_out is just their current value
+_SCALAR_VALUES = {
+    Int_P: attrgetter('_Int_P__default'),
+    Flt_P: attrgetter('_Flt_P__default'),
+    Enm_P: attrgetter('_Enm_P__default'),
+}
 
 def write_out_Yaml(obj, file, indent = 0, list_in_key = False,parent_list_node=False):
     '''
@@ -158,7 +343,7 @@ def write_out_Yaml(obj, file, indent = 0, list_in_key = False,parent_list_node=F
         """Helper function to add indentation."""
         file.write("  " * level)
 
-    if type(obj) == Node_C: # If object is a node
+    if isinstance(obj, Node_C): # If object is a node (or a lazily loaded one)
         make_indent(file, indent)
         if parent_list_node:
             file.write('- ')
@@ -169,17 +354,18 @@ def write_out_Yaml(obj, file, indent = 0, list_in_key = False,parent_list_node=F
 
         # file.write("\n")
     
-    elif type(obj) == Key_C: # If object is a key
-        last_elem = list(obj.get_keys())[-1]
+    elif isinstance(obj, Key_C): # If object is a key (or a lazily parsed one)
+        items = list(obj.get_items())
+        last_elem = items[-1][0]
         make_indent(file, indent)
-        if len(list(obj.get_keys())) == 1 and type(list(obj.get_items())[0][1]) == List_CP:
+        if len(items) == 1 and type(items[0][1]) == List_CP:
             file.write(f"{obj.name}: ")
-            for key, val in obj.get_items():
+            for key, val in items:
                 write_out_Yaml(val, file, indent, list_in_key=True)
         else:
             file.write(f"{obj.name}: ")
             file.write("\"")
-            for key, val in obj.get_items():
+            for key, val in items:
                 write_out_Yaml(val, file)
                 if key != last_elem:
                     file.write(" ")
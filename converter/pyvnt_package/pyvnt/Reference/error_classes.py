@@ -113,6 +113,13 @@ class VersionError(Exception):
     def __str__(self):
         return f"Version {self.version} does not match supported version"
 
+class BinaryFormatError(Exception):
+    def __init__(self, message: str):
+        self.message = message
+
+    def __str__(self):
+        return f"Invalid pyvnt binary data: {self.message}"
+
 
 
 
@@ -3,11 +3,17 @@ from pyvnt.Reference.vector import *
 from pyvnt.Reference.tensor import *
 from pyvnt.Reference.dimension_set import Dim_Set_P
 from pyvnt.Container.node import *
+from pyvnt.Container.lazy_node import *
+from pyvnt.Container.clone import *
+from pyvnt.Container.query import *
 from pyvnt.Container.key import *
 from pyvnt.Container.list import *
 from pyvnt.Converter.Writer.writer import *
+from pyvnt.Converter.Writer.sweep import *
+from pyvnt.Converter.Binary.binary import *
 from pyvnt.utils import *
 from pyvnt.utils.show_tree import *
 
 # from pyvnt.Converter.Reader import read
-from pyvnt.Converter.PlyParser.Parser import *
\ No newline at end of file
+from pyvnt.Converter.PlyParser.Parser import *
+from pyvnt.Converter.PlyParser.source_tree import *
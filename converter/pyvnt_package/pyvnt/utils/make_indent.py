@@ -1,5 +1,4 @@
 
 
 def make_indent(file, indent: int):
-    for i in range(indent):
-        file.write("\t")
\ No newline at end of file
+    file.write("\t" * indent)
\ No newline at end of file
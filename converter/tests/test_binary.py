@@ -0,0 +1,117 @@
+import io
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from pyvnt import (OpenFoamParser, Node_C, Lazy_Node_C, Key_C, List_CP, Int_P, Flt_P, Str_P, Enm_P,
+                   Vector_P, Tensor_P, Dim_Set_P, write_out, dump, dumps, load, loads)
+from pyvnt.Reference.error_classes import BinaryFormatError, VersionError
+
+
+def dump_text(tree):
+    out = io.StringIO()
+    write_out(tree, out)
+    return out.getvalue()
+
+
+class TestBinaryValues(unittest.TestCase):
+
+    def test_value_classes_round_trip(self):
+        values = [
+            Int_P('i', 5, -10, 10),
+            Int_P('big', 2 ** 80, 0, 2 ** 81),
+            Flt_P('f', 0.25, 0, 100.0),
+            Flt_P('g', 3, 0, 1e300),
+            Str_P('s', 'hello'),
+            Enm_P('e', {'a', 'b', 'c'}, 'b'),
+            Vector_P('v', Flt_P('x', 1.5), Flt_P('y', 2.0), Flt_P('z', 3)),
+            Tensor_P('t', [Flt_P(f't{i}', float(i)) for i in range(9)]),
+            Dim_Set_P('d', [0, 2, -1, 0.5, 0, 0, 0]),
+        ]
+        for val in values:
+            copy = loads(dumps(val))
+            self.assertIs(type(copy), type(val))
+            if isinstance(val, Enm_P):
+                # set iteration order may differ once the items are rebuilt
+                self.assertEqual(copy.get_items(), val.get_items())
+                self.assertEqual(copy.give_val(), val.give_val())
+            else:
+                self.assertEqual(repr(copy), repr(val))
+
+        self.assertIsInstance(loads(dumps(values[3]))._Flt_P__default, int)
+
+    def test_lists_round_trip(self):
+        elems = List_CP('l', elems=[[Int_P('a', 1), Enm_P('w', {'w'}, 'w')], [Flt_P('b', 2.5)]])
+        copy = loads(dumps(elems))
+        self.assertEqual(repr(copy), repr(elems))
+
+        array = List_CP('value', array=np.arange(12, dtype=np.float64).reshape(4, 3))
+        copy = loads(dumps(array))
+        self.assertTrue(copy.is_array_backed())
+        np.testing.assert_array_equal(copy.get_array(), array.get_array())
+        copy.append_elem([Vector_P('v', Flt_P('x', 1.0), Flt_P('y', 2.0), Flt_P('z', 3.0))])
+        self.assertEqual(copy.size(), 5)
+
+
+class TestBinaryTrees(unittest.TestCase):
+
+    TEXT = '''a 1;
+b
+{
+    c  hello;
+    d  3((1 2 3) (4 5 6) (7 8 9));
+    e  div(phi,U) uniform 2.5;
+    g  [0 1 -1 0 0 0 0];
+}
+blocks ( hex (0 1 2 3 4 5 6 7) (10 10 1) simpleGrading (1 1 1) );
+l ( x { a 1; } y { b 2; } );
+'''
+
+    def setUp(self):
+        self.tree = OpenFoamParser().parse_file(text=self.TEXT)
+
+    def test_parsed_tree_round_trip(self):
+        copy = loads(dumps(self.tree))
+        self.assertEqual(dump_text(copy), dump_text(self.tree))
+        b = copy.get_child('b')
+        self.assertIs(b.parent, copy)
+        self.assertEqual([k.name for k in b.get_data()], ['c', 'd', 'e', 'g'])
+        self.assertEqual([c.name for c in copy.get_child('l').children], ['x', 'y'])
+
+    def test_loaded_tree_can_be_edited(self):
+        copy = loads(dumps(self.tree))
+        node = Node_C('new')
+        copy.get_child('b').add_child(node)
+        copy.get_child('b').add_data(Key_C('k', Int_P('k', 3)))
+        self.assertIs(copy.get_child('b').get_ordered_items()[-2], node)
+        self.assertIn('k               3;', dump_text(copy))
+
+    def test_lazy_node_is_stored_loaded(self):
+        lazy = Lazy_Node_C('lazy', lambda: OpenFoamParser().parse_file(text='a 1;\n'))
+        copy = loads(dumps(lazy))
+        self.assertIs(type(copy), Node_C)
+        self.assertEqual(copy.get_data()[0].give_val(), 'a : 1')
+
+    def test_file_objects(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'tree.bin')
+            with open(path, 'wb') as f:
+                dump(self.tree, f)
+            with open(path, 'rb') as f:
+                copy = load(f)
+        self.assertEqual(dump_text(copy), dump_text(self.tree))
+
+    def test_invalid_data(self):
+        data = dumps(self.tree)
+        with self.assertRaises(BinaryFormatError):
+            loads(b'NOTPYVNT' + data[8:])
+        with self.assertRaises(BinaryFormatError):
+            loads(data[:len(data) // 2])
+        with self.assertRaises(VersionError):
+            loads(data[:8] + b'\xff\xff' + data[10:])
+
+
+if __name__ == '__main__':
+    unittest.main()
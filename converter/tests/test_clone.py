@@ -0,0 +1,68 @@
+import io
+import unittest
+
+from pyvnt import OpenFoamParser, Int_P, clone_tree, write_out
+
+
+TEXT = '''FoamFile { version 2.0; }
+solver { tolerance 1; relTol 0; inner { nSweeps 2; } }
+patches ( inlet { type patch; } outlet { type wall; } );
+'''
+
+
+def render(tree):
+    out = io.StringIO()
+    write_out(tree, out)
+    return out.getvalue()
+
+
+class TestCloneTree(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = OpenFoamParser().parse_file(text=TEXT)
+        self.original = render(self.tree)
+
+    def edit(self, tree, *path, value):
+        node = tree
+        for name in path[:-1]:
+            node = node.get_child(name)
+        key = node.get_key(path[-1])
+        old = list(key.get_keys())[0]
+        key.replace_val(old, Int_P(old, value))
+
+    def test_levels_are_built_on_access(self):
+        clone = clone_tree(self.tree)
+        self.assertFalse(clone.is_loaded())
+        solver = clone.get_child('solver')
+        self.assertTrue(clone.is_loaded())
+        self.assertFalse(solver.is_loaded())
+        self.assertFalse(clone.get_child('FoamFile').is_loaded())
+
+    def test_edits_are_private(self):
+        first, second = clone_tree(self.tree), clone_tree(self.tree)
+        self.edit(first, 'solver', 'inner', 'nSweeps', value=5)
+        self.edit(second, 'solver', 'tolerance', value=7)
+
+        self.assertEqual(render(self.tree), self.original)
+        self.assertIn('nSweeps         5;', render(first))
+        self.assertIn('tolerance       1;', render(first))
+        self.assertIn('nSweeps         2;', render(second))
+        self.assertIn('tolerance       7;', render(second))
+
+    def test_values_are_shared(self):
+        clone = clone_tree(self.tree)
+        original = self.tree.get_child('solver').get_key('relTol')
+        copy = clone.get_child('solver').get_key('relTol')
+        self.assertIsNot(copy, original)
+        self.assertIs(list(copy.get_items())[0][1], list(original.get_items())[0][1])
+
+    def test_node_lists_and_clones_of_clones(self):
+        clone = clone_tree(clone_tree(self.tree))
+        self.assertEqual(render(clone), self.original)
+        patches = clone.get_child('patches')
+        self.assertEqual([c.name for c in patches.children], ['inlet', 'outlet'])
+        self.assertIsNot(patches, self.tree.get_child('patches'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import copy
+import pickle
+import unittest
+
+from pyvnt import Key_C, Int_P, Node_C
+from pyvnt.Container.key import OrderedValues
+from pyvnt.Reference.error_classes import KeyRepeatError
+
+
+class TestCompactKey(unittest.TestCase):
+
+    def test_slotted(self):
+        key = Key_C('k', Int_P('a', 1))
+        self.assertFalse(hasattr(key, '__dict__'))
+        self.assertNotIn('name', Node_C('n').__dict__)
+        with self.assertRaises(AttributeError):
+            key.other = 1
+
+    def test_single_value_grows_and_shrinks(self):
+        key = Key_C('k', Int_P('a', 1))
+        self.assertEqual(list(key.get_keys()), ['a'])
+        self.assertEqual(key.a.give_val(), 1)
+
+        key.append_val('b', Int_P('b', 2))
+        key.replace_val('a', Int_P('z', 3))
+        self.assertEqual(list(key.get_keys()), ['z', 'b'])
+        with self.assertRaises(KeyRepeatError):
+            key.replace_val('z', Int_P('b', 4))
+
+        key.delete_val('z')
+        key.delete_val('b')
+        self.assertEqual(list(key.get_items()), [])
+        key.append_val('q', Int_P('q', 4))
+        self.assertEqual(key.q.give_val(), 4)
+        key.replace_val('q', Int_P('r', 5))
+        self.assertEqual([(k, v.give_val()) for k, v in key.get_items()], [('r', 5)])
+        with self.assertRaises(AttributeError):
+            key.q
+
+    def test_copies(self):
+        for key in (Key_C('k', Int_P('a', 1)), Key_C('k', Int_P('a', 1), Int_P('b', 2))):
+            for clone in (pickle.loads(pickle.dumps(key)), copy.deepcopy(key)):
+                self.assertEqual(clone.name, 'k')
+                self.assertEqual(repr(clone), repr(key))
+
+
+class TestInPlaceEdits(unittest.TestCase):
+
+    def test_rename_keeps_position(self):
+        key = Key_C('k', *[Int_P(f'v{i}', i) for i in range(5)])
+        key.replace_val('v2', Int_P('renamed', 20))
+        key.replace_val('v4', Int_P('last', 40))
+        self.assertEqual(list(key.get_keys()), ['v0', 'v1', 'renamed', 'v3', 'last'])
+        self.assertEqual(key.renamed.give_val(), 20)
+        self.assertEqual(key._last_key(), 'last')
+        key.replace_val('missing', Int_P('other', 1)) # nothing to replace
+        self.assertEqual(len(key.get_keys()), 5)
+
+    def test_deletes_compact(self):
+        values = OrderedValues((f'v{i}', i) for i in range(10))
+        for i in range(0, 10, 2):
+            del values[f'v{i}']
+        self.assertEqual(values.keys(), ['v1', 'v3', 'v5', 'v7', 'v9'])
+        del values['v9']
+        self.assertEqual(values.last_key(), 'v7')
+        del values['v3']
+        self.assertEqual(values.items(), [('v1', 1), ('v5', 5), ('v7', 7)])
+        self.assertEqual(len(values._names), 3)
+        values['v1'] = 10
+        values['new'] = 11
+        self.assertEqual(values.keys(), ['v1', 'v5', 'v7', 'new'])
+        self.assertEqual(values['v1'], 10)
+        self.assertEqual(pickle.loads(pickle.dumps(values)).items(), values.items())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+import io
+import os
+import pickle
+import tempfile
+import unittest
+
+from pyvnt import OpenFoamParser, Key_C, Lazy_Key_C, Lazy_Node_C, List_CP, Int_P, clone_tree, dumps, loads, \
+    query_one, write_out
+from pyvnt.Reference.error_classes import ParserError
+
+
+TEXT = '''FoamFile
+{
+    version 2.0;
+    format ascii;
+    class volVectorField;
+}
+dimensions [0 1 -1 0 0 0 0];
+// a comment with a ; and a }
+internalField nonuniform List<vector> 3((1 2 3) (4 5 6) (7 8 9));
+boundaryField
+{
+    inlet { type fixedValue; value uniform (1 0 0); }
+    "(wall|top)" { type noSlip; }
+    /* walls; } */
+    outlet { type zeroGradient; }
+}
+blocks ( hex (0 1 2 3 4 5 6 7) (10 10 1) simpleGrading (1 1 1) );
+faces 2(4(0 1 2 3) 4(4 5 6 7));
+boundary ( inlet { type patch; } outlet { type wall; } );
+div(phi,U) Gauss linear;
+a 1;
+a 2;
+'''
+
+
+def render(tree):
+    out = io.StringIO()
+    write_out(tree, out)
+    return out.getvalue()
+
+
+class TestLazyParse(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = OpenFoamParser()
+        self.tree = self.parser.parse_file(text=TEXT, lazy=True)
+
+    def test_same_tree_as_eager(self):
+        self.assertEqual(render(self.tree), render(self.parser.parse_file(text=TEXT)))
+        self.assertEqual([item.name for item in self.tree.get_ordered_items()],
+                         ['FoamFile', 'dimensions', 'internalField', 'boundaryField', 'blocks', 'faces', 'boundary',
+                          'div(phi,U)', 'a'])
+
+    def test_entries_are_built_when_accessed(self):
+        foam = self.tree.get_child('FoamFile')
+        field = self.tree.get_key('internalField')
+        self.assertIsInstance(foam, Lazy_Node_C)
+        self.assertIsInstance(field, Lazy_Key_C)
+        self.assertFalse(foam.is_loaded())
+
+        version = foam.get_key('version')
+        self.assertTrue(foam.is_loaded())
+        self.assertFalse(version.is_loaded())
+        self.assertEqual(version.give_val(), 'version : 2.0')
+        self.assertTrue(version.is_loaded())
+        self.assertFalse(field.is_loaded())
+        self.assertFalse(self.tree.get_child('boundaryField').is_loaded())
+
+        # lists of dictionaries are children of the node and are built with it
+        self.assertIsInstance(self.tree.get_child('boundary'), List_CP)
+
+    def test_duplicates_replace_in_place(self):
+        self.assertEqual(self.tree.get_key('a').give_val(), 'a : 2')
+        self.assertEqual(query_one(self.tree, 'boundaryField/wall/type/noSlip').give_val(), 'noSlip')
+
+    def test_errors_are_raised_on_access(self):
+        tree = self.parser.parse_file(text='a 1;\nb\n{\n    c 1 ];\n}\n', lazy=True)
+        self.assertEqual(tree.get_key('a').give_val(), 'a : 1')
+        key = tree.get_child('b').get_key('c')
+        with self.assertRaises(ParserError) as ctx:
+            key.get_items()
+        self.assertEqual((ctx.exception.lineno, ctx.exception.column), (4, 9))
+        self.assertFalse(key.is_loaded())
+
+    def test_unbalanced_brackets_fail_the_prescan(self):
+        for text in ('a { b 1;\n', 'a 1 ) 2;\n', 'a (1 2};\n', 'a 1;\nb 2\n'):
+            with self.assertRaises(ParserError):
+                self.parser.parse_file(text=text, lazy=True)
+
+    def test_dictionaries_the_grammar_rejects(self):
+        for text in ('a 1 2 3 { b 1; }\n', 'a { }\n', 'a { b { } }\n', 'x 1;\nrelTol 0q { r 1; }\n'):
+            for lazy in (False, True):
+                with self.assertRaises(ParserError):
+                    self.parser.parse_file(text=text, lazy=lazy)
+        # comments and commas may come between the name and the bracket
+        text = 'a /* c */ { b 1; }\nd // c\n, { e 1; }\n'
+        self.assertEqual(render(self.parser.parse_file(text=text, lazy=True)), render(self.parser.parse_file(text=text)))
+
+    def test_edits_and_copies(self):
+        key = self.tree.get_key('dimensions')
+        key.append_val('value', Int_P('value', 3))
+        self.assertEqual(len(key.get_items()), 2)
+
+        clone = clone_tree(self.tree)
+        self.assertFalse(self.tree.get_key('internalField').is_loaded())
+        self.assertEqual(render(clone), render(self.tree))
+
+        copy = pickle.loads(pickle.dumps(self.tree.get_key('div(phi,U)')))
+        self.assertIs(type(copy), Key_C)
+        self.assertEqual(copy.give_val(), 'div(phi,U) : Gauss, linear')
+        self.assertEqual(render(loads(dumps(self.tree))), render(self.tree))
+
+    def test_lazy_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'U')
+            with open(path, 'w') as f:
+                f.write(TEXT)
+            tree = self.parser.parse_file(path=path, lazy=True)
+            eager = self.parser.parse_file(path=path)
+        self.assertEqual(tree.name, 'U')
+        self.assertEqual(render(tree), render(eager))
+
+
+class TestMemoryMap(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = OpenFoamParser()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'U')
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('// vitesse initiale, \u00e9t\u00e9\n' + TEXT)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_same_tree_as_reading_the_file(self):
+        expected = render(self.parser.parse_file(path=self.path))
+        self.assertEqual(render(self.parser.parse_file(path=self.path, memory_map=True)), expected)
+        tree = self.parser.parse_file(path=self.path, memory_map=True, lazy=True)
+        self.assertFalse(tree.get_key('internalField').is_loaded())
+        self.assertEqual(render(tree), expected)
+
+    def test_characters_across_the_name_window(self):
+        # the 256 bytes read for the name of b end inside an é
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('a 1; // ' + 'x' * 237 + 'é' * 10 + '\nb { c 2; }\n')
+        expected = render(self.parser.parse_file(path=self.path))
+        self.assertEqual(render(self.parser.parse_file(path=self.path, memory_map=True)), expected)
+        self.assertEqual(render(self.parser.parse_file(path=self.path, memory_map=True, lazy=True)), expected)
+
+    def test_errors_and_empty_files(self):
+        with open(self.path, 'w') as f:
+            f.write('a 1;\nb\n{\n    c 1 ];\n}\n')
+        with self.assertRaises(ParserError) as ctx:
+            self.parser.parse_file(path=self.path, memory_map=True)
+        self.assertEqual((ctx.exception.lineno, ctx.exception.column), (4, 9))
+        open(self.path, 'w').close()
+        self.assertEqual(self.parser.parse_file(path=self.path, memory_map=True).get_ordered_items(), [])
+
+    def test_parse_case(self):
+        os.makedirs(os.path.join(self.tmp.name, 'system'))
+        with open(os.path.join(self.tmp.name, 'system', 'controlDict'), 'w') as f:
+            f.write('application simpleFoam;\n')
+        expected = render(self.parser.parse_case(self.tmp.name))
+        self.assertEqual(render(self.parser.parse_case(self.tmp.name, memory_map=True)), expected)
+        self.assertEqual(render(self.parser.parse_case(self.tmp.name, workers=2, memory_map=True)), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import copy
+import io
+import pickle
+import unittest
+
+import numpy as np
+
+from pyvnt import List_CP, Int_P, Flt_P, Enm_P, Vector_P
+
+
+def vector(x, y, z):
+    return Vector_P("v", Flt_P("x", x), Flt_P("y", y), Flt_P("z", z))
+
+
+class TestArrayBackedList(unittest.TestCase):
+
+    def test_scalar_list_reads_from_array(self):
+        lst = List_CP("a", array=np.array([1, 2, 3]))
+        self.assertEqual(lst.size(), 3)
+        self.assertEqual(lst.give_val(), (1, 2, 3))
+        self.assertEqual(lst.get_item(0, 1).give_val(), 2)
+        self.assertTrue(lst.is_array_backed())
+
+    def test_append_value_grows_array(self):
+        lst = List_CP("a", array=np.array([1, 2]))
+        for i in range(100):
+            lst.append_value(0, Int_P("v", i))
+        lst.append_value(0, Flt_P("v", 0.5))
+        self.assertTrue(lst.is_array_backed())
+        self.assertEqual(lst.size(), 103)
+        self.assertEqual(lst.get_array().dtype.kind, 'f')
+        self.assertEqual(lst.give_val()[-1], 0.5)
+
+    def test_copies_do_not_share_the_buffer(self):
+        lst = List_CP("a", array=np.array([1, 2, 3]))
+        lst.append_value(0, Int_P("v", 4))
+        for other in (copy.copy(lst), copy.deepcopy(lst), pickle.loads(pickle.dumps(lst))):
+            other.append_value(0, Int_P("v", 50))
+            lst.append_value(0, Int_P("v", 99))
+            self.assertEqual(other.give_val(), (1, 2, 3, 4, 50))
+            self.assertEqual(lst.give_val()[:5], (1, 2, 3, 4, 99))
+
+    def test_append_elem_to_vector_rows(self):
+        lst = List_CP("a", array=np.zeros((2, 3)))
+        lst.append_elem([vector(1.0, 2.0, 3.0)])
+        self.assertTrue(lst.is_array_backed())
+        self.assertEqual(lst.get_item(2, 0).give_val(), (1.0, 2.0, 3.0))
+
+    def test_non_numeric_value_converts_to_objects(self):
+        lst = List_CP("a", array=np.array([1, 2]))
+        lst.append_value(0, Enm_P("e", {"x"}, "x"))
+        self.assertFalse(lst.is_array_backed())
+        self.assertEqual(lst.give_val(), (1, 2, "x"))
+
+    def test_get_elems_matches_object_layout(self):
+        scalars = List_CP("a", array=np.array([1.5, 2.5]))
+        self.assertEqual([[v.give_val() for v in elem] for elem in scalars.get_elems()], [[1.5, 2.5]])
+        rows = List_CP("b", array=np.array([[0.0, 1.0, 2.0]]))
+        self.assertIsInstance(rows.get_elems()[0][0], Vector_P)
+
+    def test_equality(self):
+        first = List_CP("a", array=np.array([[0.0, 1.0, 2.0]]))
+        second = List_CP("b", elems=[[vector(0.0, 1.0, 2.0)]])
+        self.assertTrue(first == second)
+        self.assertTrue(second.pack())
+        self.assertTrue(first == second)
+        self.assertTrue(first != List_CP("c", array=np.array([[0.0, 1.0, 3.0]])))
+
+    def test_pack_rejects_mixed_lists(self):
+        lst = List_CP("a", elems=[[Int_P("v", 1), Enm_P("e", {"x"}, "x")]])
+        self.assertFalse(lst.pack())
+        self.assertFalse(lst.is_array_backed())
+
+    def test_write_out(self):
+        lst = List_CP("a", array=np.array([[1, 2], [3, 4]]))
+        out = io.StringIO()
+        lst.write_out(out)
+        self.assertEqual(out.getvalue(), "2\n(\n\t(1 2)\n\t(3 4)\n)")
+
+
+if __name__ == '__main__':
+    unittest.main()
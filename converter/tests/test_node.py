@@ -0,0 +1,116 @@
+import pickle
+import unittest
+
+from pyvnt import OpenFoamParser, Node_C, Key_C, Int_P, Lazy_Node_C, List_CP, dumps, loads
+from pyvnt.Container.node import _NO_ITEMS, _NO_NAMES
+from pyvnt.Container.orderedItems import OrderedItems
+
+
+class TestNameIndex(unittest.TestCase):
+
+    def test_keys_and_children(self):
+        node = Node_C('root')
+        a = Key_C('a', Int_P('v', 1))
+        node.add_data(a)
+        child = Node_C('sub')
+        node.add_child(child)
+        self.assertIs(node.get_key('a'), a)
+        self.assertIs(node.get_child('sub'), child)
+        self.assertIsNone(node.get_key('sub'))
+        self.assertIsNone(node.get_child('a'))
+
+        node.remove_data(a)
+        self.assertIsNone(node.get_key('a'))
+
+        other = Node_C('other')
+        child.parent = other
+        self.assertIsNone(node.get_child('sub'))
+        self.assertIs(other.get_child('sub'), child)
+
+    def test_constructor_and_duplicates(self):
+        first, second = Key_C('k', Int_P('v', 1)), Key_C('k', Int_P('v', 2))
+        node = Node_C('root', None, [Node_C('c')], first, second)
+        self.assertIs(node.get_key('k'), first)
+        self.assertEqual(node.get_child('c').name, 'c')
+        node.remove_data(first)
+        self.assertIs(node.get_key('k'), second)
+
+    def test_rename_child(self):
+        node = Node_C('root')
+        child = Node_C('old', node)
+        child.name = 'new'
+        self.assertIsNone(node.get_child('old'))
+        self.assertIs(node.get_child('new'), child)
+
+    def test_rename_list_of_nodes(self):
+        node = Node_C('root')
+        nodes = List_CP('old', values=[Node_C('x')], isNode=True)
+        nodes.parent = node
+        nodes.name = 'new'
+        self.assertIs(node.get_child('new'), nodes)
+        self.assertIsNone(node.get_child('old'))
+
+    def test_get_value_deep_path(self):
+        tree = OpenFoamParser().parse_file(text='a { b { c { d 4; } } e 5; }\n')
+        parser = OpenFoamParser()
+        self.assertEqual(parser.get_value(tree, 'a', 'b', 'c', 'd').name, 'd')
+        self.assertEqual(parser.get_value(tree, 'a', 'e').name, 'e')
+        self.assertIsNone(parser.get_value(tree, 'a', 'missing'))
+
+    def test_decoded_and_lazy_nodes(self):
+        tree = OpenFoamParser().parse_file(text='a { b 1; c { d 2; } }\n')
+        copy = loads(dumps(tree))
+        self.assertEqual(copy.get_child('a').get_key('b').name, 'b')
+
+        lazy = Lazy_Node_C('lazy', lambda: tree.get_child('a'))
+        self.assertEqual(lazy.get_key('b').name, 'b')
+        self.assertEqual(lazy.get_child('c').name, 'c')
+
+    def test_empty_nodes_share_their_containers(self):
+        empty, other = Node_C('empty'), loads(dumps(Node_C('other')))
+        for node in (empty, other):
+            self.assertIs(node._ordered_items, _NO_ITEMS)
+            self.assertIs(node._name_index, _NO_NAMES)
+        empty.add_child(Node_C('sub'))
+        empty.add_data(Key_C('k', Int_P('v', 1)))
+        other.add_data(Key_C('k', Int_P('v', 1)))
+        empty.get_child('sub').name = 'renamed'
+        empty.reindex()
+        self.assertEqual([i.name for i in empty.get_ordered_items()], ['renamed', 'k'])
+        self.assertEqual(other.get_key('k').name, 'k')
+        self.assertEqual((len(_NO_ITEMS), _NO_NAMES), (0, {}))
+
+
+class TestOrderedItems(unittest.TestCase):
+
+    def test_order_membership_and_removal(self):
+        keys = [Key_C(f'k{i}', Int_P('v', i)) for i in range(5)]
+        items = OrderedItems(keys + [keys[0]])
+        self.assertEqual(list(items), keys)
+        items.remove(keys[2])
+        items.append(keys[2])
+        self.assertEqual([k.name for k in items], ['k0', 'k1', 'k3', 'k4', 'k2'])
+        self.assertIn(keys[1], items)
+        self.assertNotIn(Key_C('k1', Int_P('v', 1)), items)
+        with self.assertRaises(ValueError):
+            items.remove(Key_C('x'))
+
+        copy = pickle.loads(pickle.dumps(items))
+        self.assertEqual([k.name for k in copy], ['k0', 'k1', 'k3', 'k4', 'k2'])
+        first = next(iter(copy))
+        copy.remove(first)
+        self.assertEqual(len(copy), 4)
+
+    def test_node_keeps_order_through_moves(self):
+        children = [Node_C(f'c{i}') for i in range(3)]
+        node = Node_C('root', None, children, Key_C('a', Int_P('v', 1)))
+        node.add_data(Key_C('b', Int_P('v', 2)))
+        children[1].parent = None
+        node.add_child(children[1])
+        self.assertEqual([i.name for i in node.get_ordered_items()], ['a', 'c0', 'c2', 'b', 'c1'])
+        node.set_order(['c1', 'a'])
+        self.assertEqual([i.name for i in node.get_ordered_items()], ['c1', 'a', 'c0', 'c2', 'b'])
+
+
+if __name__ == '__main__':
+    unittest.main()
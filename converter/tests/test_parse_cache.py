@@ -0,0 +1,74 @@
+import io
+import os
+import tempfile
+import unittest
+
+from pyvnt import OpenFoamParser, ParseCache, write_out
+
+
+def dump(tree):
+    out = io.StringIO()
+    for item in tree.get_ordered_items():
+        write_out(item, out)
+    return out.getvalue()
+
+
+class TestParseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ParseCache(os.path.join(self.tmp.name, 'cache'))
+        self.parser = OpenFoamParser(cache=self.cache)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_hit_returns_same_tree(self):
+        text = 'a 1;\nb\n{\n    c  hello;\n    d  3(1 2 3);\n}\n'
+        first = self.parser.parse_file(text=text)
+        second = self.parser.parse_file(text=text)
+        self.assertEqual(self.cache.stats()['misses'], 1)
+        self.assertEqual(self.cache.stats()['hits'], 1)
+        self.assertIsNot(first, second)
+        self.assertEqual(dump(first), dump(second))
+
+    def test_changed_text_misses(self):
+        self.parser.parse_file(text='a 1;\n')
+        self.parser.parse_file(text='a 2;\n')
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 2))
+        self.assertEqual(len(self.cache), 2)
+
+    def test_file_path_and_entries_survive_restart(self):
+        path = os.path.join(self.tmp.name, 'controlDict')
+        with open(path, 'w') as f:
+            f.write('application simpleFoam;\n')
+        self.parser.parse_file(path=path)
+
+        cache = ParseCache(self.cache.directory)
+        tree = OpenFoamParser(cache=cache).parse_file(path=path)
+        self.assertEqual(tree.name, 'controlDict')
+        self.assertEqual(cache.hits, 1)
+
+    def test_least_recently_used_is_evicted(self):
+        self.parser.parse_file(text='a 1;\n')
+        size = self.cache.stats()['bytes']
+        self.cache.max_bytes = int(size * 2.5)
+        self.parser.parse_file(text='a 2;\n')
+        self.parser.parse_file(text='a 1;\n')
+        self.parser.parse_file(text='a 3;\n')
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertIsNotNone(self.cache.get(self.cache.key('a 1;\n')))
+        self.assertIsNone(self.cache.get(self.cache.key('a 2;\n')))
+
+    def test_corrupt_entry_is_parsed_again(self):
+        self.parser.parse_file(text='a 1;\n')
+        with open(os.path.join(self.cache.directory, self.cache.key('a 1;\n') + '.tree'), 'wb') as f:
+            f.write(b'truncated')
+        tree = self.parser.parse_file(text='a 1;\n')
+        self.assertEqual(tree.get_data()[0].give_val(), 'a : 1')
+        self.assertEqual(self.cache.misses, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
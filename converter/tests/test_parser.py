@@ -0,0 +1,250 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import ply.yacc as yacc
+
+from pyvnt import OpenFoamParser, Node_C, Lazy_Node_C, Key_C, List_CP, write_out
+from pyvnt.Reference.error_classes import ParserError
+from pyvnt.Converter.PlyParser import parsetab
+from pyvnt.Converter.PlyParser.Parser import _OpenFoamParserInternalText, _scan_numeric_list
+from pyvnt.Converter.PlyParser.build_tables import build_tables
+
+
+class TestParserTables(unittest.TestCase):
+
+    def test_shipped_parsetab_matches_grammar(self):
+        internal = _OpenFoamParserInternalText()
+        pdict = {k: getattr(internal, k) for k in dir(internal)}
+        pinfo = yacc.ParserReflect(pdict, log=yacc.NullLogger())
+        pinfo.get_all()
+        self.assertEqual(parsetab._lr_signature, pinfo.signature())
+
+    def test_shipped_lextab_matches_tokens(self):
+        shipped = os.path.join(os.path.dirname(parsetab.__file__), 'lextab.py')
+        with tempfile.TemporaryDirectory() as tmp:
+            build_tables(tmp)
+            with open(os.path.join(tmp, 'lextab.py')) as fresh, open(shipped) as old:
+                self.assertEqual(fresh.read(), old.read())
+
+    def test_parser_is_shared_and_writes_nothing(self):
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                first = OpenFoamParser()
+                second = OpenFoamParser()
+                first.parse_file(text='a 1;')
+                self.assertEqual(os.listdir(tmp), [])
+            finally:
+                os.chdir(cwd)
+        self.assertIs(first._parseInternalText.parser, second._parseInternalText.parser)
+        self.assertIsNot(first._parseInternalText.lexer, second._parseInternalText.lexer)
+
+    def test_line_numbers_reset_between_parses(self):
+        parser = OpenFoamParser()
+        parser.parse_file(text='a 1;\nb 2;\nc 3;\n')
+        with self.assertRaises(Exception) as ctx:
+            parser.parse_file(text='a 1;\nb ]')
+        self.assertIn('line 2', str(ctx.exception))
+
+
+class TestParser(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = OpenFoamParser()
+
+    def test_parse_dictionary(self):
+        tree = self.parser.parse_file(text='a 1;\nb\n{\n    c  hello;\n}\n')
+        self.assertIsInstance(tree, Node_C)
+        self.assertEqual([k.name for k in tree.get_data()], ['a'])
+        self.assertEqual(tree.get_child('b').get_data()[0].give_val(), 'c : hello')
+
+    def test_duplicate_key_overrides(self):
+        tree = self.parser.parse_file(text='a 1;\nb 2;\na 3;\n')
+        items = tree.get_ordered_items()
+        self.assertEqual([i.name for i in items], ['a', 'b'])
+        self.assertIsInstance(items[0], Key_C)
+        self.assertEqual(items[0].give_val(), 'a : 3')
+
+    def test_duplicate_key_in_large_dictionary(self):
+        body = '\n'.join(f'k{i} {i};' for i in range(3000))
+        tree = self.parser.parse_file(text=f'd\n{{\n{body}\nk7 seven;\n}}\n')
+        data = tree.get_child('d').get_data()
+        self.assertEqual(len(data), 3000)
+        self.assertEqual(data[7].give_val(), 'k7 : seven')
+        self.assertEqual(data[-1].name, 'k2999')
+
+
+class TestCompoundWords(unittest.TestCase):
+
+    def setUp(self):
+        self.lexer = OpenFoamParser()._parseInternalText.lexer.clone()
+
+    def tokens(self, text):
+        self.lexer.input(text)
+        return [(token.type, token.value) for token in self.lexer]
+
+    def test_nested_parentheses(self):
+        self.assertEqual(self.tokens('div(phi,grad(U)) Gauss linear;\nf expr(a + (b*c)/d);\n'),
+                         [('WORD', 'div(phi,grad(U))'), ('WORD', 'Gauss'), ('WORD', 'linear'), ('SEMICOLON', ';'),
+                          ('WORD', 'f'), ('WORD', 'expr(a + (b*c)/d)'), ('SEMICOLON', ';')])
+
+    def test_unbalanced_parenthesis(self):
+        with self.assertRaises(ParserError) as ctx:
+            self.tokens('abc 1;\nb grad(U')
+        self.assertEqual((ctx.exception.lineno, ctx.exception.column), (2, 3))
+
+    def test_invalid_character_ends_the_word(self):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            tokens = self.tokens('grad(U;')
+        self.assertEqual(tokens, [('WORD', 'grad'), ('LPAREN', '('), ('WORD', 'U'), ('SEMICOLON', ';')])
+        self.assertIn("Invalid character ';'", out.getvalue())
+
+
+class TestCountedNumericLists(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = OpenFoamParser()
+
+    def _values(self, tree, key):
+        return [v for _, v in tree.get_data()[[k.name for k in tree.get_data()].index(key)].get_items()]
+
+    def test_nonuniform_vector_field_is_array_backed(self):
+        tree = self.parser.parse_file(
+            text='internalField nonuniform List<vector> 3((1 0 0) (2.5 0 -1) (3 0 0));\n')
+        values = self._values(tree, 'internalField')
+        self.assertEqual([v.give_val() for v in values[:2]], ['nonuniform', 'List<vector>'])
+        lst = values[2]
+        self.assertIsInstance(lst, List_CP)
+        self.assertTrue(lst.is_array_backed())
+        self.assertEqual(lst.get_array().shape, (3, 3))
+        self.assertEqual(lst.size(), 3)
+        self.assertEqual(lst.give_val()[1], (2.5, 0.0, -1.0))
+
+    def test_scalar_and_counted_rows(self):
+        tree = self.parser.parse_file(text='s nonuniform List<scalar> 4(1 2 3 4);\nfaces 2(4(0 1 2 3) 4(4 5 6 7));\n')
+        scalars = self._values(tree, 's')[2]
+        self.assertEqual(scalars.get_array().dtype.kind, 'i')
+        self.assertEqual(scalars.give_val(), (1, 2, 3, 4))
+        faces = self._values(tree, 'faces')[0]
+        np.testing.assert_array_equal(faces.get_array(), [[0, 1, 2, 3], [4, 5, 6, 7]])
+        self.assertEqual(faces.get_array().dtype.kind, 'i')
+
+    def test_uneven_rows_fall_back(self):
+        for body in ('(1 2) (3 4 5))', '(1 2 3) 4 (5 6))', '(1 2 3) (4 5 6) (7 8 9))', '(1 (2) 3) (4 5 6))'):
+            self.assertIsNone(_scan_numeric_list(body, 0, 2), body)
+        values, end = _scan_numeric_list('(1 2 3) 3(4 5 6)) x', 0, 2)
+        np.testing.assert_array_equal(values, [[1, 2, 3], [4, 5, 6]])
+        self.assertEqual(end, 17)
+
+    def test_block_mesh_edges_are_not_counted_lists(self):
+        tree = self.parser.parse_file(text='edges\n(\n    arc 0 1 (1.1 0.0 0.5)\n);\n')
+        self.assertEqual(tree.get_data()[0].give_val(), "edges : ('arc', 0, 1, (1.1, 0.0, 0.5))")
+
+    def test_count_mismatch_falls_back(self):
+        tree = self.parser.parse_file(text='a 2 (1 2 3);\n')
+        self.assertFalse(any(isinstance(v, List_CP) for v in self._values(tree, 'a')))
+
+    def test_row_count_mismatch_falls_back(self):
+        for body in ('2(1 2 3) 3(4 5 6))', '2(1 2 3) 2(4 5 6))'):
+            self.assertIsNone(_scan_numeric_list(body, 0, 2), body)
+        with self.assertRaises(ParserError):
+            self.parser.parse_file(text='b 2(2(1 2 3) 3(4 5 6));\n')
+
+    def test_write_round_trip(self):
+        text = 'internalField nonuniform List<vector> 2((1 0 0) (2.5 0 -1));\n'
+        tree = self.parser.parse_file(text=text)
+        out = io.StringIO()
+        for item in tree.get_ordered_items():
+            write_out(item, out)
+        self.assertEqual(out.getvalue(),
+                         'internalField   nonuniform List<vector> 2\n(\n\t(1.0 0.0 0.0)\n\t(2.5 0.0 -1.0)\n);\n')
+        reparsed = self.parser.parse_file(text=out.getvalue())
+        np.testing.assert_array_equal(self._values(reparsed, 'internalField')[2].get_array(),
+                                      self._values(tree, 'internalField')[2].get_array())
+
+
+class TestParseCase(unittest.TestCase):
+
+    FILES = {
+        'system/controlDict': 'application simpleFoam;\nendTime 100;\n',
+        'system/fvSchemes': 'divSchemes\n{\n    div(phi,U) Gauss linear;\n}\n',
+        'constant/transportProperties': 'nu 1e-05;\n',
+        'processor1/0/U': 'internalField nonuniform List<vector> 2((1 0 0) (0 1 0));\n',
+        'processor0/0/U': 'internalField nonuniform List<vector> 1((0 0 1));\n',
+    }
+
+    def setUp(self):
+        self.parser = OpenFoamParser()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.case = os.path.join(self.tmp.name, 'cavity')
+        for rel, text in self.FILES.items():
+            file_path = os.path.join(self.case, rel)
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(file_path, 'w') as f:
+                f.write(text)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _dump(self, node):
+        out = io.StringIO()
+        write_out(node, out)
+        return out.getvalue()
+
+    def test_directory_order_is_sorted(self):
+        case = self.parser.parse_case(self.case)
+        self.assertEqual(case.name, 'cavity')
+        self.assertEqual([c.name for c in case.get_ordered_items()],
+                         ['constant', 'processor0', 'processor1', 'system'])
+        system = case.get_child('system')
+        self.assertEqual([c.name for c in system.get_ordered_items()], ['controlDict', 'fvSchemes'])
+
+    def test_workers_match_serial(self):
+        serial = self.parser.parse_case(self.case)
+        parallel = self.parser.parse_case(self.case, workers=2)
+        self.assertEqual(self._dump(parallel), self._dump(serial))
+        field = parallel.get_child('processor1').get_child('0').get_child('U').get_data()[0]
+        array = list(field.get_items())[-1][1].get_array()
+        np.testing.assert_array_equal(array, [[1, 0, 0], [0, 1, 0]])
+
+    def test_filtered_files_are_lazy(self):
+        case = self.parser.parse_case(self.case, include=['system/*'], exclude=['system/fvSchemes'])
+        system = case.get_child('system')
+        controlDict, fvSchemes = system.get_ordered_items()
+        self.assertNotIsInstance(controlDict, Lazy_Node_C)
+        self.assertIsInstance(fvSchemes, Lazy_Node_C)
+        self.assertFalse(fvSchemes.is_loaded())
+        transport = case.get_child('constant').get_child('transportProperties')
+        self.assertFalse(transport.is_loaded())
+
+        self.assertEqual(fvSchemes.get_child('divSchemes').get_data()[0].name, 'div(phi,U)')
+        self.assertTrue(fvSchemes.is_loaded())
+        self.assertEqual(fvSchemes.name, 'fvSchemes')
+        self.assertEqual(self._dump(case), self._dump(self.parser.parse_case(self.case)))
+
+    def test_max_depth(self):
+        case = self.parser.parse_case(self.case, max_depth=1)
+        self.assertEqual(case.get_child('processor0').children, ())
+        self.assertEqual(len(case.get_child('system').children), 2)
+        case = self.parser.parse_case(self.case, max_depth=0)
+        self.assertEqual(case.children, ())
+
+    def test_binary_file_is_not_parsed(self):
+        with open(os.path.join(self.case, 'constant', 'points'), 'wb') as f:
+            f.write(b'FoamFile\n{\n    format binary;\n}\n3(\x00\x00\x80?\x00\x00)\n')
+        case = self.parser.parse_case(self.case)
+        points = case.get_child('constant').get_child('points')
+        self.assertIsInstance(points, Lazy_Node_C)
+        with self.assertRaises(ParserError):
+            points.get_data()
+        self.assertFalse(points.is_loaded())
+
+
+if __name__ == '__main__':
+    unittest.main()
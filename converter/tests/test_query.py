@@ -0,0 +1,132 @@
+import gc
+import unittest
+
+from pyvnt import OpenFoamParser, Node_C, Key_C, Int_P, Lazy_Node_C, PathIndex, query, query_one, split_path
+from pyvnt.Container import changes
+
+
+TEXT = '''solvers
+{
+    p { solver PCG; tolerance 1e-06; }
+    "(U|k|epsilon)" { solver smoothSolver; }
+    "(U|k)Final" { solver PBiCG; }
+}
+relax { ".*" 1; p 0.3; }
+boundary ( inlet { type patch; } outlet { type wall; } );
+'''
+
+PATHS = ['solvers/p/solver', 'solvers.p.solver', 'solvers/k/solver', 'solvers/kFinal/solver', 'solvers/*/solver',
+         '"relax|solvers"/p', '**/solver', '**/p', 'relax/U', 'boundary/*/type', 'solvers/p/tolerance/value',
+         'solvers/missing', '**']
+
+
+def names(items):
+    return [item.name if hasattr(item, 'name') else item.give_val() for item in items]
+
+
+class TestQuery(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = OpenFoamParser().parse_file(text=TEXT)
+
+    def test_split_path(self):
+        self.assertEqual(split_path('a/b.c/d'), ('a', 'b.c', 'd'))
+        self.assertEqual(split_path('a.b.c'), ('a', 'b', 'c'))
+        self.assertEqual(split_path('a."(U|k).*".c'), ('a', '"(U|k).*"', 'c'))
+        self.assertEqual(split_path(('a/b', 'c')), ('a/b', 'c'))
+
+    def test_names_and_wildcards(self):
+        solver = query_one(self.tree, 'solvers/p/solver')
+        self.assertIs(solver, self.tree.get_child('solvers').get_child('p').get_key('solver'))
+        self.assertEqual(query(self.tree, 'solvers.p.solver'), [solver])
+        self.assertEqual(len(query(self.tree, 'solvers/*/solver')), 3)
+        self.assertEqual(names(query(self.tree, 'boundary/*/type')), ['type', 'type'])
+        self.assertEqual(names(query(self.tree, '"relax|solvers"/p')), ['p', 'p'])
+        self.assertEqual(names(query(self.tree, 'solvers/p/tolerance/value')), [1e-06])
+        self.assertIsNone(query_one(self.tree, 'solvers/missing'))
+
+    def test_regex_keys(self):
+        # the last regex key matching the name is used, where there is no key with the name
+        self.assertEqual(names(query(self.tree, 'solvers/k/solver/*')), ['smoothSolver'])
+        self.assertEqual(names(query(self.tree, 'solvers/kFinal/solver/*')), ['PBiCG'])
+        self.assertEqual(names(query(self.tree, 'relax/U')), ['.*'])
+        self.assertEqual(names(query(self.tree, 'relax/p')), ['p'])
+
+    def test_any_depth(self):
+        self.assertEqual(len(query(self.tree, '**/solver')), 3)
+        self.assertEqual(names(query(self.tree, '**'))[:4], ['solvers', 'p', 'solver', 'tolerance'])
+        self.assertEqual(names(query(self.tree, 'boundary/**/type/*')), ['patch', 'wall'])
+
+
+class TestPathIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = OpenFoamParser().parse_file(text=TEXT)
+        self.index = PathIndex(self.tree)
+
+    def assertMatchesQuery(self):
+        for path in PATHS:
+            self.assertEqual(self.index.query(path), query(self.tree, path), path)
+
+    def test_matches_query(self):
+        self.assertMatchesQuery()
+        self.assertEqual(len(self.index), len(query(self.tree, '**')))
+
+    def test_changes(self):
+        solvers = self.tree.get_child('solvers')
+        p = solvers.get_child('p')
+        relax_entry = self.index._items[('relax', 'p')]
+
+        p.add_data(Key_C('maxIter', Int_P('value', 5)))
+        self.assertEqual(names(self.index.query('solvers/p/maxIter')), ['maxIter'])
+        p.name = 'pFinal'
+        self.assertEqual(self.index.query('solvers/p/solver'), [])
+        self.assertEqual(len(self.index.query('solvers/pFinal/*')), 3)
+        Node_C('T', solvers).add_data(Key_C('solver', Int_P('value', 1)))
+        self.assertEqual(len(self.index.query('solvers/*/solver')), 4)
+        p.remove_data(p.get_key('maxIter'))
+        query_one(self.tree, 'boundary/inlet').parent = None
+        self.assertMatchesQuery()
+        # only the changed part of the tree was indexed again
+        self.assertIs(self.index._items[('relax', 'p')], relax_entry)
+
+    def test_key_values_and_renamed_lists(self):
+        tolerance = query_one(self.tree, 'solvers/p/tolerance')
+        self.assertEqual(len(self.index.query('solvers/p/tolerance/*')), 1)
+        tolerance.replace_val(tolerance.get_keys()[0], Int_P('value', 2))
+        self.assertEqual(self.index.query('solvers/p/tolerance/*'), query(self.tree, 'solvers/p/tolerance/*'))
+        self.assertEqual(self.index.query_one('solvers/p/tolerance/value').give_val(), 2)
+
+        boundary = self.tree.get_child('boundary')
+        self.assertEqual(len(self.index.query('boundary/inlet/type')), 1)
+        boundary.name = 'patches'
+        self.assertEqual(self.index.query('boundary/inlet/type'), [])
+        self.assertEqual(self.index.query('patches/inlet/type'), query(self.tree, 'patches/inlet/type'))
+        self.assertMatchesQuery()
+
+    def test_lazy_nodes(self):
+        loads = []
+        def loader():
+            loads.append(1)
+            node = Node_C('inner')
+            node.add_data(Key_C('a', Int_P('value', 1)))
+            return node
+        Lazy_Node_C('lazy', loader, self.tree)
+        index = PathIndex(self.tree)
+        self.assertEqual(loads, [])
+        self.assertEqual(names(index.query('lazy/a')), ['a'])
+        self.assertEqual(loads, [1])
+        # the loaded node is indexed at the next query
+        self.assertEqual(index.query('lazy/a'), query(self.tree, 'lazy/a'))
+        self.assertIn(('lazy', 'a'), index._items)
+
+    def test_collected_index_stops_watching(self):
+        index = PathIndex(self.tree)
+        self.assertTrue(any(ref() is index for ref in changes.watchers))
+        del index, self.index
+        gc.collect()
+        self.assertTrue(all(ref() is not None for ref in changes.watchers))
+
+
+if __name__ == '__main__':
+    unittest.main()
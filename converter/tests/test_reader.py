@@ -0,0 +1,236 @@
+import ctypes
+import io
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from pyvnt import OpenFoamParser, Key_C, Int_P, write_out
+from pyvnt.Converter.Reader import read, backends, _createTree
+from pyvnt.Converter.Reader.exceptions import InvalidDictionaryFileError, ReaderBackendUnavailableError, ValueBufferError
+
+
+TEXT = 'a 1;\nb\n{\n    c 2.5;\n    d (1 2 3);\n}\ne uniform (0 0 1);\n'
+
+
+class TestReaderBackends(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'controlDict')
+        with open(self.path, 'w') as f:
+            f.write(TEXT)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def render(self, obj):
+        out = io.StringIO()
+        write_out(obj, out)
+        return out.getvalue()
+
+    def test_falls_back_to_ply_without_libraries(self):
+        with mock.patch.object(backends, '_cppError', 'cannot open shared object file'):
+            self.assertEqual(backends.selectBackend(), backends.PLY)
+            with self.assertRaises(ReaderBackendUnavailableError):
+                read(self.path, backend=backends.CPP)
+            tree = read(self.path)
+        self.assertEqual(tree.name, 'controlDict')
+        expected = OpenFoamParser().parse_file(text=TEXT)
+        expected.name = 'controlDict'
+        self.assertEqual(self.render(tree), self.render(expected))
+
+    def test_falls_back_to_ply_with_stale_libraries(self):
+        class StaleLib:
+            # built before the other symbols were added
+            openDictionaryFile = mock.Mock()
+
+        modules = {name: module for name, module in sys.modules.items() if not name.endswith('Reader.sharedLibs')}
+        with mock.patch.object(backends, '_cppError', None), mock.patch.dict(sys.modules, modules, clear=True), \
+                mock.patch('ctypes.CDLL', return_value=StaleLib()):
+            self.assertFalse(backends.isCppBackendAvailable())
+            self.assertEqual(backends.selectBackend(), backends.PLY)
+            tree = read(self.path)
+        self.assertEqual(tree.get_key('a').give_val(), 'a : 1')
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            read(self.path, backend='fortran')
+
+    def test_ply_errors(self):
+        with self.assertRaises(FileNotFoundError):
+            read(os.path.join(self.tmp.name, 'missing'), backend=backends.PLY)
+        with open(self.path, 'w') as f:
+            f.write('a { b 1;\n')
+        with self.assertRaises(InvalidDictionaryFileError):
+            read(self.path, backend=backends.PLY)
+
+
+class _ListIterator:
+    '''
+    Stand-in for DictionaryFileIterator over nested (keyword, value) lists,
+    where a list value is a sub-dictionary.
+    '''
+
+    def __init__(self, entries):
+        self.levels = [[entries, 0]]
+
+    def current(self):
+        entries, pos = self.levels[-1]
+        return entries[pos]
+
+    def hasEntry(self):
+        entries, pos = self.levels[-1]
+        return pos < len(entries)
+
+    def step(self):
+        self.levels[-1][1] += 1
+
+    def stepIn(self):
+        self.levels.append([self.current()[1], 0])
+
+    def stepOut(self):
+        self.levels.pop()
+
+    def getCurrentEntryKeyword(self):
+        return self.current()[0]
+
+    def isCurrentEntryDict(self):
+        return isinstance(self.current()[1], list)
+
+    def getKeyData(self):
+        key, val = self.current()
+        return Key_C(key, Int_P('val1', val))
+
+
+class TestCreateTree(unittest.TestCase):
+
+    def test_entry_order_is_preserved(self):
+        entries = [('a', 1), ('sub', [('b', 2), ('inner', [('c', 3)]), ('d', 4)]), ('e', 5), ('empty', [])]
+        root = _createTree('root', _ListIterator(entries))
+        self.assertEqual([item.name for item in root.get_ordered_items()], ['a', 'sub', 'e', 'empty'])
+        sub = root.get_child('sub')
+        self.assertEqual([item.name for item in sub.get_ordered_items()], ['b', 'inner', 'd'])
+        self.assertEqual(sub.get_child('inner').data[0].name, 'c')
+
+    def test_deep_nesting(self):
+        entries = [('leaf', 1)]
+        for i in range(1500):
+            entries = [(f'level{i}', entries)]
+        node = _createTree('root', _ListIterator(entries))
+        depth = 0
+        while node.children:
+            node = node.children[0]
+            depth += 1
+        self.assertEqual(depth, 1500)
+        self.assertEqual(node.data[0].name, 'leaf')
+
+
+# value uniform (1 2.5 3) [0 2 -1 0 0 0 0], 1e-05 0.5 linear; as (ValueType value, token) pairs
+TOKENS = [(0, 'uniform'), (5, '('), (1, 1), (3, 2.5), (1, 3), (5, ')'),
+          (5, '['), *((1, v) for v in (0, 2, -1, 0, 0, 0, 0)), (5, ']'), (5, ','),
+          (4, 1e-05), (2, 0.5), (0, 'linear')]
+
+
+class _EntryLib:
+    '''
+    Stand-in for DictionaryFileIteratorLib over a single entry, filling the
+    buffers given to getCurrentEntryValues like the library does.
+    '''
+
+    def __init__(self, tokens, stringSize=None):
+        self.tokens = tokens
+        needed = sum(len(val) for valType, val in tokens if valType in (0, 5))
+        self.stringSize = needed if stringSize is None else stringSize
+
+    def createIterator(self, filePtr):
+        return 1
+
+    def hasEntry(self, ptr):
+        return True
+
+    def isCurrentEntryDict(self, ptr):
+        return False
+
+    def getCurrentEntryKeyword(self, ptr):
+        return b'value'
+
+    def getCurrentEntryValueCount(self, ptr):
+        return len(self.tokens)
+
+    def getCurrentEntryStringSize(self, ptr):
+        return self.stringSize
+
+    def getCurrentEntryValues(self, ptr, types, labels, scalars, offsets, strings, capacity, stringCapacity):
+        def view(address, ctype, size):
+            return np.ctypeslib.as_array(ctypes.cast(address, ctypes.POINTER(ctype)), (size,))
+        types, labels, scalars = view(types, ctypes.c_int32, capacity), view(labels, ctypes.c_int64, capacity), \
+            view(scalars, ctypes.c_double, capacity)
+        offsets, strings = view(offsets, ctypes.c_int32, capacity + 1), view(strings, ctypes.c_uint8, stringCapacity)
+        offset = offsets[0] = 0
+        for index, (valType, val) in enumerate(self.tokens):
+            types[index] = valType
+            if valType in (0, 5):
+                if offset + len(val) > stringCapacity:
+                    return -1
+                strings[offset:offset + len(val)] = np.frombuffer(val.encode(), np.uint8)
+                offset += len(val)
+            elif valType == 1:
+                labels[index] = val
+            else:
+                scalars[index] = val
+            offsets[index + 1] = offset
+        return len(self.tokens)
+
+
+class _OpenFile:
+    filepath = 'controlDict'
+
+    def isOpen(self):
+        return True
+
+    def getFilePointer(self):
+        return 1
+
+
+class TestDictionaryFileIterator(unittest.TestCase):
+
+    def iterator(self, lib):
+        # the compiled libraries are replaced by the stub for the import of the iterator
+        sharedLibs = mock.Mock(DictionaryFileIteratorLib=lib)
+        modules = {name: module for name, module in sys.modules.items()
+                   if not name.endswith(('Reader.dictionaryFileIterator', 'Reader.dictionaryFile', 'Reader.fileUtils'))}
+        modules['pyvnt.Converter.Reader.sharedLibs'] = sharedLibs
+        with mock.patch.dict(sys.modules, modules, clear=True):
+            from pyvnt.Converter.Reader.dictionaryFileIterator import DictionaryFileIterator
+        return DictionaryFileIterator(_OpenFile())
+
+    def test_values_of_an_entry(self):
+        itr = self.iterator(_EntryLib(TOKENS))
+        arrays = itr.getValueArrays()
+        self.assertEqual(arrays.types.tolist(), [t for t, _ in TOKENS])
+        self.assertEqual(arrays.strings.tobytes(), b'uniform()[],linear')
+        self.assertEqual(arrays.stringOffsets[-2:].tolist(), [12, 18])
+
+        values = itr.getValues()
+        self.assertEqual([type(val).__name__ for val in values], ['Enm_P', 'List_CP', 'Dim_Set_P', 'Flt_P', 'Flt_P', 'Enm_P'])
+        self.assertEqual(values[0].give_val(), 'uniform')
+        self.assertEqual(values[1].give_val(), (1, 2.5, 3))
+        self.assertEqual([val.give_val() for val in values[2].give_val()], [0, 2, -1, 0, 0, 0, 0])
+        self.assertEqual([val.give_val() for val in values[3:]], [1e-05, 0.5, 'linear'])
+        self.assertEqual(itr.getKeyData().name, 'value')
+
+    def test_empty_entry(self):
+        self.assertEqual(self.iterator(_EntryLib([])).getValues(), [])
+
+    def test_small_buffers(self):
+        itr = self.iterator(_EntryLib(TOKENS, stringSize=4))
+        with self.assertRaises(ValueBufferError):
+            itr.getValues()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,180 @@
+import os
+import tempfile
+import unittest
+
+from pyvnt import OpenFoamParser, SourceTree, Key_C, Node_C, Int_P, Enm_P, patch_file, query_one
+from pyvnt.Reference.error_classes import ParserError
+
+from test_lazy_parse import TEXT, render
+
+
+class TestSourceTree(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = OpenFoamParser()
+        self.tree = SourceTree(TEXT, self.parser)
+
+    def replace(self, old: str, new: str):
+        start = self.tree.text.index(old)
+        return self.tree.edit(start, start + len(old), new)
+
+    def assertParsed(self):
+        self.assertTrue(self.tree.is_valid())
+        self.assertEqual(render(self.tree.root), render(self.parser.parse_file(text=self.tree.text)))
+
+    def test_same_tree_as_parse_file(self):
+        self.assertParsed()
+        key = query_one(self.tree.root, 'div(phi,U)')
+        self.assertEqual(self.tree.text[slice(*self.tree.span(key))], 'div(phi,U) Gauss linear;')
+
+    def test_key_edit_keeps_the_objects(self):
+        inlet = query_one(self.tree.root, 'boundaryField/inlet')
+        key = inlet.get_key('type')
+        outlet = query_one(self.tree.root, 'boundaryField/outlet')
+        self.assertIs(self.replace('fixedValue', 'totalPressure'), key)
+        self.assertParsed()
+        self.assertIs(query_one(self.tree.root, 'boundaryField/inlet/type'), key)
+        self.assertIs(query_one(self.tree.root, 'boundaryField/outlet'), outlet)
+        self.assertEqual(self.tree.text[slice(*self.tree.span(key))], 'type totalPressure;')
+        # entries after the edit are moved by the change of length
+        div = query_one(self.tree.root, 'div(phi,U)')
+        self.assertEqual(self.tree.text[slice(*self.tree.span(div))], 'div(phi,U) Gauss linear;')
+
+    def test_new_entries_reparse_the_dictionary(self):
+        inlet = query_one(self.tree.root, 'boundaryField/inlet')
+        boundary = self.tree.root.get_child('boundaryField')
+        self.assertIs(self.replace('outlet { type zeroGradient; }', 'side { type wall; }\n    outlet { type fixedValue; }'), boundary)
+        self.assertParsed()
+        self.assertIs(query_one(self.tree.root, 'boundaryField/inlet'), inlet)
+        self.assertEqual([child.name for child in boundary.children], ['inlet', '(wall|top)', 'side', 'outlet'])
+
+        self.replace('blocks (', 'vertices ((0 0 0));\nblocks (')
+        self.assertParsed()
+        self.assertIs(self.tree.root.get_child('boundaryField'), boundary)
+
+    def test_lists_of_dictionaries(self):
+        boundary = self.tree.root.get_child('boundary')
+        self.assertIs(self.replace('type wall;', 'type symmetry;'), boundary)
+        self.assertParsed()
+        self.assertEqual(query_one(self.tree.root, 'boundary/outlet/type').give_val(), 'type : symmetry')
+
+    def test_syntax_errors(self):
+        key = self.tree.root.get_key('dimensions')
+        start = self.tree.text.index('}\nblocks')
+        with self.assertRaises(ParserError):
+            self.tree.edit(start, start + 1, '')
+        self.assertFalse(self.tree.is_valid())
+        self.assertIs(self.tree.root.get_key('dimensions'), key)
+        with self.assertRaises(KeyError):
+            self.tree.span(key)
+
+        self.tree.edit(start, start, '}')
+        self.assertParsed()
+        self.assertIs(self.tree.root.get_key('dimensions'), key)
+        self.assertEqual(self.tree.text, TEXT)
+
+    def test_bad_spans(self):
+        with self.assertRaises(ValueError):
+            self.tree.edit(10, 5, '')
+        with self.assertRaises(ValueError):
+            self.tree.edit(0, len(TEXT) + 1, '')
+
+
+def word(name: str) -> Enm_P:
+    return Enm_P(name, {name}, name)
+
+
+class TestPatchFile(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = OpenFoamParser()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'U')
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('// vitesse initiale, \u00e9t\u00e9\n' + TEXT)
+        self.tree = SourceTree(parser=self.parser, path=self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def read(self) -> str:
+        with open(self.path, encoding='utf-8') as f:
+            return f.read()
+
+    def assertPatched(self):
+        text = self.read()
+        self.assertEqual(text, self.tree.text)
+        self.assertFalse(self.tree.is_changed())
+        self.assertEqual(render(self.tree.root), render(self.parser.parse_file(text=text)))
+        self.assertIn('// a comment with a ; and a }', text)
+        self.assertIn('/* walls; } */', text)
+
+    def test_keys_are_written_in_place(self):
+        size = os.path.getsize(self.path)
+        key = self.tree.root.get_key('div(phi,U)')
+        key.replace_val('linear', word('upwind'))
+        self.assertTrue(self.tree.is_changed())
+        self.assertEqual(patch_file(self.tree), len('div(phi,U) Gauss upwind;'))
+        self.assertPatched()
+        self.assertEqual(os.path.getsize(self.path), size)
+        self.assertEqual(self.tree.text[slice(*self.tree.span(key))], 'div(phi,U) Gauss upwind;')
+
+        # a shorter key is padded with spaces, a longer one rewrites the file from there on
+        query_one(self.tree.root, 'boundaryField/inlet/type').replace_val('fixedValue', word('wall'))
+        self.assertEqual(patch_file(self.tree), len('type fixedValue;'))
+        self.assertPatched()
+        self.assertEqual(os.path.getsize(self.path), size)
+        query_one(self.tree.root, 'boundaryField/outlet/type').replace_val('zeroGradient', word('inletOutlet'))
+        self.assertGreater(patch_file(self.tree), len('type inletOutlet;'))
+        self.assertPatched()
+
+    def test_added_removed_and_renamed_items(self):
+        boundary = self.tree.root.get_child('boundaryField')
+        boundary.get_child('inlet').add_data(Key_C('gradient', Int_P('gradient', 3)))
+        boundary.get_child('outlet').parent = None
+        boundary.get_child('inlet').name = 'inflow'
+        side = Node_C('side')
+        side.add_data(Key_C('type', word('wall')))
+        side.parent = boundary
+        self.tree.root.remove_data(self.tree.root.get_key('dimensions'))
+        self.tree.root.add_data(Key_C('endTime', Int_P('endTime', 100)))
+        patch_file(self.tree)
+        self.assertPatched()
+        self.assertEqual([child.name for child in boundary.children], ['inflow', '(wall|top)', 'side'])
+
+        # the written items are parsed from the file like the others
+        key = self.tree.root.get_key('endTime')
+        start, end = self.tree.span(key)
+        self.tree.edit(start, end, 'endTime 200;')
+        self.assertEqual(key.give_val(), 'endTime : 200')
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(self.tree.text) # edit changes the text, not the file
+        self.tree.root.set_order([item.name for item in reversed(self.tree.root.get_ordered_items())])
+        patch_file(self.tree)
+        self.assertEqual(render(self.tree.root), render(self.parser.parse_file(text=self.read())))
+
+    def test_lists_of_dictionaries(self):
+        query_one(self.tree.root, 'boundary/inlet/type').replace_val('patch', word('wall'))
+        patch_file(self.tree)
+        self.assertPatched()
+        self.assertIn('type            wall;', self.read())
+
+    def test_unchanged_trees(self):
+        other = self.parser.parse_file(text=TEXT)
+        other.get_key('a').replace_val('a', Int_P('a', 5))
+        self.assertFalse(self.tree.is_changed())
+        self.assertEqual(patch_file(self.tree), 0)
+        self.assertEqual(self.read(), self.tree.text)
+
+    def test_errors(self):
+        self.tree.root.get_key('a').replace_val('a', Int_P('a', 5))
+        with open(self.path, 'a') as f:
+            f.write('b 1;\n')
+        with self.assertRaises(ValueError):
+            patch_file(self.tree)
+        with self.assertRaises(ValueError):
+            patch_file(SourceTree(TEXT, self.parser))
+
+
+if __name__ == '__main__':
+    unittest.main()
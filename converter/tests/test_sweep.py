@@ -0,0 +1,145 @@
+import filecmp
+import os
+import tempfile
+import unittest
+
+from pyvnt import OpenFoamParser, Flt_P, Int_P, PathIndex, SourceTree, grid_points, make_variant, patch_file, \
+    set_value, sweep_case, write_case, writeTo
+
+
+FILES = {
+    'system/controlDict': 'FoamFile { version 2.0; }\napplication simpleFoam;\nendTime 100;\n',
+    'system/fvSchemes': 'divSchemes\n{\n    div(phi,U) Gauss linear;\n}\n',
+    'constant/transportProperties': 'nu [0 2 -1 0 0 0 0] 1e-05;\n',
+}
+
+GRID = {
+    'system/controlDict/endTime': [200, 300],
+    'constant/transportProperties/nu': [1e-4, 2e-4, 3e-4],
+}
+
+
+def read(path):
+    with open(path) as f:
+        return f.read()
+
+
+class TestSweep(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.case = os.path.join(self.tmp.name, 'cavity')
+        for rel, text in FILES.items():
+            file_path = os.path.join(self.case, rel)
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(file_path, 'w') as f:
+                f.write(text)
+        self.base = OpenFoamParser().parse_case(self.case, exclude=['system/fvSchemes'])
+        self.out = os.path.join(self.tmp.name, 'out')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def values(self, tree, *path):
+        node = tree
+        for name in path[:-1]:
+            node = node.get_child(name)
+        return [val.give_val() for _, val in node.get_key(path[-1]).get_items()]
+
+    def test_grid_points(self):
+        points = list(grid_points(GRID))
+        self.assertEqual(len(points), 6)
+        self.assertEqual(points[1], {'system/controlDict/endTime': 200, 'constant/transportProperties/nu': 2e-4})
+
+    def test_make_variant(self):
+        variant = make_variant(self.base, {'system/controlDict/endTime': 50,
+                                           ('system', 'controlDict', 'application'): 'pisoFoam',
+                                           'constant/transportProperties/nu': Flt_P('value', 0.5)})
+        self.assertEqual(self.values(variant, 'system', 'controlDict', 'endTime'), [50])
+        self.assertEqual(self.values(variant, 'system', 'controlDict', 'application'), ['pisoFoam'])
+        nu = self.values(variant, 'constant', 'transportProperties', 'nu')
+        self.assertEqual(nu[-1], 0.5)
+        self.assertEqual(len(nu), 2) # the dimensions are kept
+        self.assertEqual(self.values(self.base, 'system', 'controlDict', 'endTime'), [100])
+
+    def test_set_all_values(self):
+        variant = make_variant(self.base, {})
+        set_value(variant, 'system/fvSchemes/divSchemes/div(phi,U)', ('Gauss', 'upwind'))
+        self.assertEqual(self.values(variant, 'system', 'fvSchemes', 'divSchemes', 'div(phi,U)'), ['Gauss', 'upwind'])
+        variant = make_variant(self.base, {'system/controlDict/endTime': [4, 5, 6],
+                                           'constant/transportProperties/nu': [2.0, 3.0]})
+        self.assertEqual(self.values(variant, 'system', 'controlDict', 'endTime'), [4, 5, 6])
+        self.assertEqual(self.values(variant, 'constant', 'transportProperties', 'nu'), [2.0, 3.0])
+        # the values given are named by position in copies, and can be given to other variants
+        value = Int_P('value', 7)
+        set_value(variant, 'system/controlDict/endTime', [value, value])
+        self.assertEqual(self.values(variant, 'system', 'controlDict', 'endTime'), [7, 7])
+        self.assertEqual(value._Value_P__name, 'value')
+        with self.assertRaises(KeyError):
+            set_value(variant, 'system/controlDict/deltaT', 1)
+        with self.assertRaises(KeyError):
+            set_value(variant, 'system/missing/deltaT', 1)
+
+    def test_set_values_of_watched_trees(self):
+        path = os.path.join(self.case, 'system', 'controlDict')
+        tree = SourceTree(parser=OpenFoamParser(), path=path)
+        index = PathIndex(tree.root)
+        self.assertEqual([val.give_val() for val in index.query('endTime/*')], [100])
+        set_value(tree.root, 'endTime', [4, 5])
+        self.assertEqual([val.give_val() for val in index.query('endTime/*')], [4, 5])
+        set_value(tree.root, 'application', ['pisoFoam'])
+        self.assertEqual([val.give_val() for val in index.query('application/*')], ['pisoFoam'])
+        self.assertTrue(tree.is_changed())
+        self.assertGreater(patch_file(tree), 0)
+        text = read(path)
+        self.assertIn('application pisoFoam;', text)
+        self.assertIn('endTime 4 5;', text)
+
+    def test_write_case(self):
+        case_path = write_case(self.base, self.out)
+        self.assertEqual(case_path, os.path.join(self.out, 'cavity'))
+        # files that were not parsed are copied as they are
+        fvSchemes = os.path.join('system', 'fvSchemes')
+        self.assertEqual(read(os.path.join(case_path, fvSchemes)), FILES['system/fvSchemes'])
+        self.assertFalse(self.base.get_child('system').get_child('fvSchemes').is_loaded())
+
+        reread = OpenFoamParser().parse_case(case_path)
+        self.assertEqual(self.values(reread, 'system', 'controlDict', 'endTime'), [100])
+        self.assertEqual(self.values(reread, 'constant', 'transportProperties', 'nu')[-1], 1e-05)
+
+    def test_sweep_case(self):
+        cases = sweep_case(self.base, GRID, self.out)
+        self.assertEqual([os.path.basename(path) for path, _ in cases], [f'cavity_{i}' for i in range(6)])
+        parser = OpenFoamParser()
+        for case_path, params in cases:
+            case = parser.parse_case(case_path)
+            self.assertEqual(self.values(case, 'system', 'controlDict', 'endTime'),
+                             [params['system/controlDict/endTime']])
+            self.assertEqual(self.values(case, 'constant', 'transportProperties', 'nu')[-1],
+                             params['constant/transportProperties/nu'])
+            self.assertEqual(read(os.path.join(case_path, 'system', 'fvSchemes')), FILES['system/fvSchemes'])
+
+    def test_unedited_files_are_reused(self):
+        cases = sweep_case(self.base, {'system/controlDict/endTime': [1, 2]}, self.out, name='run{index:02d}')
+        self.assertEqual([os.path.basename(path) for path, _ in cases], ['run00', 'run01'])
+        transport = [os.path.join(path, 'constant', 'transportProperties') for path, _ in cases]
+        self.assertEqual(read(transport[0]), read(transport[1]))
+        self.assertIn('1e-05', read(transport[0]))
+
+    def test_workers_match_serial(self):
+        serial = sweep_case(self.base, GRID, os.path.join(self.out, 'serial'))
+        parallel = sweep_case(self.base, GRID, os.path.join(self.out, 'parallel'), workers=2, max_pending=1)
+        self.assertEqual([params for _, params in parallel], [params for _, params in serial])
+        comparison = filecmp.dircmp(os.path.join(self.out, 'serial'), os.path.join(self.out, 'parallel'))
+        self.assertEqual(sorted(comparison.common_dirs), [f'cavity_{i}' for i in range(6)])
+        for (serial_path, _), (parallel_path, _) in zip(serial, parallel):
+            for rel in FILES:
+                self.assertEqual(read(os.path.join(parallel_path, rel)), read(os.path.join(serial_path, rel)))
+
+    def test_write_to_joins_paths(self):
+        writeTo(self.base.get_child('system').get_child('controlDict'), self.tmp.name)
+        self.assertTrue(os.path.isfile(os.path.join(self.tmp.name, 'controlDict.txt')))
+
+
+if __name__ == '__main__':
+    unittest.main()
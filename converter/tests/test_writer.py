@@ -0,0 +1,47 @@
+import io
+import unittest
+
+from pyvnt import OpenFoamParser, Node_C, Key_C, List_CP, Int_P, Flt_P, Enm_P, Vector_P, write_out
+from pyvnt.Converter.Writer import writer
+
+
+class TestTextWriter(unittest.TestCase):
+
+    def render(self, obj, indent=0):
+        out = io.StringIO()
+        write_out(obj, out, indent)
+        return out.getvalue()
+
+    def test_key_columns(self):
+        key = Key_C('div(phi,U)', Enm_P('scheme', {'Gauss'}, 'Gauss'), Enm_P('interp', {'linear'}, 'linear'))
+        self.assertEqual(self.render(key, 1), '\tdiv(phi,U)      Gauss linear;\n')
+        key = Key_C('aVeryLongKeywordName', Flt_P('v', 0.5))
+        self.assertEqual(self.render(key), 'aVeryLongKeywordName 0.5;\n')
+
+    def test_nested_dictionary_and_lists(self):
+        text = 'a\n{\n    b 1;\n    c ( hex (0 1 2 3 4 5 6 7) (1 1 1) simpleGrading (1 1 1) );\n    d (1 2 3);\n}\n'
+        tree = OpenFoamParser().parse_file(text=text)
+        self.assertEqual(self.render(tree.get_child('a')),
+                         'a\n{\n'
+                         '\tb               1;\n\n'
+                         '\tc\n\t(\n\t\thex ( 0 1 2 3 4 5 6 7 ) ( 1 1 1 ) simpleGrading ( 1 1 1 ) \n\t);\n\n'
+                         '\td               (1 2 3);\n\n'
+                         '}\n')
+
+    def test_large_output_is_flushed_in_blocks(self):
+        node = Node_C('big')
+        for i in range(3 * writer._FLUSH_CHUNKS):
+            node.add_data(Key_C(f'k{i}', Int_P('v', i % 100)))
+        writes = []
+
+        class Recorder:
+            def write(self, text):
+                writes.append(text)
+
+        write_out(node, Recorder())
+        self.assertLess(len(writes), writer._FLUSH_CHUNKS // 100)
+        self.assertEqual(''.join(writes), self.render(node))
+
+
+if __name__ == '__main__':
+    unittest.main()